@@ -0,0 +1,207 @@
+"""Per-user caches invalidated by bumping a generation counter."""
+
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from core.sharding import get_active_shard
+
+P = ParamSpec('P')
+R = TypeVar('R')
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_GENERATION_KEY = 'generation:all'
+METRIC_OUTCOMES = ('hits', 'misses')
+
+
+def _metric_key(namespace: str, outcome: str) -> str:
+    """Cache key of a hit or miss counter."""
+    return f'metrics:cache:{namespace}:{outcome}'
+
+
+def increment_counter(key: str) -> None:
+    """Add one to a counter, starting it if it does not exist yet."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+class CacheMetrics:
+    """Counters of cache hits and misses per namespace.
+
+    The counters are stored in the cache itself, so with a backend that
+    processes share, e.g. the database cache, every web worker adds to
+    the same numbers and ``manage.py cache_stats`` reports them. Like
+    the generation counters they may be evicted, and the database and
+    file backends may lose concurrent increments.
+
+    Attributes:
+        namespaces: Namespaces registered by the caches of this process
+
+    """
+
+    def __init__(self) -> None:
+        self.namespaces: set[str] = set()
+
+    def register(self, namespace: str) -> None:
+        """Report ``namespace`` in snapshots, even before it is used."""
+        self.namespaces.add(namespace)
+
+    def record_hit(self, namespace: str) -> None:
+        """Count one hit in ``namespace``."""
+        increment_counter(_metric_key(namespace, 'hits'))
+
+    def record_miss(self, namespace: str) -> None:
+        """Count one miss in ``namespace``."""
+        increment_counter(_metric_key(namespace, 'misses'))
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Return the counts of the namespaces used so far."""
+        keys = {
+            (namespace, outcome): _metric_key(namespace, outcome)
+            for namespace in self.namespaces
+            for outcome in METRIC_OUTCOMES
+        }
+        counts = cache.get_many(keys.values())
+        return {
+            namespace: {
+                outcome: counts.get(keys[namespace, outcome], 0)
+                for outcome in METRIC_OUTCOMES
+            }
+            for namespace in sorted(self.namespaces)
+            if any(
+                keys[namespace, outcome] in counts
+                for outcome in METRIC_OUTCOMES
+            )
+        }
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        cache.delete_many([
+            _metric_key(namespace, outcome)
+            for namespace in self.namespaces
+            for outcome in METRIC_OUTCOMES
+        ])
+
+
+cache_metrics = CacheMetrics()
+
+
+def _user_generation_key(user_id: Any) -> str:
+    """Cache key of a user's generation counter."""
+    return f'generation:user:{user_id}'
+
+
+def _bump(key: str) -> None:
+    """Advance a generation counter, starting a new one if it is gone."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def get_generation(user_id: Any) -> str:
+    """Current generation of a user's cached data.
+
+    Combines the user's counter with the global one, read in a single
+    cache round trip. A missing counter, e.g. one that was evicted,
+    starts at the current time in nanoseconds rather than at zero, so it
+    does not run into generations that were used before.
+    """
+    user_key = _user_generation_key(user_id)
+    generations = cache.get_many([GLOBAL_GENERATION_KEY, user_key])
+    for key in (GLOBAL_GENERATION_KEY, user_key):
+        if key not in generations:
+            cache.add(key, time.time_ns(), None)
+            generations[key] = cache.get(key)
+    return f'{generations[GLOBAL_GENERATION_KEY]}.{generations[user_key]}'
+
+
+def invalidate_user(user_id: Any) -> None:
+    """Invalidate everything cached for a user once their write is visible.
+
+    The counter is bumped when the current transaction on the active
+    shard commits, or right away outside of one.
+    """
+    transaction.on_commit(
+        functools.partial(_bump, _user_generation_key(user_id)),
+        using=get_active_shard() or DEFAULT_DB_ALIAS
+    )
+
+
+def invalidate_all() -> None:
+    """Invalidate the cached data of every user at once."""
+    transaction.on_commit(
+        functools.partial(_bump, GLOBAL_GENERATION_KEY),
+        using=get_active_shard() or DEFAULT_DB_ALIAS
+    )
+
+
+def invalidates_user_cache(func: Callable[P, R]) -> Callable[P, R]:
+    """Invalidate the caches of a write method's ``user`` when it returns.
+
+    Must be wrapped by ``owner_shard`` and wrap ``write_transaction``,
+    so that the bump waits for the transaction on the user's shard.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        result = func(*args, **kwargs)
+        invalidate_user(signature.bind(*args, **kwargs).arguments['user'].pk)
+        return result
+
+    return wrapper
+
+
+class GenerationCache:
+    """Cache of per-user data that is dropped when the user writes.
+
+    Entries are keyed by the user's generation, so bumping it makes
+    every entry of the user unreachable in O(1) without finding or
+    deleting keys; the stale entries expire with ``timeout``. Works with
+    any cache backend; the database and file backends do not increment
+    atomically, so concurrent bumps may be merged into one.
+
+    Attributes:
+        namespace: Prefix of the keys, also used for the metrics
+        timeout: Seconds an entry is kept
+
+    """
+
+    def __init__(self, namespace: str, timeout: int) -> None:
+        self.namespace = namespace
+        self.timeout = timeout
+        cache_metrics.register(namespace)
+
+    def get_or_set(
+            self,
+            user_id: Any,
+            key: str,
+            default: Callable[[], T]
+    ) -> T:
+        """Get the user's entry for ``key``, computing it on a miss."""
+        cache_key = (
+            f'{self.namespace}:{user_id}:{get_generation(user_id)}:{key}'
+        )
+        value = cache.get(cache_key)
+        if value is not None:
+            cache_metrics.record_hit(self.namespace)
+            logger.debug('%s cache hit for user %s', self.namespace, user_id)
+            return value  # type: ignore[no-any-return]
+
+        cache_metrics.record_miss(self.namespace)
+        logger.debug('%s cache miss for user %s', self.namespace, user_id)
+        value = default()
+        cache.set(cache_key, value, self.timeout)
+        return value
@@ -0,0 +1,59 @@
+from collections.abc import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from core.routers import read_state
+from core.unit_of_work import unit_of_work
+
+
+class UnitOfWorkMiddleware:
+    """Run each request inside its own identity map and unit of work.
+
+    Objects loaded through repositories are fetched at most once per
+    request, until a write transaction ends. Field updates are written
+    by the repository's write transaction, before the response is
+    built.
+    """
+
+    def __init__(
+            self,
+            get_response: Callable[[HttpRequest], HttpResponse]
+    ) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Process the request within a fresh unit of work."""
+        with unit_of_work():
+            return self.get_response(request)
+
+
+class ReplicaStickinessMiddleware:
+    """Keep a user's reads on the primary for a while after they write.
+
+    A request that writes sets a cookie that lives for
+    ``REPLICA_STICKY_SECONDS``. While it is present, ``ReplicaRouter``
+    reads from the primary, so the user does not see a replica that
+    has not caught up with their own change yet.
+    """
+
+    def __init__(
+            self,
+            get_response: Callable[[HttpRequest], HttpResponse]
+    ) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Process the request, pinned if the user wrote recently."""
+        cookie = settings.REPLICA_STICKY_COOKIE
+        with read_state(pinned=cookie in request.COOKIES) as state:
+            response = self.get_response(request)
+        if state.wrote:
+            response.set_cookie(
+                cookie,
+                '1',
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
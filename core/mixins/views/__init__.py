@@ -1,3 +1,10 @@
 from .htmx import HTMXDeleteMixin, HTMXResponseMixin
+from .ownership import OwnedObjectMixin
+from .pagination import KeysetPaginationMixin
 
-__all__ = ['HTMXDeleteMixin', 'HTMXResponseMixin']
+__all__ = [
+    'HTMXDeleteMixin',
+    'HTMXResponseMixin',
+    'KeysetPaginationMixin',
+    'OwnedObjectMixin',
+]
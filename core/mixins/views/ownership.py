@@ -0,0 +1,75 @@
+from collections.abc import Sequence
+from typing import Any, Generic, TypeVar
+
+from django.db import models
+from django.db.models import QuerySet
+from django.http import Http404, HttpRequest
+from django.utils.translation import gettext_lazy as _
+
+from core import unit_of_work
+from core.sharding import on_shard
+
+M = TypeVar('M', bound=models.Model)
+
+
+class OwnedObjectMixin(Generic[M]):
+    """Mixin that resolves a view's object once, scoped to its owner.
+
+    The object is looked up through the request's identity map with
+    ``owner_lookup`` filtering on the current user and the relations in
+    ``object_select_related`` joined in. Later ``get_object`` calls
+    return the cached instance, and so do repository lookups of the
+    same object by the service layer, so a mutating view reads it from
+    the database exactly once.
+
+    Attributes:
+        owner_lookup: Lookup from the model to its owning user
+        object_select_related: Relations to load with the object
+
+    """
+
+    model: type[M]
+    owner_lookup: str = 'owner'
+    object_select_related: Sequence[str] = ()
+    pk_url_kwarg: str = 'pk'
+    request: HttpRequest
+    kwargs: dict[str, Any]
+
+    def get_queryset(self) -> QuerySet[M]:
+        """Get the model's objects that belong to the current user."""
+        queryset = on_shard(
+            self.model._default_manager.filter(
+                **{self.owner_lookup: self.request.user}
+            ),
+            self.request.user.pk
+        )
+        if self.object_select_related:
+            queryset = queryset.select_related(*self.object_select_related)
+        return queryset
+
+    def get_object(self, queryset: QuerySet[M] | None = None) -> M:
+        """Return the current user's object from the URL, loading it once.
+
+        Raises:
+            Http404: If the user has no such object.
+
+        """
+        cached: M | None = getattr(self, '_owned_object', None)
+        if cached is not None:
+            return cached
+
+        try:
+            obj = unit_of_work.load(
+                queryset if queryset is not None else self.get_queryset(),
+                self.kwargs.get(self.pk_url_kwarg),
+                scope=self.request.user.pk
+            )
+        except self.model.DoesNotExist:
+            raise Http404(
+                _('No %(verbose_name)s found matching the query') % {
+                    'verbose_name': self.model._meta.verbose_name
+                }
+            ) from None
+
+        self._owned_object = obj
+        return obj
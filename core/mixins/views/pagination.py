@@ -0,0 +1,90 @@
+from collections.abc import Sequence
+from typing import Any
+
+from django.db.models import QuerySet
+from django.http import Http404, HttpRequest
+from django.utils.translation import gettext_lazy as _
+
+from core.pagination import InvalidCursorError, KeysetPage, KeysetPaginator
+
+
+class KeysetPaginationMixin:
+    """Mixin that swaps ListView's offset pagination for keyset pagination.
+
+    Pages are addressed by an opaque ``cursor`` query parameter instead of
+    a page number, so no ``COUNT(*)`` is run and deep pages cost the same
+    as the first one. Requests that still pass ``page`` fall back to the
+    regular offset paginator.
+
+    HTMX requests for a follow-up page are rendered with
+    ``page_template_name`` so the response can be appended in place by an
+    infinite-scroll trigger.
+
+    Attributes:
+        keyset_ordering: Unique ordering used as the pagination key
+        cursor_kwarg: Name of the query parameter holding the cursor
+        page_template_name: Optional template for HTMX follow-up pages
+
+    """
+
+    keyset_ordering: Sequence[str]
+    cursor_kwarg: str = 'cursor'
+    page_template_name: str | None = None
+    page_kwarg: str
+    request: HttpRequest
+
+    def paginate_queryset(
+            self,
+            queryset: QuerySet[Any],
+            page_size: int
+    ) -> tuple[Any, Any, Any, bool]:
+        """Paginate the queryset by cursor unless a page number is given.
+
+        Args:
+            queryset: Queryset to paginate
+            page_size: Number of objects per page
+
+        Returns:
+            Tuple of paginator, page, object list and is_paginated flag
+
+        """
+        if self.page_kwarg in self.request.GET:
+            return super().paginate_queryset(  # type: ignore[misc]
+                queryset, page_size
+            )
+
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            self.keyset_ordering
+        )
+        try:
+            page = self.get_keyset_page(
+                paginator, self.request.GET.get(self.cursor_kwarg)
+            )
+        except InvalidCursorError:
+            raise Http404(_('Invalid cursor.')) from None
+        return paginator, page, page.object_list, page.has_next
+
+    def get_keyset_page(
+            self,
+            paginator: KeysetPaginator[Any],
+            cursor: str | None
+    ) -> KeysetPage[Any]:
+        """Fetch the page following ``cursor``, e.g. through a cache.
+
+        Raises:
+            InvalidCursorError: If ``cursor`` cannot be decoded.
+
+        """
+        return paginator.get_page(cursor)
+
+    def get_template_names(self) -> list[str]:
+        """Use the page template for HTMX follow-up page requests."""
+        if (
+                self.page_template_name
+                and self.cursor_kwarg in self.request.GET
+                and self.request.headers.get('HX-Request')
+        ):
+            return [self.page_template_name]
+        return super().get_template_names()  # type: ignore[misc, no-any-return]
@@ -0,0 +1,140 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import json
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.db.models import Q, QuerySet
+
+M = TypeVar('M', bound=models.Model)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class KeysetPage(Generic[M]):
+    """A single page of keyset-paginated objects.
+
+    Attributes:
+        object_list: Objects on this page
+        next_cursor: Opaque cursor for the following page, or None if
+            this is the last page
+
+    """
+
+    object_list: list[M]
+    next_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        """Whether another page follows this one."""
+        return self.next_cursor is not None
+
+    def __iter__(self) -> Iterator[M]:
+        """Iterate over the objects on this page."""
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        """Return the number of objects on this page."""
+        return len(self.object_list)
+
+
+class KeysetPaginator(Generic[M]):
+    """Paginate a queryset by seeking past the last row of the previous page.
+
+    Unlike offset pagination, no ``COUNT(*)`` is issued and every page
+    costs the same index seek no matter how deep it is. The presence of
+    a next page is detected by fetching one extra row.
+
+    The ordering must be unique, so it should end with the primary key,
+    e.g. ``('-created_at', '-id')``.
+    """
+
+    def __init__(
+            self,
+            queryset: QuerySet[M],
+            per_page: int,
+            ordering: Sequence[str]
+    ) -> None:
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.keys = [
+            (name.lstrip('-'), name.startswith('-'))
+            for name in self.ordering
+        ]
+
+    def get_page(self, cursor: str | None = None) -> KeysetPage[M]:
+        """Return the page following ``cursor``, or the first page."""
+        queryset = self.queryset.order_by(*self.ordering)
+        if cursor:
+            queryset = queryset.filter(
+                self._seek(self.decode_cursor(cursor))
+            )
+        return self.page_from_rows(list(queryset[:self.per_page + 1]))
+
+    def page_from_rows(self, rows: Sequence[M]) -> KeysetPage[M]:
+        """Build a page from up to ``per_page + 1`` already ordered rows."""
+        object_list = list(rows[:self.per_page])
+        next_cursor = None
+        if len(rows) > self.per_page:
+            next_cursor = self.encode_cursor(object_list[-1])
+        return KeysetPage(object_list, next_cursor)
+
+    def encode_cursor(self, instance: M) -> str:
+        """Encode the ordering values of ``instance`` into a cursor."""
+        values = [
+            self._get_field(name).value_to_string(instance)
+            for name, _ in self.keys
+        ]
+        raw = json.dumps(values, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> list[Any]:
+        """Decode a cursor back into typed ordering values."""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursorError(cursor) from e
+
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise InvalidCursorError(cursor)
+
+        try:
+            return [
+                self._get_field(name).to_python(value)
+                for (name, _), value in zip(self.keys, values, strict=True)
+            ]
+        except ValidationError as e:
+            raise InvalidCursorError(cursor) from e
+
+    def _seek(self, values: Sequence[Any]) -> Q:
+        """Build the row-value comparison ``(a, b, ...) > (x, y, ...)``."""
+        condition = Q()
+        for index, (name, descending) in enumerate(self.keys):
+            lookup = 'lt' if descending else 'gt'
+            branch = Q(**{f'{name}__{lookup}': values[index]})
+            for (prev_name, _), prev_value in zip(
+                    self.keys[:index], values[:index], strict=True
+            ):
+                branch &= Q(**{prev_name: prev_value})
+            condition |= branch
+        return condition
+
+    def _get_field(self, name: str) -> 'models.Field[Any, Any]':
+        """Resolve an ordering name (``pk`` included) to a model field."""
+        opts = self.queryset.model._meta
+        if name == 'pk':
+            return opts.pk  # type: ignore[return-value]
+        try:
+            return opts.get_field(name)  # type: ignore[return-value]
+        except FieldDoesNotExist as e:
+            raise ValueError(f'Unknown ordering field: {name}') from e
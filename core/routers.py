@@ -0,0 +1,266 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.db import connections, models
+from django.db.models import QuerySet
+
+from core.sharding import (
+    SHARDED_APP_LABELS,
+    get_active_shard,
+    get_shard,
+    is_sharded,
+)
+
+M = TypeVar('M', bound=models.Model)
+
+# Apps of the user model, whose tables the sharded apps' migrations need
+SHARD_USER_APP_LABELS = frozenset({'auth', 'contenttypes'})
+
+PRIMARY_DATABASE = 'default'
+REPLICA_DATABASE = 'replica'
+AUXILIARY_DATABASE = 'auxiliary'
+# Router hint of the queries that may read from the replica
+REPLICA_HINT = 'replica'
+
+
+@dataclass
+class ReadState:
+    """Whether the current request has to read from the primary.
+
+    Attributes:
+        pinned: The user wrote recently, so replica reads may be stale
+        wrote: The request itself has written to the primary
+
+    """
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+_read_state: ContextVar[ReadState | None] = ContextVar(
+    'read_state', default=None
+)
+
+
+@contextmanager
+def read_state(pinned: bool = False) -> Iterator[ReadState]:
+    """Track the reads and writes of the enclosed block, e.g. a request."""
+    state = ReadState(pinned=pinned)
+    token = _read_state.set(state)
+    try:
+        yield state
+    finally:
+        _read_state.reset(token)
+
+
+def replica_reads(queryset: QuerySet[M]) -> QuerySet[M]:
+    """Let ``queryset`` read from the replica, see ``ReplicaRouter``.
+
+    Only for reads that are shown as they are; anything loaded to be
+    changed must come from the primary.
+    """
+    queryset = queryset.all()
+    # Clones share one hints dict, so it is replaced rather than updated
+    hints = queryset._hints  # type: ignore[attr-defined]
+    queryset._hints = {  # type: ignore[attr-defined]
+        **hints,
+        REPLICA_HINT: True,
+    }
+    return queryset
+
+
+class AuxiliaryRouter:
+    """Route write-heavy auxiliary apps to their own database.
+
+    Their tables are only migrated on the auxiliary database, and every
+    other app is kept off it. The routed apps must not have relations to
+    models in the main database, which rules out e.g. ``admin`` log
+    entries and allauth's email addresses. ``django_cache`` is the table
+    of the database cache backend.
+
+    Attributes:
+        app_labels: Labels of the apps stored in the auxiliary database
+
+    """
+
+    app_labels = frozenset({'sessions', 'django_cache'})
+
+    def db_for_read(
+            self,
+            model: type[models.Model],
+            **hints: Any
+    ) -> str | None:
+        """Read auxiliary models from the auxiliary database."""
+        if model._meta.app_label in self.app_labels:
+            return AUXILIARY_DATABASE
+        return None
+
+    def db_for_write(
+            self,
+            model: type[models.Model],
+            **hints: Any
+    ) -> str | None:
+        """Write auxiliary models to the auxiliary database."""
+        if model._meta.app_label in self.app_labels:
+            return AUXILIARY_DATABASE
+        return None
+
+    def allow_migrate(
+            self,
+            db: str,
+            app_label: str,
+            model_name: str | None = None,
+            **hints: Any
+    ) -> bool | None:
+        """Keep auxiliary tables and all other tables apart."""
+        if app_label in self.app_labels:
+            return db == AUXILIARY_DATABASE
+        if db == AUXILIARY_DATABASE:
+            return False
+        return None
+
+
+class ShardRouter:
+    """Route projects and tasks to the shard of their owner.
+
+    The shard comes from the instance a query starts from, e.g. the
+    project whose tasks are loaded, or else from ``use_shard``. Outside
+    of ``use_shard``, a project or task related to its owner, e.g. by
+    assigning ``owner`` or through ``user.projects``, goes to the
+    owner's shard. Queries on the default shard fall through to
+    ``ReplicaRouter``. Only the sharded apps are migrated on the other
+    shards, plus empty user tables; their owner is read from the default
+    database.
+    """
+
+    def db_for_read(
+            self,
+            model: type[models.Model],
+            **hints: Any
+    ) -> str | None:
+        """Read sharded models from the current shard."""
+        return self._get_shard(model, hints)
+
+    def db_for_write(
+            self,
+            model: type[models.Model],
+            **hints: Any
+    ) -> str | None:
+        """Write sharded models to the current shard."""
+        return self._get_shard(model, hints)
+
+    def allow_relation(
+            self,
+            obj1: models.Model,
+            obj2: models.Model,
+            **hints: Any
+    ) -> bool | None:
+        """Relate sharded objects to their owner on any database."""
+        if is_sharded(obj1.__class__) != is_sharded(obj2.__class__):
+            return True
+        return None
+
+    def allow_migrate(
+            self,
+            db: str,
+            app_label: str,
+            model_name: str | None = None,
+            **hints: Any
+    ) -> bool | None:
+        """Only create the sharded apps' tables on the extra shards.
+
+        The user tables are created there as well but stay empty. The
+        first migrations of the sharded apps add foreign keys to them,
+        which PostgreSQL refuses without the table.
+        """
+        if db in settings.PROJECT_SHARDS[1:]:
+            return app_label in SHARDED_APP_LABELS | SHARD_USER_APP_LABELS
+        return None
+
+    @staticmethod
+    def _get_shard(
+            model: type[models.Model],
+            hints: dict[str, Any]
+    ) -> str | None:
+        """Shard of the hinted instance or the active one, unless default."""
+        if not is_sharded(model):
+            return None
+
+        instance = hints.get('instance')
+        alias = get_active_shard()
+        if instance is not None and is_sharded(instance.__class__):
+            alias = instance._state.db or alias
+        elif instance is not None and alias is None \
+                and instance.pk is not None:
+            # Projects and tasks only relate to one unsharded model, the
+            # user owning them
+            alias = get_shard(instance.pk)
+        if alias in settings.PROJECT_SHARDS[1:]:
+            return alias
+        return None
+
+
+class ReplicaRouter:
+    """Send opted-in reads to the replica and everything else to the primary.
+
+    Only queries marked with ``replica_reads`` may be served by the
+    replica, so rows loaded to be changed are never stale. Those reads
+    still go to the primary inside a transaction, once the current
+    request has written, and while the user is pinned there after a
+    write in an earlier request (see ``ReplicaStickinessMiddleware``),
+    so nobody reads older data than they wrote.
+    """
+
+    def db_for_read(
+            self,
+            model: type[models.Model],
+            **hints: Any
+    ) -> str | None:
+        """Read from the replica where allowed and not known to be stale."""
+        if not hints.get(REPLICA_HINT):
+            return PRIMARY_DATABASE
+        state = _read_state.get()
+        if state is not None and (state.pinned or state.wrote):
+            return PRIMARY_DATABASE
+        if connections[PRIMARY_DATABASE].in_atomic_block:
+            return PRIMARY_DATABASE
+        return REPLICA_DATABASE
+
+    def db_for_write(
+            self,
+            model: type[models.Model],
+            **hints: Any
+    ) -> str | None:
+        """Write to the primary and remember that the request wrote."""
+        state = _read_state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY_DATABASE
+
+    def allow_relation(
+            self,
+            obj1: models.Model,
+            obj2: models.Model,
+            **hints: Any
+    ) -> bool | None:
+        """Relate objects read from the primary and from its replica."""
+        databases = {PRIMARY_DATABASE, REPLICA_DATABASE}
+        if {obj1._state.db, obj2._state.db} <= databases:
+            return True
+        return None
+
+    def allow_migrate(
+            self,
+            db: str,
+            app_label: str,
+            model_name: str | None = None,
+            **hints: Any
+    ) -> bool | None:
+        """Never migrate the replica, it follows the primary."""
+        if db == REPLICA_DATABASE:
+            return False
+        return None
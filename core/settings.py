@@ -1,6 +1,7 @@
 from pathlib import Path
+from typing import Any
 
-from decouple import config
+from decouple import Choices, Csv, config
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -29,10 +30,12 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ReplicaStickinessMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.UnitOfWorkMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware',
@@ -57,29 +60,171 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'core.wsgi.application'
-DATABASES = {
+DATABASE_ENGINE = config(
+    'DATABASE_ENGINE', default='sqlite', cast=Choices(['sqlite', 'postgresql'])
+)
+# Sessions are written on most requests. In a database of their own
+# those writes do not queue on the lock project and task writes need.
+# Dashboard reads marked with replica_reads go to the replica, which is
+# the primary itself unless configured; everything else uses the primary.
+DATABASE_ROUTERS = [
+    'core.routers.AuxiliaryRouter',
+    'core.routers.ShardRouter',
+    'core.routers.ReplicaRouter',
+]
+# Projects and tasks are spread over this many databases by owner, see
+# core.sharding. The first shard is the default database.
+PROJECT_SHARD_COUNT = config('PROJECT_SHARD_COUNT', default=1, cast=int)
+PROJECT_SHARDS = [
+    'default',
+    *(f'shard_{number}' for number in range(1, PROJECT_SHARD_COUNT)),
+]
+# Owners kept off their hashed shard, as user_id:alias pairs. Move their
+# data with the reshard_user command when changing this.
+PROJECT_SHARD_OVERRIDES = {
+    int(owner_id): alias
+    for owner_id, alias in (
+        pair.split(':') for pair in config(
+            'PROJECT_SHARD_OVERRIDES', default='', cast=Csv()
+        )
+    )
+}
+# How long a user's reads stay on the primary after they wrote
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=5, cast=int)
+REPLICA_STICKY_COOKIE = 'primary_reads'
+
+if DATABASE_ENGINE == 'postgresql':
+    # Django's connection pool and persistent connections (CONN_MAX_AGE)
+    # are mutually exclusive; the pool is used unless disabled.
+    POSTGRES_POOL = config('POSTGRES_POOL', default=True, cast=bool)
+    POSTGRES_NAME = config('POSTGRES_DB', default='managerplatform')
+    POSTGRES_HOST = config('POSTGRES_HOST', default='localhost')
+
+    def postgres_database(
+            name: str,
+            host: str = POSTGRES_HOST
+    ) -> dict[str, Any]:
+        """Build the settings of one database on a PostgreSQL server."""
+        options: dict[str, Any] = {}
+        if POSTGRES_POOL:
+            options['pool'] = {
+                'min_size': config(
+                    'POSTGRES_POOL_MIN_SIZE', default=2, cast=int
+                ),
+                'max_size': config(
+                    'POSTGRES_POOL_MAX_SIZE', default=10, cast=int
+                ),
+                'timeout': config(
+                    'POSTGRES_POOL_TIMEOUT', default=10, cast=int
+                ),
+            }
+        return {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': name,
+            'USER': config('POSTGRES_USER', default='postgres'),
+            'PASSWORD': config('POSTGRES_PASSWORD', default=''),
+            'HOST': host,
+            'PORT': config('POSTGRES_PORT', default=5432, cast=int),
+            'CONN_MAX_AGE': 0 if POSTGRES_POOL else config(
+                'POSTGRES_CONN_MAX_AGE', default=600, cast=int
+            ),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': options,
+        }
+
+    DATABASES = {
+        'default': postgres_database(POSTGRES_NAME),
+        'replica': postgres_database(POSTGRES_NAME, config(
+            'POSTGRES_REPLICA_HOST', default=POSTGRES_HOST
+        )),
+        'auxiliary': postgres_database(config(
+            'POSTGRES_AUXILIARY_DB', default=f'{POSTGRES_NAME}_auxiliary'
+        )),
+    }
+    for shard in PROJECT_SHARDS[1:]:
+        DATABASES[shard] = postgres_database(f'{POSTGRES_NAME}_{shard}')
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        },
+        'replica': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / config(
+                'REPLICA_DATABASE_NAME', default='db.sqlite3'
+            ),
+        },
+        'auxiliary': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / config(
+                'AUXILIARY_DATABASE_NAME', default='auxiliary.sqlite3'
+            ),
+        },
+    }
+    for shard in PROJECT_SHARDS[1:]:
+        DATABASES[shard] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / f'{shard}.sqlite3',
+        }
+
+# Tests read the replica through the primary's test database
+DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+# SQLite production profile. WAL lets readers run while a write is in
+# progress, and IMMEDIATE transactions take the write lock when they
+# begin, so concurrent writers wait up to busy_timeout instead of
+# failing with "database is locked" when upgrading a read lock.
+SQLITE_PRODUCTION = config('SQLITE_PRODUCTION', default=not DEBUG, cast=bool)
+if DATABASE_ENGINE == 'sqlite' and SQLITE_PRODUCTION:
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': config('SQLITE_SYNCHRONOUS', default='NORMAL'),
+        'mmap_size': config(
+            'SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int
+        ),
+        # Negative values are in KiB: 64 MiB of page cache per connection
+        'cache_size': config('SQLITE_CACHE_SIZE', default=-64 * 1024, cast=int),
+        'busy_timeout': config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int),
+        'temp_store': 'MEMORY',
+    }
+    for database in DATABASES.values():
+        database['OPTIONS'] = {
+            'init_command': ';'.join(
+                f'PRAGMA {name}={value}'
+                for name, value in SQLITE_PRAGMAS.items()
+            ),
+            'transaction_mode': 'IMMEDIATE',
+        }
+
+# Per-user dashboard data is cached until the user writes, see core.cache.
+# LOCATION is the directory of the file backend or the table of the
+# database backend, created with createcachetable --database auxiliary.
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': config(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': config('CACHE_LOCATION', default='managerplatform'),
     }
 }
+DASHBOARD_CACHE_TIMEOUT = config(
+    'DASHBOARD_CACHE_TIMEOUT', default=300, cast=int
+)
 
 AUTH_PASSWORD_VALIDATORS = [
     {
-        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
-        # noqa: E501
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',  # noqa: E501
     },
     {
-        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
-        # noqa: E501
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',  # noqa: E501
     },
     {
-        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
-        # noqa: E501
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',  # noqa: E501
     },
     {
-        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
-        # noqa: E501
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',  # noqa: E501
     },
 ]
 
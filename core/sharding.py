@@ -0,0 +1,131 @@
+"""Placement of projects and tasks on database shards by their owner."""
+
+import functools
+import hashlib
+import inspect
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models
+from django.db.models import QuerySet
+
+P = ParamSpec('P')
+R = TypeVar('R')
+M = TypeVar('M', bound=models.Model)
+
+# Apps whose tables exist on every shard and hold each owner's rows on one
+SHARDED_APP_LABELS = frozenset({'project', 'task'})
+
+_active_shard: ContextVar[str | None] = ContextVar(
+    'active_shard', default=None
+)
+
+
+def _jump_hash(key: int, buckets: int) -> int:
+    """Jump consistent hash of a 64-bit ``key`` into ``buckets`` buckets.
+
+    Going from N to N + 1 buckets moves only 1 / (N + 1) of the keys, all
+    of them into the new bucket, so adding a shard relocates as few
+    owners as possible.
+    """
+    bucket, jump = -1, 0
+    while jump < buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def get_shards() -> list[str]:
+    """Aliases of all shards, the default database first."""
+    return list(settings.PROJECT_SHARDS)
+
+
+def get_shard(owner_id: Any) -> str:
+    """Alias of the shard holding the projects and tasks of ``owner_id``.
+
+    Owners listed in ``PROJECT_SHARD_OVERRIDES`` stay where they were
+    put, everyone else is placed by a stable hash of their id.
+    """
+    override = settings.PROJECT_SHARD_OVERRIDES.get(owner_id)
+    if override is not None:
+        return override
+
+    shards = settings.PROJECT_SHARDS
+    if len(shards) == 1:
+        return shards[0]
+    digest = hashlib.blake2b(str(owner_id).encode(), digest_size=8).digest()
+    return shards[_jump_hash(int.from_bytes(digest, 'big'), len(shards))]
+
+
+def is_sharded(model: type[models.Model]) -> bool:
+    """Whether rows of ``model`` are spread across the shards."""
+    return model._meta.app_label in SHARDED_APP_LABELS
+
+
+def get_active_shard() -> str | None:
+    """Shard that sharded models without an explicit database use."""
+    return _active_shard.get()
+
+
+@contextmanager
+def use_shard(alias: str) -> Iterator[None]:
+    """Route sharded models to ``alias`` inside the enclosed block."""
+    token = _active_shard.set(alias)
+    try:
+        yield
+    finally:
+        _active_shard.reset(token)
+
+
+class ShardedQuerySet(QuerySet[M]):
+    """Queries on a model whose rows are spread across the shards."""
+
+    def create(self, **kwargs: Any) -> M:
+        """Create an object on the shard of the objects it relates to.
+
+        ``QuerySet.create`` asks the routers for a database without the
+        new object, which always gives the default shard outside of
+        ``use_shard``. Saving without a database lets ``ShardRouter``
+        use the owner or project the object was created with.
+        """
+        if self._db is not None or get_active_shard() is not None:
+            return super().create(**kwargs)
+        obj = self.model(**kwargs)
+        obj.save(force_insert=True)
+        return obj
+
+
+ShardedManager = models.Manager.from_queryset(ShardedQuerySet)
+
+
+def on_shard(queryset: QuerySet[M], owner_id: Any) -> QuerySet[M]:
+    """Pin ``queryset`` to the shard of ``owner_id``.
+
+    Queries on the default shard are left to the routers, so that reads
+    marked with ``replica_reads`` can still be sent to the replica.
+    """
+    alias = get_shard(owner_id)
+    if alias == DEFAULT_DB_ALIAS:
+        return queryset
+    return queryset.using(alias)
+
+
+def owner_shard(func: Callable[P, R]) -> Callable[P, R]:
+    """Run a repository method on the shard of its ``user`` argument.
+
+    Must wrap ``write_transaction``, which opens its transaction on the
+    database the routers pick for the model.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        user = signature.bind(*args, **kwargs).arguments['user']
+        with use_shard(get_shard(user.pk)):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,215 @@
+"""Write transactions that retry when SQLite reports the database busy."""
+
+import functools
+import logging
+import random
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import ParamSpec, TypeVar
+
+from django.core.cache import cache
+from django.db import (
+    OperationalError,
+    connections,
+    models,
+    router,
+    transaction,
+)
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from core import unit_of_work
+from core.cache import increment_counter
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+logger = logging.getLogger(__name__)
+
+# SQLite result codes of a busy database and a locked table
+SQLITE_BUSY_CODES = frozenset({5, 6})
+
+WRITE_RETRY_ATTEMPTS = 5
+WRITE_RETRY_BASE_DELAY = 0.02
+WRITE_RETRY_MAX_DELAY = 0.5
+RETRY_OUTCOMES = ('retries', 'exhausted')
+
+
+def _retry_key(operation: str, outcome: str) -> str:
+    """Cache key of a retry or exhaustion counter."""
+    return f'metrics:retry:{operation}:{outcome}'
+
+
+class RetryMetrics:
+    """Counters of busy retries per write operation.
+
+    ``retries`` counts every retried attempt, ``exhausted`` every
+    operation that was still busy after its last attempt. Like
+    ``CacheMetrics`` the counters are stored in the cache, so every
+    process sharing the backend adds to them and ``manage.py
+    retry_stats`` reports them. A database cache on the busy database
+    itself would block along with the write, so use another backend.
+
+    Attributes:
+        operations: Operations registered by the writes of this process
+
+    """
+
+    def __init__(self) -> None:
+        self.operations: set[str] = set()
+
+    def register(self, operation: str) -> None:
+        """Report ``operation`` in snapshots, even before it retries."""
+        self.operations.add(operation)
+
+    def record_retry(self, operation: str) -> None:
+        """Count one retried attempt of ``operation``."""
+        increment_counter(_retry_key(operation, 'retries'))
+
+    def record_exhausted(self, operation: str) -> None:
+        """Count one ``operation`` that ran out of attempts."""
+        increment_counter(_retry_key(operation, 'exhausted'))
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Return the counts of the operations that retried so far."""
+        keys = {
+            (operation, outcome): _retry_key(operation, outcome)
+            for operation in self.operations
+            for outcome in RETRY_OUTCOMES
+        }
+        counts = cache.get_many(keys.values())
+        return {
+            operation: {
+                outcome: counts.get(keys[operation, outcome], 0)
+                for outcome in RETRY_OUTCOMES
+            }
+            for operation in sorted(self.operations)
+            if any(
+                keys[operation, outcome] in counts
+                for outcome in RETRY_OUTCOMES
+            )
+        }
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        cache.delete_many([
+            _retry_key(operation, outcome)
+            for operation in self.operations
+            for outcome in RETRY_OUTCOMES
+        ])
+
+
+retry_metrics = RetryMetrics()
+
+
+def is_busy_error(error: OperationalError) -> bool:
+    """Whether ``error`` means another connection holds the write lock."""
+    code = getattr(error.__cause__, 'sqlite_errorcode', None)
+    if code is not None:
+        return code & 0xFF in SQLITE_BUSY_CODES
+    return 'database is locked' in str(error) \
+        or 'database table is locked' in str(error)
+
+
+def get_backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given (1-based) attempt."""
+    ceiling = min(
+        WRITE_RETRY_MAX_DELAY, WRITE_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+    )
+    return random.uniform(0, ceiling)
+
+
+@contextmanager
+def _begin_immediate(connection: BaseDatabaseWrapper) -> Iterator[None]:
+    """Open the next SQLite transaction with ``BEGIN IMMEDIATE``.
+
+    The write lock is then taken when the transaction starts, where a
+    busy database can be waited for and retried, rather than when its
+    first write tries to upgrade a read lock.
+    """
+    if connection.vendor != 'sqlite':
+        yield
+        return
+
+    # Connecting reads transaction_mode from the settings again
+    connection.ensure_connection()
+    previous = connection.transaction_mode  # type: ignore[attr-defined]
+    connection.transaction_mode = 'IMMEDIATE'  # type: ignore[attr-defined]
+    try:
+        yield
+    finally:
+        connection.transaction_mode = previous  # type: ignore[attr-defined]
+
+
+def write_transaction(
+        model: type[models.Model],
+        using: str | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Run the decorated write in a transaction on ``model``'s database.
+
+    ``using`` names the database instead, for writes whose target is
+    known from the instances rather than from the router.
+
+    An outermost call starts the transaction with ``BEGIN IMMEDIATE`` on
+    SQLite and, when the database is busy, runs the whole function again
+    after a jittered exponential backoff, up to WRITE_RETRY_ATTEMPTS
+    times. Calls made inside another transaction only get a savepoint:
+    the outer transaction is the one that has to be retried.
+
+    Field updates the function leaves in the request's unit of work are
+    flushed before the transaction (or savepoint) is released. Once it
+    ends, committed or not, the identity map is cleared: rows may have
+    been changed by set-based writes, or the changes made to loaded
+    instances rolled back, and a retry must load them again.
+
+    The decorated function must be safe to run again from the start.
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        operation = func.__qualname__
+        retry_metrics.register(operation)
+
+        def run(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                result = func(*args, **kwargs)
+                unit_of_work.flush()
+                return result
+            finally:
+                unit_of_work.clear()
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            alias = using or router.db_for_write(model)
+            connection = connections[alias]
+            if connection.in_atomic_block:
+                with transaction.atomic(using=alias):
+                    return run(*args, **kwargs)
+
+            attempt = 1
+            while True:
+                try:
+                    with _begin_immediate(connection), \
+                            transaction.atomic(using=alias):
+                        return run(*args, **kwargs)
+                except OperationalError as e:
+                    if not is_busy_error(e):
+                        raise
+                    if attempt >= WRITE_RETRY_ATTEMPTS:
+                        retry_metrics.record_exhausted(operation)
+                        logger.error(
+                            '%s: database still busy after %d attempts',
+                            operation, attempt
+                        )
+                        raise
+
+                delay = get_backoff_delay(attempt)
+                retry_metrics.record_retry(operation)
+                logger.warning(
+                    '%s: database busy, retrying in %.3fs (attempt %d)',
+                    operation, delay, attempt
+                )
+                time.sleep(delay)
+                attempt += 1
+
+        return wrapper
+
+    return decorator
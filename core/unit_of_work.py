@@ -0,0 +1,226 @@
+"""Request-scoped identity map and unit of work."""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from django.db import DEFAULT_DB_ALIAS, models, router
+from django.db.models import QuerySet
+
+from core import transactions
+from core.routers import PRIMARY_DATABASE, REPLICA_DATABASE
+
+M = TypeVar('M', bound=models.Model)
+
+Key = tuple[type[models.Model], str | None, Any]
+
+_current: ContextVar['UnitOfWork | None'] = ContextVar(
+    'unit_of_work', default=None
+)
+
+
+class UnitOfWork:
+    """Identity map and pending field updates for one request.
+
+    Every ``(model, database, pk)`` is loaded at most once: later loads
+    return the same instance. The database is part of the key because
+    each shard numbers its rows on its own; the replica counts as the
+    primary. Loads are scoped (usually by the requesting user's
+    id), and an instance loaded under one scope is checked again with a
+    cheap existence query the first time it is asked for under another.
+
+    Field updates registered with ``mark_dirty`` are written by ``flush``
+    with one ``bulk_update`` per model, set of fields and database.
+    ``write_transaction`` flushes before its transaction commits and
+    then clears the identity map, so writes are never left for after
+    the response and no instance outlives a write that may have changed
+    its row.
+    """
+
+    def __init__(self) -> None:
+        self._identity_map: dict[Key, models.Model] = {}
+        self._scopes: dict[Key, set[Any]] = {}
+        self._dirty: dict[Key, set[str]] = {}
+
+    @staticmethod
+    def _key(model: type[models.Model], using: str | None, pk: Any) -> Key:
+        """Build the identity key of a model, database and primary key."""
+        if using == REPLICA_DATABASE:
+            using = PRIMARY_DATABASE
+        return (
+            model._meta.concrete_model, using, model._meta.pk.to_python(pk)
+        )
+
+    @classmethod
+    def _instance_key(cls, instance: models.Model) -> Key:
+        """Build the identity key of an instance."""
+        return cls._key(type(instance), instance._state.db, instance.pk)
+
+    def get(
+            self,
+            model: type[M],
+            pk: Any,
+            using: str = DEFAULT_DB_ALIAS
+    ) -> M | None:
+        """Return the loaded instance of ``model`` with ``pk``, if any."""
+        return self._identity_map.get(  # type: ignore[return-value]
+            self._key(model, using, pk)
+        )
+
+    def add(self, instance: M, scope: Any = None) -> M:
+        """Register a loaded instance and return the canonical one."""
+        key = self._instance_key(instance)
+        canonical = self._identity_map.setdefault(key, instance)
+        self._scopes.setdefault(key, set()).add(scope)
+        return canonical  # type: ignore[return-value]
+
+    def load(self, queryset: QuerySet[M], pk: Any, scope: Any = None) -> M:
+        """Get the object with ``pk`` from ``queryset`` at most once.
+
+        Raises:
+            DoesNotExist: If ``queryset`` has no object with ``pk``.
+
+        """
+        key = self._key(queryset.model, queryset.db, pk)
+        instance = self._identity_map.get(key)
+        if instance is None:
+            return self.add(queryset.get(pk=pk), scope)
+
+        if scope not in self._scopes[key]:
+            if not queryset.filter(pk=pk).exists():
+                raise queryset.model.DoesNotExist(
+                    f'{queryset.model.__name__} matching query does not exist.'
+                )
+            self._scopes[key].add(scope)
+        return instance  # type: ignore[return-value]
+
+    def mark_dirty(self, instance: models.Model, fields: Sequence[str]) -> None:
+        """Schedule ``fields`` of a registered instance to be written."""
+        key = self._instance_key(instance)
+        self._identity_map.setdefault(key, instance)
+        self._dirty.setdefault(key, set()).update(fields)
+
+    def evict(self, instance: models.Model) -> None:
+        """Forget an instance, e.g. after it was deleted."""
+        key = self._instance_key(instance)
+        self._identity_map.pop(key, None)
+        self._scopes.pop(key, None)
+        self._dirty.pop(key, None)
+
+    def flush(self) -> None:
+        """Write pending updates, batched by model and set of fields."""
+        batches: dict[
+            tuple[type[models.Model], tuple[str, ...], str | None],
+            list[models.Model]
+        ] = {}
+        for key, fields in self._dirty.items():
+            instance = self._identity_map[key]
+            opts = instance._meta
+            for field in opts.concrete_fields:
+                if getattr(field, 'auto_now', False):
+                    field.pre_save(instance, add=False)
+                    fields.add(field.name)
+            # Instances are written back to the shard they were read from
+            batches.setdefault(
+                (key[0], tuple(sorted(fields)), instance._state.db), []
+            ).append(instance)
+        self._dirty.clear()
+
+        for (model, fields, _), instances in batches.items():
+            using = router.db_for_write(model, instance=instances[0])
+            write = transactions.write_transaction(model, using=using)(
+                self._write_batch
+            )
+            write(model, using, instances, fields)
+
+    @staticmethod
+    def _write_batch(
+            model: type[models.Model],
+            using: str,
+            instances: list[models.Model],
+            fields: tuple[str, ...]
+    ) -> None:
+        """Write one batch; rerun as a whole if the database is busy."""
+        model._base_manager.db_manager(using).bulk_update(instances, fields)
+
+    def discard(self) -> None:
+        """Drop pending updates without writing them."""
+        self._dirty.clear()
+
+    def clear(self) -> None:
+        """Forget every loaded instance and drop pending updates."""
+        self._identity_map.clear()
+        self._scopes.clear()
+        self._dirty.clear()
+
+
+def get_unit_of_work() -> UnitOfWork | None:
+    """Return the unit of work of the current request, if any."""
+    return _current.get()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """Activate a fresh unit of work for the enclosed block.
+
+    Updates still pending when the block ends were not made inside a
+    ``write_transaction`` and are discarded; writing them is left to
+    the caller, see ``UnitOfWork.flush``.
+    """
+    uow = UnitOfWork()
+    token = _current.set(uow)
+    try:
+        yield uow
+    finally:
+        uow.discard()
+        _current.reset(token)
+
+
+def load(queryset: QuerySet[M], pk: Any, scope: Any = None) -> M:
+    """Get an object by pk through the current identity map, if any."""
+    uow = get_unit_of_work()
+    if uow is None:
+        return queryset.get(pk=pk)
+    return uow.load(queryset, pk, scope)
+
+
+def flush() -> None:
+    """Write the pending updates of the current unit of work, if any."""
+    uow = get_unit_of_work()
+    if uow is not None:
+        uow.flush()
+
+
+def clear() -> None:
+    """Forget everything the current unit of work has loaded, if any."""
+    uow = get_unit_of_work()
+    if uow is not None:
+        uow.clear()
+
+
+def save(instance: models.Model, fields: Sequence[str]) -> None:
+    """Write ``fields`` now, or at flush when a unit of work is active.
+
+    Inside a ``write_transaction`` the update is flushed, batched with
+    the others, before the transaction commits.
+    """
+    uow = get_unit_of_work()
+    if uow is None:
+        instance.save(update_fields=[
+            *fields,
+            *(
+                field.name for field in instance._meta.concrete_fields
+                if getattr(field, 'auto_now', False)
+            ),
+        ])
+    else:
+        uow.mark_dirty(instance, fields)
+
+
+def delete(instance: models.Model) -> None:
+    """Delete an instance now and forget it in the identity map."""
+    uow = get_unit_of_work()
+    if uow is not None:
+        uow.evict(instance)
+    instance.delete()
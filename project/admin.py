@@ -15,6 +15,8 @@ class ProjectAdmin(admin.ModelAdmin):
     list_display = (
         'title',
         'owner',
+        'task_count',
+        'completed_count',
         'created_at',
         'updated_at',
     )
@@ -28,6 +30,8 @@ class ProjectAdmin(admin.ModelAdmin):
         'owner__email'
     )
     readonly_fields = (
+        'task_count',
+        'completed_count',
         'created_at',
         'updated_at'
     )
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProjectConfig(AppConfig): # noqa: D101
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'project'
+
+    def ready(self) -> None:
+        """Connect the signal receivers."""
+        from project import signals  # noqa: F401
@@ -8,6 +8,9 @@ PROJECT_TITLE_MAX_LENGTH = 64
 DEFAULT_PROJECTS_PER_PAGE = 10
 MAX_PROJECTS_PER_PAGE = 100
 
+# Rows inserted per statement when moving a user to another shard
+SHARD_MOVE_BATCH_SIZE = 500
+
 # Search
 MIN_SEARCH_QUERY_LENGTH = 2
 MAX_SEARCH_QUERY_LENGTH = 50
@@ -0,0 +1,93 @@
+import statistics
+import time
+from typing import Any
+
+from allauth.account.utils import filter_users_by_email
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import router, transaction
+
+BENCHMARK_USERNAME = 'email-login-benchmark'
+
+
+class Command(BaseCommand):
+    """Measure allauth's login lookup by email on a large user table."""
+
+    help = (
+        'Create throwaway users, look some of them up by email the way '
+        'allauth does on login and report the query plan and the median '
+        'and p95 lookup time. Everything runs in a transaction that is '
+        'rolled back. Run it after "migrate project 0005" to measure the '
+        'table without the email index.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=100_000,
+            help='Number of users to create.',
+        )
+        parser.add_argument(
+            '--lookups',
+            type=int,
+            default=200,
+            help='Number of addresses to look up.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the benchmark."""
+        User = get_user_model()
+        count = options['users']
+        lookups = min(options['lookups'], count)
+        # Login never gets to checking these, so do not hash per user
+        password = make_password(None)
+
+        with transaction.atomic(using=router.db_for_write(User)):
+            User.objects.bulk_create(
+                (
+                    User(
+                        username=f'{BENCHMARK_USERNAME}-{i}',
+                        email=f'{BENCHMARK_USERNAME}-{i}@example.com',
+                        password=password,
+                    )
+                    for i in range(count)
+                ),
+                batch_size=2000,
+            )
+            # Spread over the table and typed with capitals, like users do
+            emails = [
+                f'{BENCHMARK_USERNAME}-{i}@Example.com'
+                for i in range(0, count, count // lookups)
+            ][:lookups]
+            plan = User.objects.filter(email=emails[0].lower()).explain()
+
+            timings = []
+            for email in emails:
+                start = time.perf_counter()
+                users = filter_users_by_email(email, prefer_verified=True)
+                timings.append(time.perf_counter() - start)
+                if len(users) != 1:
+                    raise CommandError(
+                        f'Found {len(users)} users for {email}.'
+                    )
+
+            transaction.set_rollback(True)
+
+        median = statistics.median(timings) * 1000
+        p95 = median
+        if len(timings) > 1:
+            p95 = statistics.quantiles(timings, n=20)[-1] * 1000
+        self.stdout.write(f'Users:   {count}\nPlan:')
+        for line in plan.splitlines():
+            self.stdout.write(f'  {line}')
+        self.stdout.write(
+            f'Lookups: {len(timings)}, median {median:.2f} ms, '
+            f'p95 {p95:.2f} ms'
+        )
@@ -0,0 +1,45 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.cache import cache_metrics
+# Imported for the caches they define, which register their namespaces
+from project import services as project_services  # noqa: F401
+from task import services as task_services  # noqa: F401
+
+
+class Command(BaseCommand):
+    """Report the hits and misses of the per-user caches."""
+
+    help = (
+        'Print the cache hits, misses and hit ratio of every per-user '
+        'cache, counted by all processes that share the cache backend. '
+        'With the local memory backend only this process is counted.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Set the counters back to zero after printing them.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Print the counters."""
+        snapshot = cache_metrics.snapshot()
+        self.stdout.write(
+            f"{'Cache':<16} {'hits':>10} {'misses':>10} {'ratio':>7}"
+        )
+        for namespace in sorted(cache_metrics.namespaces):
+            counts = snapshot.get(namespace, {'hits': 0, 'misses': 0})
+            total = counts['hits'] + counts['misses']
+            ratio = f"{counts['hits'] / total:.1%}" if total else '-'
+            self.stdout.write(
+                f"{namespace:<16} {counts['hits']:>10} "
+                f"{counts['misses']:>10} {ratio:>7}"
+            )
+
+        if options['reset']:
+            cache_metrics.reset()
+            self.stdout.write(self.style.SUCCESS('Counters reset.'))
@@ -0,0 +1,62 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import IntegrityError
+
+from core.sharding import get_shard, get_shards
+from project.exceptions import ProjectConflictError
+from project.repositories import ProjectRepository
+
+
+class Command(BaseCommand):
+    """Move one user's projects and tasks to another database shard."""
+
+    help = (
+        'Move all projects and tasks of a user from one shard to another, '
+        'by default to the shard the user is routed to now. Run it after '
+        'changing PROJECT_SHARD_COUNT or PROJECT_SHARD_OVERRIDES; until '
+        'it finishes the user does not see their data.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            'user_id',
+            type=int,
+            help='ID of the user whose data is moved.',
+        )
+        parser.add_argument(
+            '--from',
+            choices=get_shards(),
+            required=True,
+            dest='source',
+            help='Shard the data is on now.',
+        )
+        parser.add_argument(
+            '--to',
+            choices=get_shards(),
+            dest='target',
+            help="Shard to move the data to, the user's shard by default.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the move."""
+        user_id = options['user_id']
+        source = options['source']
+        target = options['target'] or get_shard(user_id)
+        if source == target:
+            raise CommandError(f'User {user_id} is already on {source}.')
+
+        try:
+            projects, tasks = ProjectRepository().move_user_shard(
+                user_id, source, target
+            )
+        except (ProjectConflictError, IntegrityError) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Moved {projects} project(s) and {tasks} task(s) of user '
+                f'{user_id} from {source} to {target}.'
+            )
+        )
@@ -0,0 +1,52 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.transactions import retry_metrics
+from core.unit_of_work import UnitOfWork
+# Imported for the writes they define, which register their operations
+from project import repositories as project_repositories  # noqa: F401
+from task import repositories as task_repositories  # noqa: F401
+
+
+class Command(BaseCommand):
+    """Report the busy retries of the write transactions."""
+
+    help = (
+        'Print how often each write operation was retried because the '
+        'database was busy, and how often it still failed after its last '
+        'attempt, counted by all processes that share the cache backend. '
+        'With the local memory backend only this process is counted.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Set the counters back to zero after printing them.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Print the counters."""
+        # Its transaction is only built when a unit of work is flushed
+        retry_metrics.register(
+            UnitOfWork._write_batch.__qualname__  # noqa: SLF001
+        )
+        snapshot = retry_metrics.snapshot()
+        width = max(map(len, ['Operation', *retry_metrics.operations]))
+        self.stdout.write(
+            f"{'Operation':<{width}} {'retries':>10} {'exhausted':>10}"
+        )
+        for operation in sorted(retry_metrics.operations):
+            counts = snapshot.get(
+                operation, {'retries': 0, 'exhausted': 0}
+            )
+            self.stdout.write(
+                f"{operation:<{width}} {counts['retries']:>10} "
+                f"{counts['exhausted']:>10}"
+            )
+
+        if options['reset']:
+            retry_metrics.reset()
+            self.stdout.write(self.style.SUCCESS('Counters reset.'))
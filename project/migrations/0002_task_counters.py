@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:35
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_task_counters(apps, schema_editor):
+    Project = apps.get_model('project', 'Project')
+    Task = apps.get_model('task', 'Task')
+    db_alias = schema_editor.connection.alias
+
+    counts = Task.objects.using(db_alias).filter(
+        project=OuterRef('pk')
+    ).order_by().values('project').annotate(
+        total=Count('pk'),
+        completed=Count('pk', filter=Q(completed=True)),
+    )
+    Project.objects.using(db_alias).update(
+        task_count=Coalesce(Subquery(counts.values('total')), 0),
+        completed_count=Coalesce(Subquery(counts.values('completed')), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0001_initial'),
+        ('task', '0002_alter_task_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='completed_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of completed tasks in the project', verbose_name='Completed count'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='task_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of tasks in the project', verbose_name='Task count'),
+        ),
+        migrations.RunPython(
+            backfill_task_counters,
+            migrations.RunPython.noop,
+        ),
+    ]
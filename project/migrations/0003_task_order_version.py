@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0002_task_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='task_order_version',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Incremented whenever the order of tasks changes', verbose_name='Task order version'),
+        ),
+    ]
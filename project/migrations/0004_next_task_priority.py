@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:52
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+RANK_GAP = 1024
+
+
+def backfill_next_task_priority(apps, schema_editor):
+    Project = apps.get_model('project', 'Project')
+    Task = apps.get_model('task', 'Task')
+    db_alias = schema_editor.connection.alias
+
+    max_priority = Task.objects.using(db_alias).filter(
+        project=OuterRef('pk')
+    ).order_by().values('project').annotate(top=Max('priority'))
+    Project.objects.using(db_alias).update(
+        next_task_priority=Coalesce(
+            Subquery(max_priority.values('top')), 0
+        ) + RANK_GAP,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0003_task_order_version'),
+        ('task', '0003_sparse_task_ranks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='next_task_priority',
+            field=models.PositiveIntegerField(default=1024, editable=False, help_text='Priority given to the next task appended to the project', verbose_name='Next task priority'),
+        ),
+        migrations.RunPython(
+            backfill_next_task_priority, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_next_task_priority'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['owner', '-created_at', '-id'], name='projects_owner_created_idx'),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='owner',
+            field=models.ForeignKey(db_index=False, help_text='Project owner', on_delete=django.db.models.deletion.CASCADE, related_name='projects', to=settings.AUTH_USER_MODEL, verbose_name='Owner'),
+        ),
+    ]
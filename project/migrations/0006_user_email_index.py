@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.db import migrations, models, router
+
+# allauth lowercases the address itself and looks users up with a plain
+# ``email = %s``, so an index on the column (not on LOWER(email)) serves it.
+EMAIL_INDEX = models.Index(fields=['email'], name='users_email_idx')
+
+
+def add_email_index(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    if router.allow_migrate_model(schema_editor.connection.alias, User):
+        schema_editor.add_index(User, EMAIL_INDEX)
+
+
+def remove_email_index(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    if router.allow_migrate_model(schema_editor.connection.alias, User):
+        schema_editor.remove_index(User, EMAIL_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0005_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(add_email_index, remove_email_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0007_shard_owner'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='title',
+            field=models.CharField(help_text='Enter the name of the product', max_length=64, verbose_name='Title'),
+        ),
+    ]
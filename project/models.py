@@ -3,9 +3,11 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from core.mixins.models import TimestampMixin
+from core.sharding import ShardedManager, on_shard
+from task.constants import TASK_RANK_GAP
 
 
-class ProjectManager(models.Manager):  # type: ignore
+class ProjectManager(ShardedManager):  # type: ignore
     """
     Custom manager for a Project model providing user-specific queries.
 
@@ -15,7 +17,7 @@ class ProjectManager(models.Manager):  # type: ignore
 
     def for_user(self, user) -> models.QuerySet:  # type: ignore
         """Returns projects for the given user."""
-        return self.filter(owner=user)
+        return on_shard(self.filter(owner=user), user.pk)
 
 
 class Project(TimestampMixin, models.Model):
@@ -24,14 +26,15 @@ class Project(TimestampMixin, models.Model):
 
     Inherits from TimestampMixin to automatically manage creation and update.
     Each project is associated with an owner and
-    enforces the uniqueness of the title per user.
+    enforces the uniqueness of the title per user. All of an owner's
+    projects live on one shard, so the constraint holds across shards,
+    where a title unique across all users could not be enforced.
     """
 
     title = models.CharField(
         max_length=64,
         verbose_name=_('Title'),
         help_text=_('Enter the name of the product'),
-        unique=True,
         blank=False,
         null=False,
     )
@@ -41,6 +44,33 @@ class Project(TimestampMixin, models.Model):
         related_name='projects',
         verbose_name=_('Owner'),
         help_text=_('Project owner'),
+        db_index=False,
+        # Users live in the default database only, not on every shard
+        db_constraint=False,
+    )
+    task_count = models.PositiveIntegerField(
+        verbose_name=_('Task count'),
+        help_text=_('Number of tasks in the project'),
+        default=0,
+        editable=False,
+    )
+    completed_count = models.PositiveIntegerField(
+        verbose_name=_('Completed count'),
+        help_text=_('Number of completed tasks in the project'),
+        default=0,
+        editable=False,
+    )
+    next_task_priority = models.PositiveIntegerField(
+        verbose_name=_('Next task priority'),
+        help_text=_('Priority given to the next task appended to the project'),
+        default=TASK_RANK_GAP,
+        editable=False,
+    )
+    task_order_version = models.PositiveIntegerField(
+        verbose_name=_('Task order version'),
+        help_text=_('Incremented whenever the order of tasks changes'),
+        default=0,
+        editable=False,
     )
     objects = ProjectManager()
 
@@ -58,7 +88,25 @@ class Project(TimestampMixin, models.Model):
                 name='unique_project_per_user'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=['owner', '-created_at', '-id'],
+                name='projects_owner_created_idx'
+            ),
+        ]
 
     def __str__(self) -> str:
         """Returns the project's title as its string representation."""
         return f"{self.title} ({self.owner.email})"
+
+    def save(self, *args, **kwargs) -> None:  # type: ignore
+        """Save the project and keep its tasks' owner in sync."""
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if not adding and (
+                update_fields is None or 'owner' in update_fields
+        ):
+            self.tasks.exclude(owner_id=self.owner_id).update(
+                owner_id=self.owner_id
+            )
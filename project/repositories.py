@@ -1,8 +1,19 @@
-from typing import Optional, Dict, List, TYPE_CHECKING
-from django.db.models import QuerySet
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
+from django.db import transaction
+from django.db.models import Count, F, Prefetch, Q, QuerySet, Sum
+from django.db.models.functions import Coalesce
 from django.contrib.auth import get_user_model
 
+from core import unit_of_work
+from core.cache import invalidate_user, invalidates_user_cache
+from core.routers import replica_reads
+from core.sharding import owner_shard
+from core.transactions import write_transaction
+from project.constants import SHARD_MOVE_BATCH_SIZE
+from project.exceptions import ProjectConflictError
 from project.models import Project
+from task.constants import TASK_ORDERING
+from task.models import Task
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -12,11 +23,15 @@ else:
 
 
 class ProjectRepository:
-    """Repository for managing Project data access operations."""
+    """Repository for managing Project data access operations.
+
+    Methods taking a user run on the database shard of that user.
+    """
 
     def __init__(self) -> None:
         self.model = Project
 
+    @owner_shard
     def get_user_projects(
             self,
             user: User,
@@ -31,14 +46,52 @@ class ProjectRepository:
 
         return queryset
 
+    @owner_shard
+    def get_dashboard_projects(
+            self,
+            user: User,
+            tasks_per_project: Optional[int] = None
+    ) -> QuerySet[Project]:
+        """Get projects for the dashboard with their tasks prefetched.
+
+        Tasks of every project on the page are loaded in a single extra
+        query, in the same ``priority, id`` order the task list uses, so
+        the number of queries does not grow with the number of projects.
+        When ``tasks_per_project`` is given, at most that many tasks plus
+        one (to detect whether more exist) are loaded per project.
+
+        Prefetched tasks are stored on ``project.first_tasks``. Both
+        queries may be read from the replica.
+        """
+        tasks: QuerySet[Task] = replica_reads(
+            Task.objects.order_by(*TASK_ORDERING)
+        )
+        if tasks_per_project:
+            tasks = tasks[:tasks_per_project + 1]
+
+        return replica_reads(
+            self.model.objects.for_user(user)
+        ).prefetch_related(
+            Prefetch('tasks', queryset=tasks, to_attr='first_tasks')
+        )
+
+    @owner_shard
     def get_project_by_id(
             self,
             project_id: int,
             user: User
     ) -> Project:
-        """Get a specific project by ID for a user."""
-        return self.model.objects.for_user(user).get(id=project_id)
+        """Get a specific project by ID for a user.
+
+        Within a request the project is loaded at most once.
+        """
+        return unit_of_work.load(
+            self.model.objects.for_user(user), project_id, scope=user.pk
+        )
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Project)
     def create_project(
             self,
             title: str,
@@ -47,18 +100,29 @@ class ProjectRepository:
         """Create a new project."""
         return self.model.objects.create(title=title, owner=user)
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Project)
     def update_project(
             self,
             project_id: int,
             title: str,
             user: User
     ) -> Project:
-        """Update an existing project."""
+        """Update an existing project.
+
+        Raises:
+            IntegrityError: If another project already has the title.
+
+        """
         project: Project = self.get_project_by_id(project_id, user)
         project.title = title
-        project.save()
+        unit_of_work.save(project, ['title'])
         return project
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Project)
     def delete_project(
             self,
             project_id: int,
@@ -66,9 +130,28 @@ class ProjectRepository:
     ) -> bool:
         """Delete a project."""
         project: Project = self.get_project_by_id(project_id, user)
-        project.delete()
+        unit_of_work.delete(project)
         return True
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Project)
+    def delete_user_projects(self, user: User) -> int:
+        """Delete all projects and tasks of a user from their shard.
+
+        Projects and tasks reference their owner without a database
+        constraint, so deleting the user does not cascade to a shard
+        other than the default database.
+
+        Returns:
+            Number of projects deleted.
+
+        """
+        Task.objects.filter(owner_id=user.pk).delete()
+        _, deleted = self.model.objects.filter(owner_id=user.pk).delete()
+        return deleted.get(self.model._meta.label, 0)
+
+    @owner_shard
     def project_exists(
             self,
             title: str,
@@ -77,19 +160,114 @@ class ProjectRepository:
         """Check if a project with given title exists for a user."""
         return self.model.objects.for_user(user).filter(title=title).exists()
 
+    @owner_shard
     def get_project_stats(
             self,
             user: User
     ) -> Dict[str, int]:
-        """Get project statistics for a user."""
-        total_projects: int = self.model.objects.for_user(user).count()
-        active_projects: int = total_projects
-        return {
-            'total_projects': total_projects,
-            'active_projects': active_projects,
-            'archived_projects': 0
-        }
+        """Get project and task statistics for a user.
+
+        Everything is computed by one conditional aggregate over the
+        user's projects, summing the denormalized task counters. It may
+        be read from the replica.
+        """
+        stats: Dict[str, int] = replica_reads(
+            self.model.objects.for_user(user)
+        ).aggregate(
+            total_projects=Count('id'),
+            empty_projects=Count('id', filter=Q(task_count=0)),
+            finished_projects=Count(
+                'id',
+                filter=Q(task_count__gt=0, completed_count=F('task_count'))
+            ),
+            total_tasks=Coalesce(Sum('task_count'), 0),
+            completed_tasks=Coalesce(Sum('completed_count'), 0),
+        )
+        stats['active_projects'] = stats['total_projects']
+        stats['archived_projects'] = 0
+        stats['active_tasks'] = stats['total_tasks'] - stats['completed_tasks']
+        return stats
 
+    @owner_shard
     def search_projects(self, user: User, query: str) -> QuerySet[Project]:
         """Search projects by title for a user."""
         return self.model.objects.for_user(user).filter(title__icontains=query)
+
+    def move_user_shard(
+            self,
+            user_id: int,
+            source: str,
+            target: str,
+            batch_size: int = SHARD_MOVE_BATCH_SIZE
+    ) -> Tuple[int, int]:
+        """Move all projects and tasks of a user from one shard to another.
+
+        The rows are copied with bulk inserts and get new IDs on
+        ``target``, the tasks pointing at the new IDs of their projects.
+        The copy is committed before the rows are deleted from
+        ``source``, so a failure in between leaves the data on both
+        shards rather than on neither.
+
+        Returns:
+            Numbers of projects and tasks moved.
+
+        Raises:
+            ProjectConflictError: If ``target`` already has projects of
+                the user.
+
+        """
+        if self.model.objects.using(target).filter(owner_id=user_id).exists():
+            raise ProjectConflictError(
+                f'User {user_id} already has projects on {target}.'
+            )
+
+        with transaction.atomic(using=source), \
+                transaction.atomic(using=target):
+            projects = list(
+                self.model.objects.using(source).select_for_update().filter(
+                    owner_id=user_id
+                ).order_by('pk')
+            )
+            tasks = list(
+                Task.objects.using(source).filter(
+                    owner_id=user_id
+                ).order_by('pk')
+            )
+
+            old_ids = [project.pk for project in projects]
+            timestamps = [
+                (project.created_at, project.updated_at)
+                for project in projects
+            ]
+            for project in projects:
+                project.pk = None
+            self.model.objects.using(target).bulk_create(
+                projects, batch_size=batch_size
+            )
+            # Inserting sets the timestamps to now; keep the original ones
+            for project, (created_at, updated_at) in zip(
+                    projects, timestamps
+            ):
+                project.created_at = created_at
+                project.updated_at = updated_at
+            self.model.objects.using(target).bulk_update(
+                projects, ['created_at', 'updated_at'], batch_size=batch_size
+            )
+
+            new_ids = {
+                old_id: project.pk
+                for old_id, project in zip(old_ids, projects)
+            }
+            for task in tasks:
+                task.pk = None
+                task.project_id = new_ids[task.project_id]
+            Task.objects.using(target).bulk_create(
+                tasks, batch_size=batch_size
+            )
+
+            self.model.objects.using(source).filter(
+                owner_id=user_id
+            ).delete()
+
+        invalidate_user(user_id)
+        return len(projects), len(tasks)
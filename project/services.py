@@ -1,11 +1,16 @@
 import logging
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Iterable, Optional, List, Dict, Any, TYPE_CHECKING
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import IntegrityError, models
 
+from core.cache import GenerationCache
+from core.pagination import KeysetPage, KeysetPaginator
 from project.repositories import ProjectRepository
 from project.models import Project
+from task.constants import DEFAULT_TASKS_PER_PAGE, TASK_ORDERING
+from task.models import Task
 from project.constants import (
     PROJECT_TITLE_MIN_LENGTH,
     PROJECT_TITLE_MAX_LENGTH,
@@ -26,6 +31,13 @@ else:
 
 logger = logging.getLogger(__name__)
 
+dashboard_cache = GenerationCache(
+    'dashboard', settings.DASHBOARD_CACHE_TIMEOUT
+)
+stats_cache = GenerationCache(
+    'project_stats', settings.DASHBOARD_CACHE_TIMEOUT
+)
+
 
 class ProjectService:
     """Service layer for Project business logic."""
@@ -67,8 +79,14 @@ class ProjectService:
             raise ValidationError(
                 ERROR_PROJECT_ALREADY_EXISTS.format(title=title))
 
-        updated_project = self.repository.update_project(project_id, title,
-                                                         user)
+        try:
+            updated_project = self.repository.update_project(
+                project_id, title, user
+            )
+        except IntegrityError:
+            raise ValidationError(
+                ERROR_PROJECT_ALREADY_EXISTS.format(title=title)
+            ) from None
 
         logger.info(
             f"Project '{project.title}' updated to '{title}' by user {user.email}")
@@ -139,9 +157,54 @@ class ProjectService:
         return list(
             self.repository.get_user_projects(user, limit, include_archived))
 
+    def get_dashboard_projects(self, user: User) -> models.QuerySet[Project]:
+        """Get projects with their first page of tasks for the dashboard."""
+        return self.repository.get_dashboard_projects(
+            user,
+            tasks_per_project=DEFAULT_TASKS_PER_PAGE
+        )
+
+    def get_cached_dashboard_page(
+            self,
+            user: User,
+            paginator: KeysetPaginator[Project],
+            cursor: Optional[str] = None
+    ) -> KeysetPage[Project]:
+        """Get a page of dashboard projects, cached until the user writes.
+
+        The projects are cached together with their prefetched tasks, so
+        a hit runs no queries for them. ``paginator`` must paginate the
+        queryset of ``get_dashboard_projects``.
+        """
+        return dashboard_cache.get_or_set(
+            user.pk,
+            f'{paginator.per_page}:{cursor or ""}',
+            lambda: paginator.get_page(cursor)
+        )
+
+    def attach_task_pages(self, projects: Iterable[Project]) -> None:
+        """Turn the prefetched tasks of each project into its first page.
+
+        Sets ``project.task_page`` so templates can render the first tasks
+        and a cursor for loading the rest through ``tasks:list``.
+        """
+        paginator: KeysetPaginator[Task] = KeysetPaginator(
+            Task.objects.all(),
+            DEFAULT_TASKS_PER_PAGE,
+            TASK_ORDERING
+        )
+        for project in projects:
+            project.task_page = paginator.page_from_rows(  # type: ignore[attr-defined]
+                project.first_tasks  # type: ignore[attr-defined]
+            )
+
     def get_project_stats(self, user: User) -> Dict[str, int]:
-        """Get project statistics for a user."""
-        return self.repository.get_project_stats(user)
+        """Get project statistics for a user, cached until the user writes."""
+        return stats_cache.get_or_set(
+            user.pk,
+            'stats',
+            lambda: self.repository.get_project_stats(user)
+        )
 
     def search_projects(self, user: User, query: str) -> List[Project]:
         """Search projects by title for a user."""
@@ -166,8 +229,8 @@ class ProjectService:
             raise ValidationError(ERROR_PROJECT_TITLE_INVALID_CHARS)
 
     def _can_user_modify_project(self, project: Project, user: User) -> bool:
-        """Check if user can modify the project."""
-        return project.owner == user
+        """Check if user can modify the project without loading the owner."""
+        return project.owner_id == user.pk
 
     def _has_active_tasks(self, project: Project) -> bool:
         """Check if project has active tasks."""
@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.conf import settings
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from project.repositories import ProjectRepository
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def delete_user_projects(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Delete a user's projects and tasks from their shard with them."""
+    ProjectRepository().delete_user_projects(instance)
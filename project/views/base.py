@@ -2,6 +2,7 @@
 
 from typing import Any, Dict
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.utils.functional import SimpleLazyObject
 from project.services import ProjectService
 
 
@@ -13,8 +14,15 @@ class ProjectBaseView(LoginRequiredMixin):
         self.project_service: ProjectService = ProjectService()
     
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
-        """Add common context data for project views."""
+        """Add common context data for project views.
+
+        ``project_stats`` is lazy: the aggregate query only runs if a
+        template actually reads it.
+        """
         context: Dict[str, Any] = super().get_context_data(**kwargs)
         if hasattr(self.request, 'user') and self.request.user.is_authenticated:
-            context['project_stats'] = self.project_service.get_project_stats(self.request.user)
+            user = self.request.user
+            context['project_stats'] = SimpleLazyObject(
+                lambda: self.project_service.get_project_stats(user)
+            )
         return context
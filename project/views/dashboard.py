@@ -2,35 +2,62 @@ from typing import Any, Dict
 from django.db.models.query import QuerySet
 from django.views.generic import ListView
 
+from core.mixins.views import KeysetPaginationMixin
+from core.pagination import KeysetPage, KeysetPaginator
+from project.constants import DEFAULT_PROJECTS_PER_PAGE
 from project.models import Project
 from project.views.base import ProjectBaseView
 
 
-class DashboardView(ProjectBaseView, ListView):  # type: ignore
+class DashboardView(
+    ProjectBaseView,
+    KeysetPaginationMixin,
+    ListView  # type: ignore
+):
     """
     View for displaying a paginated list of projects on the dashboard.
 
     Inherits from:
         ProjectBaseView: Provides common project functionality
+        KeysetPaginationMixin: Provides cursor-based pagination
         ListView: Provides pagination and list display functionality
 
     Attributes:
         model: Project model used for queryset
         template_name: Template used for rendering the view
+        page_template_name: Template for HTMX infinite-scroll pages
         context_object_name: Name used for the project list in template context
         paginate_by: Number of projects displayed per page
+        keyset_ordering: Unique ordering the cursor is keyed on
 
     """
 
     model = Project
     template_name = 'project/dashboard.html'
+    page_template_name = 'project/project_page.html'
     context_object_name = 'projects'
 
-    paginate_by = 10
+    paginate_by = DEFAULT_PROJECTS_PER_PAGE
+    keyset_ordering = ('-created_at', '-id')
 
     def get_queryset(self) -> QuerySet[Project]:
-        """Returns projects for the current user."""
-        return Project.objects.for_user(
+        """Returns projects for the current user with tasks prefetched."""
+        return self.project_service.get_dashboard_projects(
             self.request.user
         )
 
+    def get_keyset_page(
+            self,
+            paginator: KeysetPaginator[Project],
+            cursor: str | None
+    ) -> KeysetPage[Project]:
+        """Serve pages from the user's dashboard cache."""
+        return self.project_service.get_cached_dashboard_page(
+            self.request.user, paginator, cursor
+        )
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """Attach the first page of tasks to every project on the page."""
+        context: Dict[str, Any] = super().get_context_data(**kwargs)
+        self.project_service.attach_task_pages(context['projects'])
+        return context
@@ -4,13 +4,14 @@ from django.views.generic import DeleteView
 from django.http import HttpResponse
 from django.core.exceptions import ValidationError
 
-from core.mixins.views import HTMXDeleteMixin
+from core.mixins.views import HTMXDeleteMixin, OwnedObjectMixin
 from project.models import Project
 from project.services import ProjectService
 
 
 class ProjectDeleteView(
     LoginRequiredMixin,
+    OwnedObjectMixin[Project],
     HTMXDeleteMixin,
     DeleteView  # type: ignore
 ):
@@ -18,6 +19,7 @@ class ProjectDeleteView(
 
     Inherits from:
         LoginRequiredMixin: Ensures user authentication
+        OwnedObjectMixin: Loads the user's project once per request
         HTMXDeleteMixin: Handles HTMX-specific delete responses
         DeleteView: Provides base deletion functionality
 
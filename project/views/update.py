@@ -1,12 +1,11 @@
 from typing import Any, Dict
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import QuerySet
 from django.http import HttpResponse
 from django.template.loader import render_to_string
 from django.views.generic import UpdateView
 from django.core.exceptions import ValidationError
 
-from core.mixins.views import HTMXResponseMixin
+from core.mixins.views import HTMXResponseMixin, OwnedObjectMixin
 from project.forms import EditForm
 from project.models import Project
 from project.services import ProjectService
@@ -14,6 +13,7 @@ from project.services import ProjectService
 
 class ProjectUpdateView(
     LoginRequiredMixin,
+    OwnedObjectMixin[Project],
     HTMXResponseMixin[Project],
     UpdateView  # type: ignore
 ):
@@ -21,6 +21,7 @@ class ProjectUpdateView(
 
     Inherits from:
         LoginRequiredMixin: Ensures user authentication
+        OwnedObjectMixin: Loads the user's project once per request
         HTMXResponseMixin: Handles HTMX-specific responses
         UpdateView: Provides base update functionality
 
@@ -36,17 +37,6 @@ class ProjectUpdateView(
         super().__init__(*args, **kwargs)
         self.project_service: ProjectService = ProjectService()
 
-    def get_queryset(
-            self
-    ) -> QuerySet[Project]:
-        """Get queryset of projects filtered for the current user.
-
-        Returns:
-            QuerySet of Project instances that belong to the current user.
-
-        """
-        return Project.objects.for_user(self.request.user)
-
     def form_valid(self, form: Any) -> HttpResponse:
         """Process valid form submission using service layer."""
         try:
@@ -20,6 +20,12 @@ class HtmxHandlers {
     handleAfterSwap(event) {
         const target = event.target;
         
+        // Loading more tasks only appends rows, keep the user's input
+        if (event.detail.elt && event.detail.elt.classList.contains('load-more-tasks-btn')) {
+            this.reinitializeDashboardManager();
+            return;
+        }
+
         // Check if the swapped element is a tasks container
         if (target.id && target.id.startsWith('tasks-container-')) {
             this.cleanupTasksContainer(target);
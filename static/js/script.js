@@ -27,6 +27,7 @@ class DashboardManager {
     bindEvents() {
         document.addEventListener('click', this.handleClick.bind(this));
         document.addEventListener('change', this.handleChange.bind(this));
+        document.addEventListener('paste', this.handlePaste.bind(this));
         document.addEventListener('htmx:afterRequest', this.handleHtmxResponse.bind(this));
         document.addEventListener('htmx:afterSwap', this.handleHtmxAfterSwap.bind(this));
         document.addEventListener('htmx:load', this.handleHtmxLoad.bind(this));
@@ -50,6 +51,66 @@ class DashboardManager {
         }
     }
 
+    handlePaste(e) {
+        const input = e.target;
+        if (!input.dataset || !input.dataset.batchUrl) {
+            return;
+        }
+
+        const text = (e.clipboardData || window.clipboardData).getData('text');
+        if (!text.includes('\n')) {
+            return;
+        }
+
+        // Pasted lists become one task per line in a single request
+        e.preventDefault();
+        const projectId = input.closest('[data-project-id]').dataset.projectId;
+
+        fetch(input.dataset.batchUrl, {
+            method: 'POST',
+            headers: { 'X-CSRFToken': this.getCsrfToken() },
+            body: new URLSearchParams({ [input.name]: text }),
+        }).then(response => response.text().then(content => {
+            if (!response.ok) {
+                // Nothing was created: keep the pasted text to fix it,
+                // joined into one line like a plain paste would do
+                input.value = text.replace(/\r?\n/g, ' ').trim();
+                this.showInputError(input, content);
+                return;
+            }
+            this.clearInputError(input);
+            const container = document.getElementById(`tasks-container-${projectId}`);
+            container.insertAdjacentHTML('beforeend', content);
+            htmx.process(container);
+            this.initSortableLists();
+            this.rebindEventHandlers();
+            handleTaskCreateSuccess(projectId);
+        })).catch(error => {
+            console.error('Error creating tasks:', error);
+        });
+    }
+
+    showInputError(input, message) {
+        input.classList.add('is-invalid');
+        let feedback = input.parentElement.querySelector('.invalid-feedback');
+        if (!feedback) {
+            feedback = document.createElement('div');
+            feedback.className = 'invalid-feedback';
+            feedback.style.whiteSpace = 'pre-line';
+            input.insertAdjacentElement('afterend', feedback);
+            input.addEventListener('input', () => this.clearInputError(input), { once: true });
+        }
+        feedback.textContent = message;
+    }
+
+    clearInputError(input) {
+        input.classList.remove('is-invalid');
+        const feedback = input.parentElement.querySelector('.invalid-feedback');
+        if (feedback) {
+            feedback.remove();
+        }
+    }
+
     handleTaskToggle(e) {
         const taskId = e.target.dataset.taskId;
         const isCompleted = e.target.checked;
@@ -418,8 +479,8 @@ class DashboardManager {
             list.insertBefore(this.dragSrcEl, afterElement);
         }
 
-        // Persist the new order
-        this.persistOrder(list);
+        // Persist the new position
+        this.persistOrder(list, this.dragSrcEl);
     }
 
     getDragAfterElement(container, y) {
@@ -440,26 +501,40 @@ class DashboardManager {
         }, { offset: Number.NEGATIVE_INFINITY }).element;
     }
 
-    persistOrder(list) {
-        const projectId = list.closest('.todo-list-project').dataset.projectId;
-        const order = Array.from(list.querySelectorAll('.row[data-task-id]'))
-            .map((row, index) => ({ id: row.dataset.taskId, position: index + 1 }));
+    persistOrder(list, row) {
+        const project = list.closest('.todo-list-project');
+        const taskId = row.dataset.taskId;
+        const rows = Array.from(list.querySelectorAll('.row[data-task-id]'));
+        const index = rows.indexOf(row);
+        const after = index > 0 ? rows[index - 1].dataset.taskId : null;
+        const before = index < rows.length - 1 ? rows[index + 1].dataset.taskId : null;
+
+        if (after === null && before === null) {
+            return;
+        }
 
-        console.log('Persisting order for project:', projectId, 'Order:', order);
+        console.log('Moving task:', taskId, 'after:', after, 'before:', before);
 
-        fetch(`/tasks/reorder/`, {
+        fetch(`/tasks/${taskId}/move/`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
                 'X-CSRFToken': this.getCsrfToken(),
             },
-            body: JSON.stringify({ projectId, order })
+            body: JSON.stringify({ after, before, version: project.dataset.orderVersion })
         }).then(response => {
             if (response.ok) {
-                console.log('Order saved successfully');
-            } else {
-                console.error('Error saving order:', response.status, response.statusText);
+                return response.json().then(data => {
+                    project.dataset.orderVersion = data.version;
+                    console.log('Order saved successfully');
+                });
+            }
+            if (response.status === 409) {
+                // The list is outdated, reload it to show the current order
+                window.location.reload();
+                return;
             }
+            console.error('Error saving order:', response.status, response.statusText);
         }).catch(error => {
             console.error('Error saving task order:', error);
         });
@@ -5,4 +5,26 @@ from task.models import Task
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
-    pass
+    """
+    Admin configuration for the Task model.
+
+    Defines list display, filtering and search for managing tasks in the
+    Django admin interface. Tasks keep the model's rank ordering.
+    """
+
+    list_display = (
+        'text',
+        'project',
+        'priority',
+        'completed',
+    )
+    list_filter = (
+        'completed',
+        'project',
+    )
+    search_fields = (
+        'text',
+        'project__title',
+    )
+    # The project's string representation shows its owner's email
+    list_select_related = ('project__owner',)
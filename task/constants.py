@@ -7,9 +7,26 @@ TASK_TEXT_MAX_LENGTH = 64
 TASK_PRIORITY_MIN = 1
 TASK_PRIORITY_MAX = 1000
 
+# Sparse ranking: after a rebalance neighbouring tasks are TASK_RANK_GAP
+# apart, so a task can be moved between two neighbours by writing only
+# its own priority (the midpoint) until the gap is used up.
+TASK_RANK_GAP = 1024
+TASK_RANK_MIN_GAP = 2
+TASK_RANK_MAX = 2_147_483_647
+# User priorities (TASK_PRIORITY_MIN..TASK_PRIORITY_MAX) are stored as
+# ranks: priority N lands right before the Nth task of an evenly ranked
+# list, so it interleaves with appended tasks.
+
+# Batch creation
+MAX_TASKS_PER_BATCH = 100
+
+# Bulk operations
+MAX_TASKS_PER_BULK = 500
+
 # Pagination
 DEFAULT_TASKS_PER_PAGE = 20
 MAX_TASKS_PER_PAGE = 100
+TASK_ORDERING = ('priority', 'id')
 
 # Search
 MIN_SEARCH_QUERY_LENGTH = 1
@@ -26,3 +43,9 @@ ERROR_PROJECT_NOT_FOUND = "Project not found."
 ERROR_TASK_PRIORITY_INVALID = f"Task priority must be between {TASK_PRIORITY_MIN} and {TASK_PRIORITY_MAX}."
 ERROR_TASK_REORDER_FAILED = "Failed to reorder tasks."
 ERROR_TASK_TOGGLE_FAILED = "Failed to toggle task completion status."
+ERROR_TASK_MOVE_INVALID = "A task can only be moved next to another task of the same project."
+ERROR_TASK_BATCH_TOO_LARGE = f"At most {MAX_TASKS_PER_BATCH} tasks can be created at once."
+ERROR_TASK_BATCH_LINE = "Line {line}: {error}"
+ERROR_TASK_BULK_NO_SELECTION = "Select at least one task."
+ERROR_TASK_BULK_TOO_LARGE = f"At most {MAX_TASKS_PER_BULK} tasks can be changed at once."
+ERROR_TASK_BULK_SAME_PROJECT = "Tasks are already in this project."
@@ -1,9 +1,27 @@
 from django import forms
+from django.utils.translation import gettext_lazy as _
+
+from task.constants import TASK_PRIORITY_MAX, TASK_PRIORITY_MIN
 from task.models import Task
 
 
 class TaskForm(forms.ModelForm):
-    """Form for creating and editing tasks."""
+    """Form for creating and editing tasks.
+
+    ``priority`` is the user's priority, not the stored rank, so it is
+    bounded like the service validates it and defaults to the first.
+    """
+
+    priority = forms.IntegerField(
+        label=_('Priority'),
+        help_text=_('Enter the task priority'),
+        min_value=TASK_PRIORITY_MIN,
+        max_value=TASK_PRIORITY_MAX,
+        required=False,
+        widget=forms.NumberInput(attrs={
+            'class': 'form-control'
+        })
+    )
 
     class Meta:
         model = Task
@@ -13,9 +31,6 @@ class TaskForm(forms.ModelForm):
                 'class': 'form-control',
                 'placeholder': 'Enter task description...',
                 'maxlength': '32'
-            }),
-            'priority': forms.Select(attrs={
-                'class': 'form-select'
             })
         }
 
@@ -26,6 +41,11 @@ class TaskForm(forms.ModelForm):
             raise forms.ValidationError('Task description cannot be empty.')
         return text.strip()
 
+    def clean_priority(self):
+        """Default a missing priority to the first one."""
+        priority = self.cleaned_data.get('priority')
+        return TASK_PRIORITY_MIN if priority is None else priority
+
 
 class TaskEditForm(forms.ModelForm):
     """Form for inline editing of task text."""
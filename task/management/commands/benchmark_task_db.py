@@ -0,0 +1,125 @@
+import multiprocessing
+import time
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.base import SessionBase, UpdateError
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import OperationalError, connections
+
+from project.repositories import ProjectRepository
+from task.repositories import TaskRepository
+
+BENCHMARK_USERNAME = 'task-db-benchmark'
+
+
+class Command(BaseCommand):
+    """Measure task read and write throughput under concurrency."""
+
+    help = (
+        'Run concurrent task list readers and task writers against the '
+        'configured database and report throughput and lock errors. '
+        'Creates a throwaway user and removes it afterwards.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            '--seconds',
+            type=float,
+            default=10.0,
+            help='How long to run the workload.',
+        )
+        parser.add_argument(
+            '--readers',
+            type=int,
+            default=4,
+            help='Number of processes listing tasks.',
+        )
+        parser.add_argument(
+            '--sessions',
+            action='store_true',
+            help='Also save a session with every write, like a request '
+                 'of a logged-in user.',
+        )
+        parser.add_argument(
+            '--writers',
+            type=int,
+            default=2,
+            help='Number of processes creating and toggling tasks.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the benchmark."""
+        User = get_user_model()
+        User.objects.filter(username=BENCHMARK_USERNAME).delete()
+        user = User.objects.create_user(username=BENCHMARK_USERNAME)
+        project = ProjectRepository().create_project('Benchmark', user)
+        TaskRepository().create_tasks(
+            [f'Task {i}' for i in range(50)], project.id, user
+        )
+
+        # Separate processes, like web workers, so the database and not
+        # the GIL decides how much work runs concurrently
+        context = multiprocessing.get_context('fork')
+        counts = {
+            name: context.Value('i', 0)
+            for name in ('reads', 'writes', 'errors')
+        }
+        deadline = time.monotonic() + options['seconds']
+        connections.close_all()
+
+        session_store = import_module(settings.SESSION_ENGINE).SessionStore
+
+        def run(
+                operation: Callable[[TaskRepository, SessionBase], Any],
+                counter: str
+        ) -> None:
+            repository = TaskRepository()
+            session = session_store()
+            while time.monotonic() < deadline:
+                try:
+                    operation(repository, session)
+                except (OperationalError, UpdateError):
+                    key = 'errors'
+                else:
+                    key = counter
+                with counts[key].get_lock():
+                    counts[key].value += 1
+            if session.session_key:
+                session.delete()
+            connections.close_all()
+
+        def read(repository: TaskRepository, session: SessionBase) -> None:
+            list(repository.get_project_tasks(project.id, user))
+
+        def write(repository: TaskRepository, session: SessionBase) -> None:
+            task = repository.create_task('Benchmark', project.id, user)
+            repository.toggle_task_completion(task.id, user, True)
+            if options['sessions']:
+                session['last_task'] = task.id
+                session.save()
+
+        workers = [
+            context.Process(target=run, args=(read, 'reads'))
+            for _ in range(options['readers'])
+        ] + [
+            context.Process(target=run, args=(write, 'writes'))
+            for _ in range(options['writers'])
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        user.delete()
+
+        seconds = options['seconds']
+        self.stdout.write(
+            f"Reads:  {counts['reads'].value / seconds:.0f}/s\n"
+            f"Writes: {counts['writes'].value / seconds:.0f}/s\n"
+            f"Errors: {counts['errors'].value}"
+        )
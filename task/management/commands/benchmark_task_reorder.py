@@ -0,0 +1,108 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections, router
+from django.test.utils import CaptureQueriesContext
+
+from core.sharding import get_shard, use_shard
+from project.repositories import ProjectRepository
+from task.models import Task
+from task.repositories import TaskRepository
+
+BENCHMARK_USERNAME = 'task-reorder-benchmark'
+
+
+class Command(BaseCommand):
+    """Measure how task reordering scales with the size of the list."""
+
+    help = (
+        'Reverse task lists of growing size with TaskRepository.'
+        'reorder_tasks and with a bulk_update CASE WHEN baseline, and '
+        'report the best time and query count of each. Creates a '
+        'throwaway user and removes it afterwards.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[10, 100, 500, 1000],
+            help='Numbers of tasks to reorder.',
+        )
+        parser.add_argument(
+            '--rounds',
+            type=int,
+            default=5,
+            help='Runs per size; the fastest one is reported.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the benchmark."""
+        User = get_user_model()
+        User.objects.filter(username=BENCHMARK_USERNAME).delete()
+        user = User.objects.create_user(username=BENCHMARK_USERNAME)
+        project_repository = ProjectRepository()
+        task_repository = TaskRepository()
+
+        self.stdout.write(
+            f"{'Tasks':>6} {'reorder_tasks':>14} {'queries':>8} "
+            f"{'bulk_update':>12} {'queries':>8}"
+        )
+        for size in options['sizes']:
+            project = project_repository.create_project(
+                f'Reorder benchmark {size}', user
+            )
+            tasks = task_repository.create_tasks(
+                [f'Task {i}' for i in range(size)], project.id, user
+            )
+
+            def reorder(rank: int, tasks: list[Task] = tasks) -> None:
+                task_repository.reorder_tasks([
+                    {'id': task.id, 'position': (len(tasks) - index) * rank}
+                    for index, task in enumerate(tasks)
+                ], user)
+
+            def bulk_update(rank: int, tasks: list[Task] = tasks) -> None:
+                for index, task in enumerate(tasks):
+                    task.priority = (len(tasks) - index) * rank
+                Task.objects.bulk_update(tasks, ['priority'])
+
+            reorder_time, reorder_queries = self._measure(
+                reorder, user, options['rounds']
+            )
+            bulk_time, bulk_queries = self._measure(
+                bulk_update, user, options['rounds']
+            )
+            self.stdout.write(
+                f'{size:>6} {reorder_time * 1000:>11.2f} ms '
+                f'{reorder_queries:>8} {bulk_time * 1000:>9.2f} ms '
+                f'{bulk_queries:>8}'
+            )
+            project_repository.delete_project(project.id, user)
+
+        user.delete()
+
+    @staticmethod
+    def _measure(
+            operation: Callable[[int], None],
+            user: Any,
+            rounds: int
+    ) -> tuple[float, int]:
+        """Best time in seconds and query count of ``operation``.
+
+        Each round writes different ranks, so no round is a no-op.
+        """
+        best = float('inf')
+        with use_shard(get_shard(user.pk)):
+            connection = connections[router.db_for_write(Task)]
+            for rank in range(1, rounds + 1):
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    operation(rank)
+                    best = min(best, time.perf_counter() - start)
+        return best, len(queries)
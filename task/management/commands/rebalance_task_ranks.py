@@ -0,0 +1,62 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.sharding import get_shards, use_shard
+from task.constants import TASK_RANK_MIN_GAP
+from task.repositories import TaskRepository
+
+
+class Command(BaseCommand):
+    """Spread out task ranks in projects where they got too dense."""
+
+    help = (
+        'Rebalance task ranks so that neighbouring tasks are far enough '
+        'apart for moves to write a single row. Meant to run periodically.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            '--project',
+            type=int,
+            action='append',
+            dest='project_ids',
+            help='Rebalance this project ID regardless of density '
+                 '(can be repeated).',
+        )
+        parser.add_argument(
+            '--min-gap',
+            type=int,
+            default=TASK_RANK_MIN_GAP,
+            help='Rebalance projects with neighbours closer than this.',
+        )
+        parser.add_argument(
+            '--shard',
+            choices=get_shards(),
+            action='append',
+            dest='shards',
+            help='Only rebalance projects on this database shard '
+                 '(can be repeated).',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the rebalancing."""
+        repository = TaskRepository()
+        total = 0
+        for shard in options['shards'] or get_shards():
+            with use_shard(shard):
+                project_ids = options['project_ids'] or \
+                    repository.get_dense_project_ids(options['min_gap'])
+
+                for project_id in project_ids:
+                    count = repository.rebalance_project_tasks(project_id)
+                    self.stdout.write(
+                        f'Rebalanced {count} task(s) in project '
+                        f'{project_id} on {shard}.'
+                    )
+            total += len(project_ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebalanced {total} project(s).')
+        )
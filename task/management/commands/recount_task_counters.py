@@ -0,0 +1,45 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.sharding import get_shards, use_shard
+from task.repositories import TaskRepository
+
+
+class Command(BaseCommand):
+    """Recompute the denormalized task counters stored on projects."""
+
+    help = (
+        'Recompute task_count and completed_count for projects from the '
+        'tasks table to repair drift.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command line arguments."""
+        parser.add_argument(
+            '--project',
+            type=int,
+            action='append',
+            dest='project_ids',
+            help='Only recount this project ID (can be repeated).',
+        )
+        parser.add_argument(
+            '--shard',
+            choices=get_shards(),
+            action='append',
+            dest='shards',
+            help='Only recount projects on this database shard '
+                 '(can be repeated).',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the recount."""
+        updated = 0
+        for shard in options['shards'] or get_shards():
+            with use_shard(shard):
+                updated += TaskRepository().refresh_task_counters(
+                    options['project_ids']
+                )
+        self.stdout.write(
+            self.style.SUCCESS(f'Recounted tasks for {updated} project(s).')
+        )
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:38
+
+from django.db import migrations, models
+
+RANK_GAP = 1024
+
+
+def spread_priorities(apps, schema_editor):
+    """Convert contiguous priorities into ranks RANK_GAP apart."""
+    Task = apps.get_model('task', 'Task')
+
+    tasks = Task.objects.using(
+        schema_editor.connection.alias
+    ).order_by('project_id', 'priority', 'id').only('id', 'project_id')
+
+    updated = []
+    project_id = None
+    position = 0
+    for task in tasks.iterator():
+        if task.project_id != project_id:
+            project_id = task.project_id
+            position = 0
+        position += 1
+        task.priority = position * RANK_GAP
+        updated.append(task)
+
+    Task.objects.using(schema_editor.connection.alias).bulk_update(
+        updated, ['priority'], batch_size=500
+    )
+
+
+def compact_priorities(apps, schema_editor):
+    """Convert ranks back into contiguous 1-based priorities."""
+    Task = apps.get_model('task', 'Task')
+
+    tasks = Task.objects.using(
+        schema_editor.connection.alias
+    ).order_by('project_id', 'priority', 'id').only('id', 'project_id')
+
+    updated = []
+    project_id = None
+    position = 0
+    for task in tasks.iterator():
+        if task.project_id != project_id:
+            project_id = task.project_id
+            position = 0
+        position += 1
+        task.priority = position
+        updated.append(task)
+
+    Task.objects.using(schema_editor.connection.alias).bulk_update(
+        updated, ['priority'], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0002_alter_task_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='priority',
+            field=models.PositiveIntegerField(default=1, help_text='Enter the task priority', verbose_name='Priority'),
+        ),
+        migrations.RunPython(spread_priorities, compact_priorities),
+    ]
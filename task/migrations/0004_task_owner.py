@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_task_owner(apps, schema_editor):
+    Project = apps.get_model('project', 'Project')
+    Task = apps.get_model('task', 'Task')
+
+    Task.objects.using(schema_editor.connection.alias).update(
+        owner_id=Subquery(
+            Project.objects.filter(pk=OuterRef('project_id')).values('owner_id')
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_next_task_priority'),
+        ('task', '0003_sparse_task_ranks'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='owner',
+            field=models.ForeignKey(db_index=False, editable=False, help_text="Owner of the task's project", null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to=settings.AUTH_USER_MODEL, verbose_name='Owner'),
+        ),
+        migrations.RunPython(backfill_task_owner, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='task',
+            name='owner',
+            field=models.ForeignKey(db_index=False, editable=False, help_text="Owner of the task's project", on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to=settings.AUTH_USER_MODEL, verbose_name='Owner'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'project', 'priority'], name='tasks_owner_project_prio_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0004_task_owner'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'priority', 'id'], name='tasks_project_prio_id_idx'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='project',
+            field=models.ForeignKey(db_index=False, help_text='Select the project', on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='project.project', verbose_name='Project'),
+        ),
+    ]
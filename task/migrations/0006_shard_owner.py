@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0005_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='owner',
+            field=models.ForeignKey(db_constraint=False, db_index=False, editable=False, help_text="Owner of the task's project", on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to=settings.AUTH_USER_MODEL, verbose_name='Owner'),
+        ),
+    ]
@@ -1,6 +1,22 @@
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core.sharding import ShardedManager, on_shard
+
+
+class TaskManager(ShardedManager):  # type: ignore
+    """
+    Custom manager for a Task model providing user-specific queries.
+
+    Ownership is proven by filtering on the task's own owner_id column,
+    without joining or loading the project or the user.
+    """
+
+    def for_user(self, user) -> models.QuerySet:  # type: ignore
+        """Returns tasks in projects of the given user."""
+        return on_shard(self.filter(owner=user), user.pk)
+
 
 class Task(models.Model):
     text = models.CharField(
@@ -8,7 +24,7 @@ class Task(models.Model):
         verbose_name=_('Text'),
         help_text=_('Enter the task description'),
     )
-    priority = models.PositiveSmallIntegerField(
+    priority = models.PositiveIntegerField(
         verbose_name=_('Priority'),
         help_text=_('Enter the task priority'),
         default=1
@@ -23,14 +39,43 @@ class Task(models.Model):
         verbose_name=_('Project'),
         help_text=_('Select the project'),
         on_delete=models.CASCADE,
-        related_name='tasks'
+        related_name='tasks',
+        db_index=False,
+    )
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_('Owner'),
+        help_text=_('Owner of the task\'s project'),
+        on_delete=models.CASCADE,
+        related_name='tasks',
+        editable=False,
+        db_index=False,
+        # Users live in the default database only, not on every shard
+        db_constraint=False,
     )
+    objects = TaskManager()
 
     class Meta:
         db_table = 'tasks'
         verbose_name = _('Task')
         verbose_name_plural = _('Tasks')
         ordering = ['priority', 'id']
+        indexes = [
+            models.Index(
+                fields=['owner', 'project', 'priority'],
+                name='tasks_owner_project_prio_idx'
+            ),
+            models.Index(
+                fields=['project', 'priority', 'id'],
+                name='tasks_project_prio_id_idx'
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.text
+
+    def save(self, *args, **kwargs) -> None:  # type: ignore
+        """Copy the owner from the project when it is not set yet."""
+        if self.owner_id is None and self.project_id is not None:
+            self.owner_id = self.project.owner_id
+        super().save(*args, **kwargs)
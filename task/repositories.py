@@ -1,7 +1,37 @@
-from typing import Optional, List, TYPE_CHECKING
-from django.db.models import QuerySet, Max
+from typing import Dict, Iterable, Optional, List, Tuple, Union, TYPE_CHECKING
+from django.db import connections, models, router
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import (
+    Count,
+    F,
+    Max,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Window,
+)
+from django.db.models.functions import Coalesce, Greatest, Lag
 from django.contrib.auth import get_user_model
 
+from core import unit_of_work
+from core.pagination import KeysetPage, KeysetPaginator
+from core.cache import (
+    invalidate_all,
+    invalidate_user,
+    invalidates_user_cache,
+)
+from core.routers import replica_reads
+from core.sharding import owner_shard
+from core.transactions import write_transaction
+from task.constants import (
+    DEFAULT_TASKS_PER_PAGE,
+    TASK_ORDERING,
+    TASK_RANK_GAP,
+    TASK_RANK_MAX,
+    TASK_RANK_MIN_GAP,
+)
+from task.exceptions import TaskConflictError
 from task.models import Task
 from project.models import Project
 
@@ -13,39 +43,68 @@ else:
 
 
 class TaskRepository:
-    """Repository for managing Task data access operations."""
+    """Repository for managing Task data access operations.
+
+    Methods taking a user run on the database shard of that user.
+    """
 
     def __init__(self) -> None:
         self.model = Task
 
+    @owner_shard
     def get_project_tasks(
             self,
             project_id: int,
             user: User,
             limit: Optional[int] = None
     ) -> QuerySet[Task]:
-        """Get tasks for a specific project."""
-        queryset: QuerySet[Task] = self.model.objects.filter(
-            project_id=project_id,
-            project__owner=user
-        ).order_by('-priority')
+        """Get tasks for a specific project, for display.
+
+        May be read from the replica.
+        """
+        queryset: QuerySet[Task] = replica_reads(
+            self.model.objects.for_user(user)
+        ).filter(project_id=project_id).order_by(*TASK_ORDERING)
 
         if limit:
             queryset = queryset[:limit]
 
         return queryset
 
+    @owner_shard
+    def get_project_tasks_page(
+            self,
+            project_id: int,
+            user: User,
+            cursor: Optional[str] = None,
+            per_page: int = DEFAULT_TASKS_PER_PAGE
+    ) -> KeysetPage[Task]:
+        """Get one page of a project's tasks, keyed on (priority, id)."""
+        return KeysetPaginator(
+            self.get_project_tasks(project_id, user),
+            per_page,
+            TASK_ORDERING
+        ).get_page(cursor)
+
+    @owner_shard
     def get_task_by_id(
             self,
             task_id: int,
             user: User
     ) -> Task:
-        """Get a specific task by ID for a user."""
-        return self.model.objects.filter(
-            id=task_id,
-            project__owner=user
-        ).get()
+        """Get a specific task by ID for a user.
+
+        Within a request the task is loaded at most once.
+        """
+        return unit_of_work.load(
+            self.model.objects.for_user(user),
+            task_id,
+            scope=user.pk
+        )
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
     def create_task(
             self,
             text: str,
@@ -53,38 +112,106 @@ class TaskRepository:
             user: User,
             priority: Optional[int] = None
     ) -> Task:
-        """Create a new task."""
-        project = Project.objects.filter(id=project_id, owner=user).get()
-        
-        if priority is None:
-            # Get the highest priority and add 1
-            max_priority = self.model.objects.filter(
-                project=project
-            ).aggregate(Max('priority'))['priority__max'] or 0
-            priority = max_priority + 1
+        """Create a new task.
+
+        Without an explicit priority the task is appended to the end of
+        the project. Its priority is taken from the project's
+        next_task_priority counter, which is advanced in the same
+        transaction as the insert.
+
+        Raises:
+            Project.DoesNotExist: If the user has no such project.
 
-        return self.model.objects.create(
+        """
+        priority = self._reserve_task_priorities(
+            project_id, user, count=1, priority=priority
+        )
+        task: Task = self.model.objects.create(
             text=text,
-            project=project,
+            project_id=project_id,
+            owner_id=user.pk,
             priority=priority
         )
+        return task
+
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
+    def create_tasks(
+            self,
+            texts: List[str],
+            project_id: int,
+            user: User
+    ) -> List[Task]:
+        """Append several tasks to a project with one INSERT.
+
+        The tasks get consecutive ranks reserved from the project's
+        next_task_priority counter in the same transaction.
+
+        Raises:
+            Project.DoesNotExist: If the user has no such project.
+
+        """
+        if not texts:
+            return []
+
+        first_priority = self._reserve_task_priorities(
+            project_id, user, count=len(texts)
+        )
+        return self.model.objects.bulk_create([
+            self.model(
+                text=text,
+                project_id=project_id,
+                owner_id=user.pk,
+                priority=first_priority + index * TASK_RANK_GAP
+            )
+            for index, text in enumerate(texts)
+        ])
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
     def update_task(
             self,
             task_id: int,
             user: User,
             **kwargs
     ) -> Task:
-        """Update an existing task."""
+        """Update an existing task.
+
+        Plain field edits go through the request's unit of work and are
+        written before the transaction commits. Completion is written
+        right away by a conditional UPDATE, like a toggle, so the
+        project's counters only shift when the row really changed, even
+        if the task was loaded before a concurrent toggle.
+        """
         task: Task = self.get_task_by_id(task_id, user)
-        
-        for field, value in kwargs.items():
-            if hasattr(task, field):
-                setattr(task, field, value)
-        
-        task.save()
+
+        fields = [
+            field for field in kwargs
+            if hasattr(task, field) and field != 'completed'
+        ]
+        for field in fields:
+            setattr(task, field, kwargs[field])
+        if fields:
+            unit_of_work.save(task, fields)
+
+        if 'completed' in kwargs:
+            completed = bool(kwargs['completed'])
+            changed = self.model.objects.filter(
+                pk=task.pk, completed=not completed
+            ).update(completed=completed)
+            if changed:
+                self._adjust_task_counters(
+                    task.project_id,
+                    completed=1 if completed else -1
+                )
+            task.completed = completed
         return task
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
     def delete_task(
             self,
             task_id: int,
@@ -92,82 +219,725 @@ class TaskRepository:
     ) -> bool:
         """Delete a task."""
         task: Task = self.get_task_by_id(task_id, user)
-        task.delete()
+        unit_of_work.delete(task)
+        self._adjust_task_counters(
+            task.project_id,
+            total=-1,
+            completed=-1 if task.completed else 0
+        )
         return True
 
+    @owner_shard
     def task_exists(
             self,
             task_id: int,
             user: User
     ) -> bool:
         """Check if a task exists for a user."""
-        return self.model.objects.filter(
-            id=task_id,
-            project__owner=user
-        ).exists()
+        return self.model.objects.for_user(user).filter(id=task_id).exists()
 
+    @owner_shard
     def get_project_max_priority(
             self,
             project_id: int,
             user: User
     ) -> int:
         """Get the maximum priority for tasks in a project."""
-        max_priority = self.model.objects.filter(
-            project_id=project_id,
-            project__owner=user
+        max_priority = self.model.objects.for_user(user).filter(
+            project_id=project_id
         ).aggregate(Max('priority'))['priority__max']
         return max_priority or 0
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
     def reorder_tasks(
             self,
             order_data: List[dict],
             user: User
     ) -> bool:
-        """Reorder tasks based on provided order data."""
+        """Reorder tasks based on provided order data.
+
+        Position N is stored as the rank the Nth task has after a
+        rebalance, so a partial reorder sorts among the untouched tasks
+        and leaves gaps for later moves. The referenced IDs are checked
+        for ownership in one query and all ranks are written by one
+        prepared UPDATE inside a single transaction, so the number of
+        queries does not grow with the list size. Items with a missing
+        or invalid id/position, or pointing at tasks the user does not
+        own, are skipped.
+        """
+        ranks: Dict[int, int] = {}
         for item in order_data:
             task_id = item.get('id')
             position = item.get('position')
 
             if task_id and position is not None:
                 try:
-                    task = self.get_task_by_id(task_id, user)
-                    task.priority = int(position)
-                    task.save(update_fields=['priority'])
-                except (ValueError, self.model.DoesNotExist):
+                    rank = int(position) * TASK_RANK_GAP
+                    task_id = int(task_id)
+                except (TypeError, ValueError):
                     continue
+                if 0 < rank <= TASK_RANK_MAX:
+                    ranks[task_id] = rank
+
+        if not ranks:
+            return True
+
+        owned = list(self.model.objects.for_user(user).filter(
+            id__in=ranks.keys()
+        ).values_list('id', 'project_id'))
+        self._bulk_update_priorities(
+            [(ranks[task_id], task_id) for task_id, _ in owned]
+        )
+        Project.objects.filter(
+            pk__in={project_id for _, project_id in owned}
+        ).update(
+            task_order_version=F('task_order_version') + 1,
+            next_task_priority=Greatest(
+                F('next_task_priority'),
+                max(ranks.values()) + TASK_RANK_GAP
+            )
+        )
 
         return True
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
+    def move_task(
+            self,
+            task_id: int,
+            user: User,
+            after_id: Optional[int] = None,
+            before_id: Optional[int] = None,
+            version: Optional[int] = None
+    ) -> Tuple[Task, int]:
+        """Move a task next to another task, writing only the moved task.
+
+        The task lands right after ``after_id`` or, when only
+        ``before_id`` is given, right before it. Its new priority is the
+        midpoint between the two tasks around that slot. When they are
+        too close to leave a gap, the project's ranks are rebalanced
+        first.
+
+        The project's task order version is bumped with the move. When
+        ``version`` is given, the move only happens if it still matches,
+        so moves made against an outdated list are rejected.
+
+        Returns:
+            The moved task and the new task order version of its project.
+
+        Raises:
+            Task.DoesNotExist: If the task or the anchor task is not
+                found in the same project of the user.
+            TaskConflictError: If ``version`` is outdated.
+
+        """
+        task: Task = self.get_task_by_id(task_id, user)
+        lower, upper = self._get_move_slot(task, after_id, before_id)
+        priority = self._get_midpoint(lower, upper)
+        if priority is None:
+            self.rebalance_project_tasks(task.project_id)
+            lower, upper = self._get_move_slot(task, after_id, before_id)
+            priority = self._get_midpoint(lower, upper)
+
+        new_version = self._bump_task_order_version(
+            task.project_id,
+            version,
+            max_priority=priority if upper is None else None
+        )
+        self.model.objects.filter(pk=task.pk).update(priority=priority)
+
+        task.priority = priority
+        return task, new_version
+
+    @write_transaction(Task)
+    def rebalance_project_tasks(
+            self,
+            project_id: int
+    ) -> int:
+        """Spread a project's ranks TASK_RANK_GAP apart, keeping order.
+
+        The project row is locked first so no task is appended while the
+        ranks and the project's next_task_priority are rewritten.
+
+        Returns:
+            Number of tasks rewritten.
+
+        """
+        projects = Project.objects.filter(pk=project_id)
+        owner_ids = list(
+            projects.select_for_update().values_list('owner_id', flat=True)
+        )
+
+        task_ids = self.model.objects.filter(
+            project_id=project_id
+        ).order_by(*TASK_ORDERING).values_list('id', flat=True)
+
+        rows = [
+            ((position + 1) * TASK_RANK_GAP, task_id)
+            for position, task_id in enumerate(task_ids)
+        ]
+        self._bulk_update_priorities(rows)
+        projects.update(
+            next_task_priority=(len(rows) + 1) * TASK_RANK_GAP
+        )
+        for owner_id in owner_ids:
+            invalidate_user(owner_id)
+        return len(rows)
+
+    def get_dense_project_ids(
+            self,
+            min_gap: int = TASK_RANK_MIN_GAP
+    ) -> List[int]:
+        """Get projects where two neighbouring tasks are under min_gap apart.
+
+        These are the projects where a move would have no room left and
+        that the background rebalancing should spread out.
+        """
+        neighbours = self.model.objects.annotate(
+            previous_priority=Window(
+                Lag('priority'),
+                partition_by=[F('project_id')],
+                order_by=[F('priority').asc(), F('id').asc()]
+            )
+        ).filter(
+            priority__lt=F('previous_priority') + min_gap
+        ).order_by().values_list('project_id', flat=True)
+
+        return sorted(set(neighbours))
+
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
     def toggle_task_completion(
             self,
             task_id: int,
             user: User,
             completed: bool
-    ) -> Task:
-        """Toggle task completion status."""
-        task = self.get_task_by_id(task_id, user)
-        task.completed = completed
-        task.save(update_fields=['completed'])
-        return task
+    ) -> bool:
+        """Set task completion status without loading the task.
+
+        Ownership is checked by the UPDATE itself, and the project's
+        counters are adjusted through a subquery on the task's
+        project_id, so a real change costs two statements. On PostgreSQL
+        the task UPDATE ... RETURNING feeds the counter update in a
+        single statement. Only when nothing changed is the task looked
+        up, to tell "already in that state" from "not found".
+
+        Returns:
+            The new completion status.
+
+        Raises:
+            Task.DoesNotExist: If the user has no such task.
+
+        """
+        owned = self.model.objects.for_user(user).filter(pk=task_id)
+        if self._connection_for_write().vendor == 'postgresql':
+            changed = self._set_completed_returning(task_id, user, completed)
+        else:
+            changed = owned.filter(
+                completed=not completed
+            ).update(completed=completed)
+            if changed:
+                project_id = self.model.objects.filter(
+                    pk=task_id
+                ).values('project_id')
+                self._adjust_task_counters(
+                    Subquery(project_id),
+                    completed=1 if completed else -1
+                )
+
+        if not changed and not owned.exists():
+            raise self.model.DoesNotExist(
+                'Task matching query does not exist.'
+            )
+        return completed
+
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
+    def set_tasks_completed(
+            self,
+            project_id: int,
+            user: User,
+            completed: bool
+    ) -> int:
+        """Set completion of every task of a project with one UPDATE.
+
+        Returns:
+            Number of tasks whose status actually changed.
+
+        Raises:
+            Project.DoesNotExist: If the user has no such project.
+
+        """
+        tasks = self._lock_project_tasks(project_id, user)
+        changed = tasks.filter(
+            completed=not completed
+        ).update(completed=completed)
+        self._adjust_task_counters(
+            project_id,
+            completed=changed if completed else -changed
+        )
+        return changed
+
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
+    def delete_tasks(
+            self,
+            project_id: int,
+            user: User,
+            task_ids: Iterable[int]
+    ) -> List[int]:
+        """Delete the selected tasks of a project.
+
+        The selection is bounded by the caller, so the IDs of the tasks
+        actually found in the project are read before deleting them.
+
+        Returns:
+            IDs of the deleted tasks.
+
+        Raises:
+            Project.DoesNotExist: If the user has no such project.
+
+        """
+        tasks = self._lock_project_tasks(project_id, user, task_ids)
+        deleted_ids = list(tasks.values_list('id', flat=True))
+        self._delete_counted(project_id, tasks)
+        return deleted_ids
+
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
+    def delete_completed_tasks(
+            self,
+            project_id: int,
+            user: User
+    ) -> int:
+        """Delete every completed task of a project with one DELETE.
+
+        Returns:
+            Number of deleted tasks.
+
+        Raises:
+            Project.DoesNotExist: If the user has no such project.
+
+        """
+        tasks = self._lock_project_tasks(project_id, user)
+        return self._delete_counted(project_id, tasks.filter(completed=True))
 
+    @owner_shard
+    @invalidates_user_cache
+    @write_transaction(Task)
+    def move_tasks(
+            self,
+            project_id: int,
+            user: User,
+            task_ids: Iterable[int],
+            target_project_id: int
+    ) -> List[Task]:
+        """Move the selected tasks to the end of another project.
+
+        Moved tasks keep their relative order and get consecutive ranks
+        reserved from the target project's next_task_priority counter.
+
+        Returns:
+            The moved tasks, in their new order.
+
+        Raises:
+            Project.DoesNotExist: If the user owns only one of the projects.
+
+        """
+        tasks = self._lock_project_tasks(project_id, user, task_ids)
+        moved = list(tasks.order_by(*TASK_ORDERING))
+        if not moved:
+            Project.objects.filter(
+                pk=target_project_id, owner=user
+            ).values_list('pk', flat=True).get()
+            return []
+
+        first_priority = self._reserve_task_priorities(
+            target_project_id, user, count=len(moved)
+        )
+        completed = sum(task.completed for task in moved)
+        self._adjust_task_counters(
+            target_project_id, completed=completed
+        )
+        self._adjust_task_counters(
+            project_id, total=-len(moved), completed=-completed
+        )
+
+        self.model.objects.filter(
+            pk__in=[task.pk for task in moved]
+        ).update(project_id=target_project_id, owner_id=user.pk)
+        for index, task in enumerate(moved):
+            task.project_id = target_project_id
+            task.priority = first_priority + index * TASK_RANK_GAP
+        self._bulk_update_priorities(
+            [(task.priority, task.pk) for task in moved]
+        )
+        Project.objects.filter(
+            pk__in=[project_id, target_project_id]
+        ).update(task_order_version=F('task_order_version') + 1)
+        return moved
+
+    @owner_shard
     def get_task_stats(
             self,
             project_id: int,
             user: User
     ) -> dict:
-        """Get task statistics for a project."""
-        tasks = self.model.objects.filter(
-            project_id=project_id,
-            project__owner=user
-        )
+        """Get task statistics for a project.
+
+        Reads the denormalized counters kept on the project, so no task
+        rows are scanned.
+        """
+        stats = self.get_task_stats_for_projects([project_id], user)
+        return stats.get(project_id, self.build_task_stats(0, 0))
+
+    @owner_shard
+    def get_task_stats_for_projects(
+            self,
+            project_ids: Iterable[int],
+            user: User
+    ) -> Dict[int, dict]:
+        """Get task statistics for many projects in a single query.
+
+        Projects that do not exist or belong to another user are left out
+        of the result.
+        """
+        rows = Project.objects.filter(
+            id__in=list(project_ids),
+            owner=user
+        ).values_list('id', 'task_count', 'completed_count')
 
-        total_tasks = tasks.count()
-        completed_tasks = tasks.filter(completed=True).count()
-        active_tasks = total_tasks - completed_tasks
+        return {
+            project_id: self.build_task_stats(total, completed)
+            for project_id, total, completed in rows
+        }
 
+    @staticmethod
+    def build_task_stats(total_tasks: int, completed_tasks: int) -> dict:
+        """Build the task statistics dict from raw counts."""
         return {
             'total_tasks': total_tasks,
             'completed_tasks': completed_tasks,
-            'active_tasks': active_tasks,
-            'completion_rate': (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+            'active_tasks': total_tasks - completed_tasks,
+            'completion_rate': (completed_tasks * 100 / total_tasks) if total_tasks > 0 else 0
+        }
+
+    @write_transaction(Task)
+    def refresh_task_counters(
+            self,
+            project_ids: Optional[Iterable[int]] = None
+    ) -> int:
+        """Recompute task counters from the tasks table.
+
+        Used after bulk writes and to repair drift. Runs as a single
+        set-based UPDATE over the given projects, or over all projects.
+
+        Returns:
+            Number of projects updated.
+
+        """
+        counts = self.model.objects.filter(
+            project=OuterRef('pk')
+        ).order_by().values('project').annotate(
+            total=Count('pk'),
+            completed=Count('pk', filter=Q(completed=True))
+        )
+        projects = Project.objects.all()
+        if project_ids is not None:
+            projects = projects.filter(pk__in=list(project_ids))
+
+        updated = projects.update(
+            task_count=Coalesce(Subquery(counts.values('total')), 0),
+            completed_count=Coalesce(Subquery(counts.values('completed')), 0)
+        )
+        invalidate_all()
+        return updated
+
+    def _lock_project_tasks(
+            self,
+            project_id: int,
+            user: User,
+            task_ids: Optional[Iterable[int]] = None
+    ) -> QuerySet[Task]:
+        """Lock an owned project and return its (selected) tasks.
+
+        The project row lock serializes bulk changes with other writers
+        of the project's counters. Must be called inside a transaction.
+
+        Raises:
+            Project.DoesNotExist: If the user has no such project.
+
+        """
+        Project.objects.select_for_update().filter(
+            pk=project_id, owner=user
+        ).values_list('pk', flat=True).get()
+
+        tasks = self.model.objects.filter(project_id=project_id)
+        if task_ids is not None:
+            tasks = tasks.filter(pk__in=list(task_ids))
+        return tasks
+
+    def _delete_counted(
+            self,
+            project_id: int,
+            tasks: QuerySet[Task]
+    ) -> int:
+        """Delete ``tasks`` of a project and shift the project's counters.
+
+        Completed and open tasks are deleted by one statement each, so
+        the counters are adjusted from the deleted row counts without
+        loading any task.
+
+        Returns:
+            Number of deleted tasks.
+
+        """
+        completed, _ = tasks.filter(completed=True).delete()
+        active, _ = tasks.filter(completed=False).delete()
+        self._adjust_task_counters(
+            project_id, total=-(completed + active), completed=-completed
+        )
+        return completed + active
+
+    def _reserve_task_priorities(
+            self,
+            project_id: int,
+            user: User,
+            count: int,
+            priority: Optional[int] = None
+    ) -> int:
+        """Count ``count`` new tasks on a project and return their priority.
+
+        Without ``priority``, ``count`` consecutive ranks at the end of
+        the project are reserved by advancing next_task_priority, and the
+        first of them is returned. With ``priority``, the counter is only
+        moved past it. Either way the project row stays locked until the
+        surrounding transaction ends, so concurrent creates never get the
+        same rank.
+
+        Raises:
+            Project.DoesNotExist: If the user has no such project.
+
+        """
+        if priority is None:
+            next_priority = F('next_task_priority') + count * TASK_RANK_GAP
+        else:
+            next_priority = Greatest(
+                F('next_task_priority'), priority + TASK_RANK_GAP
+            )
+
+        projects = Project.objects.filter(pk=project_id, owner=user)
+        updated = projects.update(
+            task_count=F('task_count') + count,
+            next_task_priority=next_priority
+        )
+        if not updated:
+            raise Project.DoesNotExist(
+                'Project matching query does not exist.'
+            )
+
+        if priority is not None:
+            return priority
+        return projects.values_list(
+            'next_task_priority', flat=True
+        ).get() - count * TASK_RANK_GAP
+
+    def _bump_task_order_version(
+            self,
+            project_id: int,
+            expected: Optional[int] = None,
+            max_priority: Optional[int] = None
+    ) -> int:
+        """Increment a project's task order version and return the new one.
+
+        When ``max_priority`` is given, next_task_priority is moved past
+        it so that tasks appended later still land after it.
+
+        Raises:
+            TaskConflictError: If the version no longer equals ``expected``.
+
+        """
+        projects = Project.objects.filter(pk=project_id)
+        if expected is not None:
+            projects = projects.filter(task_order_version=expected)
+
+        changes = {'task_order_version': F('task_order_version') + 1}
+        if max_priority is not None:
+            changes['next_task_priority'] = Greatest(
+                F('next_task_priority'), max_priority + TASK_RANK_GAP
+            )
+        if not projects.update(**changes):
+            raise TaskConflictError(project_id)
+
+        if expected is not None:
+            return expected + 1
+        return Project.objects.filter(pk=project_id).values_list(
+            'task_order_version', flat=True
+        ).get()
+
+    def _get_move_slot(
+            self,
+            task: Task,
+            after_id: Optional[int],
+            before_id: Optional[int]
+    ) -> tuple[Optional[int], Optional[int]]:
+        """Get the priorities bounding the slot a task is moved into."""
+        siblings = self.model.objects.filter(
+            project_id=task.project_id
+        ).exclude(pk=task.pk)
+        anchor = siblings.filter(
+            pk=after_id if after_id is not None else before_id
+        ).values('priority', 'id').get()
+
+        if after_id is not None:
+            following = siblings.filter(
+                Q(priority__gt=anchor['priority'])
+                | Q(priority=anchor['priority'], id__gt=anchor['id'])
+            ).order_by(*TASK_ORDERING).values_list('priority', flat=True)
+            return anchor['priority'], following.first()
+
+        preceding = siblings.filter(
+            Q(priority__lt=anchor['priority'])
+            | Q(priority=anchor['priority'], id__lt=anchor['id'])
+        ).order_by('-priority', '-id').values_list('priority', flat=True)
+        return preceding.first(), anchor['priority']
+
+    @staticmethod
+    def _get_midpoint(
+            lower: Optional[int],
+            upper: Optional[int]
+    ) -> Optional[int]:
+        """Get a rank strictly between two ranks, or None if there is none."""
+        low = lower if lower is not None else 0
+        high = upper if upper is not None else low + 2 * TASK_RANK_GAP
+        if high - low < TASK_RANK_MIN_GAP or high > TASK_RANK_MAX:
+            return None
+        return (low + high) // 2
+
+    def _db_for_write(self) -> str:
+        """Database alias task writes go to."""
+        return router.db_for_write(self.model)
+
+    def _connection_for_write(self) -> BaseDatabaseWrapper:
+        """Connection of the database task writes go to."""
+        return connections[self._db_for_write()]
+
+    def _bulk_update_priorities(
+            self,
+            rows: List[tuple[int, int]]
+    ) -> None:
+        """Write ``(priority, id)`` pairs with one prepared UPDATE.
+
+        ``bulk_update`` builds a ``CASE WHEN`` with one branch per row,
+        which SQLite evaluates for every updated row; executing a single
+        prepared statement for all rows keeps the cost linear. PostgreSQL
+        gets all pairs as two arrays and joins them with ``unnest`` in a
+        single statement instead.
+        """
+        if not rows:
+            return
+
+        connection = self._connection_for_write()
+        quote_name = connection.ops.quote_name
+        opts = self.model._meta
+        priority_field = opts.get_field('priority')
+        names = {
+            'table': quote_name(opts.db_table),
+            'priority': quote_name(priority_field.column),
+            'pk': quote_name(opts.pk.column),
         }
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                priorities, ids = zip(*rows)
+                cursor.execute(
+                    'UPDATE {table} SET {priority} = v.priority '
+                    'FROM unnest(%s::{priority_type}[], %s::{pk_type}[]) '
+                    'AS v(priority, id) '
+                    'WHERE {table}.{pk} = v.id'.format(
+                        priority_type=priority_field.db_type(connection),
+                        pk_type=opts.pk.rel_db_type(connection),
+                        **names
+                    ),
+                    [list(priorities), list(ids)]
+                )
+            else:
+                cursor.executemany(
+                    'UPDATE {table} SET {priority} = %s '
+                    'WHERE {pk} = %s'.format(**names),
+                    rows
+                )
+
+    def _set_completed_returning(
+            self,
+            task_id: int,
+            user: User,
+            completed: bool
+    ) -> int:
+        """Set an owned task's completion and its counter in one statement.
+
+        PostgreSQL only: the task UPDATE returns the task's project_id to
+        the counter UPDATE through a data-modifying CTE.
+
+        Returns:
+            Number of tasks changed, 0 or 1.
+
+        """
+        connection = self._connection_for_write()
+        quote_name = connection.ops.quote_name
+        task_opts = self.model._meta
+        project_opts = Project._meta
+        sql = (
+            'WITH changed AS ('
+            'UPDATE {tasks} SET {completed} = %s '
+            'WHERE {task_pk} = %s AND {owner} = %s AND {completed} = %s '
+            'RETURNING {project}'
+            ') '
+            'UPDATE {projects} '
+            'SET {completed_count} = GREATEST({completed_count} + %s, 0) '
+            'FROM changed WHERE {projects}.{project_pk} = changed.{project}'
+        ).format(
+            tasks=quote_name(task_opts.db_table),
+            completed=quote_name(task_opts.get_field('completed').column),
+            task_pk=quote_name(task_opts.pk.column),
+            owner=quote_name(task_opts.get_field('owner').column),
+            project=quote_name(task_opts.get_field('project').column),
+            projects=quote_name(project_opts.db_table),
+            completed_count=quote_name(
+                project_opts.get_field('completed_count').column
+            ),
+            project_pk=quote_name(project_opts.pk.column),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [
+                completed, task_id, user.pk, not completed,
+                1 if completed else -1,
+            ])
+            return cursor.rowcount
+
+    def _adjust_task_counters(
+            self,
+            project_id: Union[int, Subquery],
+            total: int = 0,
+            completed: int = 0
+    ) -> None:
+        """Shift a project's task counters by the given deltas in SQL."""
+        changes = {}
+        if total:
+            changes['task_count'] = Greatest(
+                F('task_count') + total, 0,
+                output_field=models.PositiveIntegerField()
+            )
+        if completed:
+            changes['completed_count'] = Greatest(
+                F('completed_count') + completed, 0,
+                output_field=models.PositiveIntegerField()
+            )
+        if changes:
+            Project.objects.filter(pk=project_id).update(**changes)
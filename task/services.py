@@ -1,16 +1,22 @@
 import logging
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from django.db import models
 
+from core.cache import GenerationCache
+from core.pagination import InvalidCursorError, KeysetPage
 from task.repositories import TaskRepository
 from task.models import Task
 from task.constants import (
+    DEFAULT_TASKS_PER_PAGE,
+    MAX_TASKS_PER_PAGE,
     TASK_TEXT_MIN_LENGTH,
     TASK_TEXT_MAX_LENGTH,
     TASK_PRIORITY_MIN,
     TASK_PRIORITY_MAX,
+    TASK_RANK_GAP,
     ERROR_TASK_TEXT_EMPTY,
     ERROR_TASK_TEXT_TOO_SHORT,
     ERROR_TASK_TEXT_TOO_LONG,
@@ -21,6 +27,14 @@ from task.constants import (
     ERROR_TASK_PRIORITY_INVALID,
     ERROR_TASK_REORDER_FAILED,
     ERROR_TASK_TOGGLE_FAILED,
+    ERROR_TASK_MOVE_INVALID,
+    ERROR_TASK_BATCH_TOO_LARGE,
+    ERROR_TASK_BATCH_LINE,
+    MAX_TASKS_PER_BATCH,
+    ERROR_TASK_BULK_NO_SELECTION,
+    ERROR_TASK_BULK_TOO_LARGE,
+    ERROR_TASK_BULK_SAME_PROJECT,
+    MAX_TASKS_PER_BULK,
 )
 
 if TYPE_CHECKING:
@@ -31,6 +45,10 @@ else:
 
 logger = logging.getLogger(__name__)
 
+task_page_cache = GenerationCache(
+    'task_pages', settings.DASHBOARD_CACHE_TIMEOUT
+)
+
 
 class TaskService:
     """Service layer for Task business logic."""
@@ -56,7 +74,7 @@ class TaskService:
                 text=text,
                 project_id=project_id,
                 user=user,
-                priority=priority
+                priority=self._priority_to_rank(priority)
             )
 
             logger.info(f"Task '{text}' created in project {project_id} by user {user.email}")
@@ -65,6 +83,54 @@ class TaskService:
         except models.ObjectDoesNotExist:
             raise ValidationError(ERROR_PROJECT_NOT_FOUND)
 
+    def create_tasks(
+            self,
+            text: str,
+            project_id: int,
+            user: User
+    ) -> List[Task]:
+        """Create one task per non-blank line of pasted text.
+
+        Every line is validated with the same rules as a single task and
+        all errors are reported together, so either all tasks are created
+        or none.
+        """
+        lines = [line.strip() for line in text.splitlines()]
+        texts = [line for line in lines if line]
+        if not texts:
+            raise ValidationError(ERROR_TASK_TEXT_EMPTY)
+
+        if len(texts) > MAX_TASKS_PER_BATCH:
+            raise ValidationError(ERROR_TASK_BATCH_TOO_LARGE)
+
+        errors = []
+        for number, line in enumerate(lines, start=1):
+            if not line:
+                continue
+            try:
+                self._validate_task_text(line)
+            except ValidationError as e:
+                errors.extend(
+                    ERROR_TASK_BATCH_LINE.format(line=number, error=message)
+                    for message in e.messages
+                )
+        if errors:
+            raise ValidationError(errors)
+
+        try:
+            tasks: List[Task] = self.repository.create_tasks(
+                texts, project_id, user
+            )
+        except models.ObjectDoesNotExist:
+            raise ValidationError(ERROR_PROJECT_NOT_FOUND)
+
+        logger.info(
+            "%s tasks created in project %s by user %s",
+            len(tasks), project_id, user.email
+        )
+
+        return tasks
+
     def update_task(
             self,
             task_id: int,
@@ -87,6 +153,7 @@ class TaskService:
         # Validate priority if it's being updated
         if 'priority' in kwargs:
             self._validate_task_priority(kwargs['priority'])
+            kwargs['priority'] = self._priority_to_rank(kwargs['priority'])
 
         updated_task = self.repository.update_task(task_id, user, **kwargs)
 
@@ -120,28 +187,130 @@ class TaskService:
             task_id: int,
             user: User,
             completed: bool
-    ) -> Task:
-        """Toggle task completion status with business logic validation."""
-        try:
-            task: Task = self.repository.get_task_by_id(task_id, user)
-        except models.ObjectDoesNotExist:
-            raise ValidationError(ERROR_TASK_NOT_FOUND)
-
-        if not self._can_user_modify_task(task, user):
-            raise ValidationError(ERROR_TASK_NO_PERMISSION)
+    ) -> bool:
+        """Set task completion status and return the new status.
 
+        The ownership check happens inside the repository's UPDATE, so
+        no task or project instance is loaded.
+        """
         try:
-            updated_task = self.repository.toggle_task_completion(
+            completed = self.repository.toggle_task_completion(
                 task_id, user, completed
             )
 
             logger.info(f"Task {task_id} completion toggled to {completed} by user {user.email}")
 
-            return updated_task
+            return completed
+        except models.ObjectDoesNotExist:
+            raise ValidationError(ERROR_TASK_NOT_FOUND)
         except Exception as e:
             logger.error(f"Failed to toggle task completion: {e}")
             raise ValidationError(ERROR_TASK_TOGGLE_FAILED)
 
+    def set_all_tasks_completed(
+            self,
+            project_id: int,
+            user: User,
+            completed: bool
+    ) -> int:
+        """Mark every task of a project complete or incomplete.
+
+        Returns the number of tasks whose status changed.
+        """
+        try:
+            changed: int = self.repository.set_tasks_completed(
+                project_id, user, completed
+            )
+        except models.ObjectDoesNotExist:
+            raise ValidationError(ERROR_PROJECT_NOT_FOUND)
+
+        logger.info(
+            "%s tasks in project %s set to completed=%s by user %s",
+            changed, project_id, completed, user.email
+        )
+
+        return changed
+
+    def clear_completed_tasks(
+            self,
+            project_id: int,
+            user: User
+    ) -> int:
+        """Delete every completed task of a project.
+
+        Returns the number of deleted tasks.
+        """
+        try:
+            deleted: int = self.repository.delete_completed_tasks(
+                project_id, user
+            )
+        except models.ObjectDoesNotExist:
+            raise ValidationError(ERROR_PROJECT_NOT_FOUND)
+
+        logger.info(
+            "%s completed tasks cleared from project %s by user %s",
+            deleted, project_id, user.email
+        )
+
+        return deleted
+
+    def delete_selected_tasks(
+            self,
+            project_id: int,
+            user: User,
+            task_ids: List[Any]
+    ) -> List[int]:
+        """Delete the selected tasks of a project.
+
+        Returns the IDs of the deleted tasks. IDs of tasks outside the
+        project are ignored.
+        """
+        selected = self._validate_task_selection(task_ids)
+
+        try:
+            deleted_ids: List[int] = self.repository.delete_tasks(
+                project_id, user, task_ids=selected
+            )
+        except models.ObjectDoesNotExist:
+            raise ValidationError(ERROR_PROJECT_NOT_FOUND)
+
+        logger.info(
+            "%s tasks deleted from project %s by user %s",
+            len(deleted_ids), project_id, user.email
+        )
+
+        return deleted_ids
+
+    def move_selected_tasks(
+            self,
+            project_id: int,
+            user: User,
+            task_ids: List[Any],
+            target_project_id: int
+    ) -> List[Task]:
+        """Move the selected tasks to the end of another project.
+
+        Returns the moved tasks. IDs of tasks outside the project are
+        ignored.
+        """
+        selected = self._validate_task_selection(task_ids)
+        if project_id == target_project_id:
+            raise ValidationError(ERROR_TASK_BULK_SAME_PROJECT)
+
+        try:
+            tasks: List[Task] = self.repository.move_tasks(
+                project_id, user, selected, target_project_id
+            )
+        except models.ObjectDoesNotExist:
+            raise ValidationError(ERROR_PROJECT_NOT_FOUND)
+
+        logger.info(
+            "%s tasks moved from project %s to %s by user %s",
+            len(tasks), project_id, target_project_id, user.email
+        )
+
+        return tasks
+
     def reorder_tasks(
             self,
             order_data: List[dict],
@@ -158,6 +327,41 @@ class TaskService:
             logger.error(f"Failed to reorder tasks: %s", e)
             raise ValidationError(ERROR_TASK_REORDER_FAILED) from None
 
+    def move_task(
+            self,
+            task_id: int,
+            user: User,
+            after_id: Optional[int] = None,
+            before_id: Optional[int] = None,
+            version: Optional[int] = None
+    ) -> Tuple[Task, int]:
+        """Move a task right after or before another task of its project.
+
+        Returns the moved task and the new task order version of its
+        project. A TaskConflictError is raised when ``version`` is
+        outdated.
+        """
+        if after_id is None and before_id is None:
+            raise ValidationError(ERROR_TASK_MOVE_INVALID)
+
+        if task_id in (after_id, before_id):
+            raise ValidationError(ERROR_TASK_MOVE_INVALID)
+
+        try:
+            task, new_version = self.repository.move_task(
+                task_id,
+                user,
+                after_id=after_id,
+                before_id=before_id,
+                version=version
+            )
+        except models.ObjectDoesNotExist:
+            raise ValidationError(ERROR_TASK_MOVE_INVALID) from None
+
+        logger.info("Task %s moved by user %s", task_id, user.email)
+
+        return task, new_version
+
     def get_project_tasks(
             self,
             project_id: int,
@@ -167,6 +371,29 @@ class TaskService:
         """Get tasks for a project with optional filtering."""
         return list(self.repository.get_project_tasks(project_id, user, limit))
 
+    def get_project_tasks_page(
+            self,
+            project_id: int,
+            user: User,
+            cursor: Optional[str] = None,
+            per_page: int = DEFAULT_TASKS_PER_PAGE
+    ) -> KeysetPage[Task]:
+        """Get one bounded page of a project's tasks.
+
+        Pages are cached until the user writes, like the dashboard.
+        """
+        per_page = min(per_page, MAX_TASKS_PER_PAGE)
+        try:
+            return task_page_cache.get_or_set(
+                user.pk,
+                f'{project_id}:{per_page}:{cursor or ""}',
+                lambda: self.repository.get_project_tasks_page(
+                    project_id, user, cursor=cursor, per_page=per_page
+                )
+            )
+        except InvalidCursorError:
+            raise ValidationError("Invalid cursor.") from None
+
     def get_task_stats(
             self,
             project_id: int,
@@ -175,6 +402,14 @@ class TaskService:
         """Get task statistics for a project."""
         return self.repository.get_task_stats(project_id, user)
 
+    def get_task_stats_for_projects(
+            self,
+            project_ids: List[int],
+            user: User
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get task statistics for many projects at once."""
+        return self.repository.get_task_stats_for_projects(project_ids, user)
+
     def _validate_task_text(self, text: str) -> None:
         """Validate task text according to business rules."""
         if not text or not text.strip():
@@ -200,6 +435,32 @@ class TaskService:
             if priority < TASK_PRIORITY_MIN or priority > TASK_PRIORITY_MAX:
                 raise ValidationError(ERROR_TASK_PRIORITY_INVALID)
 
+    @staticmethod
+    def _priority_to_rank(priority: Optional[int]) -> Optional[int]:
+        """Map a validated user priority onto the sparse rank space.
+
+        Priority N is placed half a gap before the Nth appended task, so
+        explicit priorities sort among appended tasks, not before all.
+        """
+        if priority is None:
+            return None
+        return priority * TASK_RANK_GAP - TASK_RANK_GAP // 2
+
+    def _validate_task_selection(self, task_ids: List[Any]) -> List[int]:
+        """Validate a bulk selection and return it as unique integers."""
+        try:
+            selected = list(dict.fromkeys(int(task_id) for task_id in task_ids))
+        except (TypeError, ValueError):
+            raise ValidationError(ERROR_TASK_BULK_NO_SELECTION) from None
+
+        if not selected:
+            raise ValidationError(ERROR_TASK_BULK_NO_SELECTION)
+
+        if len(selected) > MAX_TASKS_PER_BULK:
+            raise ValidationError(ERROR_TASK_BULK_TOO_LARGE)
+
+        return selected
+
     def _can_user_modify_task(self, task: Task, user: User) -> bool:
-        """Check if user can modify the task."""
-        return task.project.owner == user
+        """Check if user can modify the task without loading related rows."""
+        return task.owner_id == user.pk
@@ -1,16 +1,52 @@
 from django.urls import path
 from task.views.create import TaskCreateView
+from task.views.batch_create import TaskBatchCreateView
 from task.views.update import TaskUpdateView
 from task.views.delete import TaskDeleteView
 from task.views.reorder import TaskReorderView
+from task.views.move import TaskMoveView
 from task.views.toggle import TaskToggleView
+from task.views.list import TaskListView
+from task.views.bulk import (
+    TaskBulkClearCompletedView,
+    TaskBulkCompleteView,
+    TaskBulkDeleteView,
+    TaskBulkMoveView,
+)
 
 app_name = 'tasks'
 
 urlpatterns = [
     path('<int:project_id>/create/', TaskCreateView.as_view(), name='create'),
+    path(
+        '<int:project_id>/batch-create/',
+        TaskBatchCreateView.as_view(),
+        name='batch_create'
+    ),
+    path('<int:project_id>/list/', TaskListView.as_view(), name='list'),
+    path(
+        '<int:project_id>/bulk/complete/',
+        TaskBulkCompleteView.as_view(),
+        name='bulk_complete'
+    ),
+    path(
+        '<int:project_id>/bulk/clear-completed/',
+        TaskBulkClearCompletedView.as_view(),
+        name='bulk_clear_completed'
+    ),
+    path(
+        '<int:project_id>/bulk/delete/',
+        TaskBulkDeleteView.as_view(),
+        name='bulk_delete'
+    ),
+    path(
+        '<int:project_id>/bulk/move/',
+        TaskBulkMoveView.as_view(),
+        name='bulk_move'
+    ),
     path('<int:pk>/update/', TaskUpdateView.as_view(), name='update'),
     path('<int:pk>/delete/', TaskDeleteView.as_view(), name='delete'),
     path('<int:pk>/toggle/', TaskToggleView.as_view(), name='toggle'),
+    path('<int:pk>/move/', TaskMoveView.as_view(), name='move'),
     path('reorder/', TaskReorderView.as_view(), name='reorder'),
 ]
@@ -3,6 +3,7 @@ from .update import TaskUpdateView
 from .delete import TaskDeleteView
 from .reorder import TaskReorderView
 from .toggle import TaskToggleView
+from .list import TaskListView
 
 __all__ = [
     'TaskCreateView',
@@ -10,4 +11,5 @@ __all__ = [
     'TaskDeleteView',
     'TaskReorderView',
     'TaskToggleView',
+    'TaskListView',
 ]
@@ -0,0 +1,48 @@
+from typing import Any
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.views import View
+from django.core.exceptions import ValidationError
+from django.contrib import messages
+
+from task.models import Task
+from task.services import TaskService
+
+
+class TaskBatchCreateView(
+    LoginRequiredMixin,
+    View
+):
+    """View for creating one task per line of pasted text via HTMX.
+
+    All rows are rendered into a single response that is appended to the
+    project's task list.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.task_service: TaskService = TaskService()
+
+    def post(self, request, *args, **kwargs):
+        """Handle POST request to create tasks from multi-line text."""
+        project_id = self.kwargs.get('project_id')
+        text = request.POST.get(f'searchInput-{project_id}', '')
+
+        try:
+            tasks: list[Task] = self.task_service.create_tasks(
+                text=text,
+                project_id=project_id,
+                user=request.user
+            )
+        except ValidationError as e:
+            return HttpResponse('\n'.join(e.messages), status=400)
+
+        messages.success(
+            request,
+            f'{len(tasks)} tasks were created successfully!'
+        )
+
+        return HttpResponse(render_to_string('task/task_items.html', {
+            'tasks': tasks
+        }, request=request))
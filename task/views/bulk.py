@@ -0,0 +1,148 @@
+from abc import ABC, abstractmethod
+from typing import Any
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpRequest, HttpResponse
+from django.template.loader import render_to_string
+from django.views import View
+from django.core.exceptions import ValidationError
+
+from task.services import TaskService
+
+
+class TaskBulkBaseView(
+    LoginRequiredMixin,
+    View,
+    ABC
+):
+    """Base view for project-level bulk task actions via HTMX.
+
+    Subclasses implement ``perform`` and return the context of the
+    response: ``refreshed_page`` replaces the project's task list with
+    its first page, rows in ``removed_ids`` are removed and
+    ``moved_tasks`` are appended to the list of ``target_project_id``.
+    Every change is an out-of-band swap, so the whole action is applied
+    from one response whose size does not grow with the project.
+    """
+
+    template_name = 'task/task_bulk_response.html'
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.task_service: TaskService = TaskService()
+
+    def post(self, request, *args, **kwargs):
+        """Handle POST request to run the bulk action."""
+        try:
+            context = self.perform(request, self.kwargs.get('project_id'))
+        except ValidationError as e:
+            return HttpResponse(' '.join(e.messages), status=400)
+
+        return HttpResponse(
+            render_to_string(self.template_name, context, request=request)
+        )
+
+    @abstractmethod
+    def perform(
+            self,
+            request: HttpRequest,
+            project_id: int
+    ) -> dict[str, Any]:
+        """Run the action and return the response context.
+
+        Raises:
+            ValidationError: If the action is rejected; the messages are
+                sent back with status 400.
+
+        """
+        ...
+
+    def get_refresh_context(
+            self,
+            request: HttpRequest,
+            project_id: int
+    ) -> dict[str, Any]:
+        """Context that reloads the first page of the project's tasks.
+
+        Used by actions on every task of a project, which may change
+        rows that were never loaded into the page.
+        """
+        return {
+            'refreshed_page': self.task_service.get_project_tasks_page(
+                project_id, request.user
+            ),
+            'project_id': project_id,
+        }
+
+
+class TaskBulkCompleteView(TaskBulkBaseView):
+    """Mark all tasks of a project complete, or incomplete."""
+
+    def perform(
+            self,
+            request: HttpRequest,
+            project_id: int
+    ) -> dict[str, Any]:
+        """Set the status from the ``completed`` field, true by default."""
+        completed = request.POST.get('completed', 'true').lower() == 'true'
+        self.task_service.set_all_tasks_completed(
+            project_id, request.user, completed
+        )
+        return self.get_refresh_context(request, project_id)
+
+
+class TaskBulkClearCompletedView(TaskBulkBaseView):
+    """Delete all completed tasks of a project."""
+
+    def perform(
+            self,
+            request: HttpRequest,
+            project_id: int
+    ) -> dict[str, Any]:
+        """Delete the completed tasks."""
+        self.task_service.clear_completed_tasks(project_id, request.user)
+        return self.get_refresh_context(request, project_id)
+
+
+class TaskBulkDeleteView(TaskBulkBaseView):
+    """Delete the tasks selected in ``task_ids``."""
+
+    def perform(
+            self,
+            request: HttpRequest,
+            project_id: int
+    ) -> dict[str, Any]:
+        """Delete the selected tasks."""
+        return {
+            'removed_ids': self.task_service.delete_selected_tasks(
+                project_id, request.user, request.POST.getlist('task_ids')
+            )
+        }
+
+
+class TaskBulkMoveView(TaskBulkBaseView):
+    """Move the tasks selected in ``task_ids`` to ``target_project``."""
+
+    def perform(
+            self,
+            request: HttpRequest,
+            project_id: int
+    ) -> dict[str, Any]:
+        """Move the selected tasks to the end of the target project."""
+        try:
+            target_project_id = int(request.POST.get('target_project', ''))
+        except ValueError:
+            raise ValidationError(
+                'Choose a project to move tasks to.'
+            ) from None
+
+        tasks = self.task_service.move_selected_tasks(
+            project_id,
+            request.user,
+            request.POST.getlist('task_ids'),
+            target_project_id
+        )
+        return {
+            'removed_ids': [task.id for task in tasks],
+            'moved_tasks': tasks,
+            'target_project_id': target_project_id,
+        }
@@ -18,8 +18,12 @@ class TaskCreateView(
     HTMXResponseMixin[Task],
     CreateView  # type: ignore
 ):
-    """View for creating new tasks via HTMX."""
+    """View for creating new tasks via HTMX.
 
+    Tasks are only created from posted text; there is no form page.
+    """
+
+    http_method_names = ['post']
     model = Task
     form_class = TaskForm
     template_name = 'task/task_item.html'
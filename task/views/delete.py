@@ -5,17 +5,22 @@ from django.views.generic import DeleteView
 from django.http import HttpResponse
 from django.core.exceptions import ValidationError
 
-from core.mixins.views import HTMXResponseMixin
+from core.mixins.views import OwnedObjectMixin
 from task.models import Task
 from task.services import TaskService
 
 
 class TaskDeleteView(
     LoginRequiredMixin,
+    OwnedObjectMixin[Task],
     DeleteView # type: ignore
 ):
-    """View for deleting tasks via HTMX."""
+    """View for deleting tasks via HTMX.
+
+    There is no confirmation page, so only POST and DELETE are allowed.
+    """
     
+    http_method_names = ['post', 'delete']
     model = Task
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -0,0 +1,50 @@
+from typing import Any
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest, HttpResponse
+from django.template.loader import render_to_string
+from django.views import View
+
+from task.services import TaskService
+
+
+class TaskListView(
+    LoginRequiredMixin,
+    View
+):
+    """View returning one page of a project's tasks via HTMX.
+
+    The page is keyed on ``(priority, id)``; the ``cursor`` query
+    parameter points past the last task already shown. The response holds
+    the task rows plus an out-of-band "load more" trigger for the next
+    page, so its size is bounded regardless of how big the project is.
+    """
+
+    template_name = 'task/task_page.html'
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.task_service: TaskService = TaskService()
+
+    def get(
+            self,
+            request: HttpRequest,
+            *args: Any,
+            **kwargs: Any
+    ) -> HttpResponse:
+        """Handle GET request for a page of tasks."""
+        project_id = self.kwargs.get('project_id')
+        try:
+            page = self.task_service.get_project_tasks_page(
+                project_id=project_id,
+                user=request.user,
+                cursor=request.GET.get('cursor')
+            )
+        except ValidationError as e:
+            return HttpResponse(str(e), status=400)
+
+        html = render_to_string(self.template_name, {
+            'page': page,
+            'project_id': project_id
+        }, request=request)
+        return HttpResponse(html)
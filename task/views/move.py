@@ -0,0 +1,71 @@
+import json
+from typing import Any, Optional
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views import View
+from django.http import JsonResponse
+from django.core.exceptions import ValidationError
+
+from task.exceptions import TaskConflictError
+from task.services import TaskService
+
+
+class TaskMoveView(
+    LoginRequiredMixin,
+    View
+):
+    """View for moving a single task next to another one via drag and drop.
+
+    Expects ``{"after": id, "before": id, "version": n}``, where only one
+    of ``after``/``before`` is required and ``version`` is the task order
+    version the client's list was rendered with. Request and response
+    size do not depend on the number of tasks.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.task_service: TaskService = TaskService()
+
+    def post(self, request, *args, **kwargs):
+        """Handle POST request to move a task."""
+        try:
+            payload = json.loads(request.body.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            payload = None
+        if not isinstance(payload, dict):
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        try:
+            after_id = self._get_int(payload, 'after')
+            before_id = self._get_int(payload, 'before')
+            version = self._get_int(payload, 'version')
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+        try:
+            task, version = self.task_service.move_task(
+                task_id=self.kwargs.get('pk'),
+                user=request.user,
+                after_id=after_id,
+                before_id=before_id,
+                version=version
+            )
+        except TaskConflictError:
+            return JsonResponse(
+                {'error': 'Task order has changed, reload the list.'},
+                status=409
+            )
+        except ValidationError as e:
+            return JsonResponse({'error': e.messages[0]}, status=400)
+
+        return JsonResponse({
+            'status': 'ok',
+            'priority': task.priority,
+            'version': version
+        })
+
+    @staticmethod
+    def _get_int(payload: dict, key: str) -> Optional[int]:
+        """Read an optional integer from the payload."""
+        value = payload.get(key)
+        if value is None or value == '':
+            return None
+        return int(value)
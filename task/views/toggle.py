@@ -3,22 +3,22 @@ from typing import Any
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.http import JsonResponse
-from django.views.decorators.http import require_POST
-from django.utils.decorators import method_decorator
 from django.core.exceptions import ValidationError
 
-from core.mixins.views import HTMXResponseMixin
-from task.models import Task
+from task.constants import ERROR_TASK_NOT_FOUND
 from task.services import TaskService
 
 
 class TaskToggleView(
     LoginRequiredMixin,
-    HTMXResponseMixin[Task],
     View
 ):
-    """View for toggling task completion status."""
-    
+    """View for toggling task completion status.
+
+    Expects ``{"completed": true|false}`` and answers with the new
+    status as JSON; the task is never loaded or rendered.
+    """
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.task_service: TaskService = TaskService()
@@ -27,23 +27,24 @@ class TaskToggleView(
         """Handle POST request to toggle task completion."""
         try:
             payload = json.loads(request.body.decode('utf-8'))
-            completed = payload.get('completed', False)
-            task_id = self.kwargs.get('pk')
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            payload = None
+        completed = payload.get('completed') \
+            if isinstance(payload, dict) else None
+        if not isinstance(completed, bool):
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
-            task: Task = self.task_service.toggle_task_completion(
-                task_id=task_id,
+        try:
+            completed = self.task_service.toggle_task_completion(
+                task_id=self.kwargs.get('pk'),
                 user=request.user,
                 completed=completed
             )
-
-            return JsonResponse({
-                'status': 'success',
-                'completed': task.completed
-            })
-            
-        except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON'}, status=400)
         except ValidationError as e:
-            return JsonResponse({'error': str(e)}, status=400)
-        except Exception as e:
-            return JsonResponse({'error': str(e)}, status=500)
+            status = 404 if e.messages == [ERROR_TASK_NOT_FOUND] else 400
+            return JsonResponse({'error': e.messages[0]}, status=status)
+
+        return JsonResponse({
+            'status': 'success',
+            'completed': completed
+        })
@@ -5,7 +5,7 @@ from django.http import HttpResponse
 from django.template.loader import render_to_string
 from django.core.exceptions import ValidationError
 
-from core.mixins.views import HTMXResponseMixin
+from core.mixins.views import HTMXResponseMixin, OwnedObjectMixin
 from task.models import Task
 from task.forms import TaskEditForm
 from task.services import TaskService
@@ -13,6 +13,7 @@ from task.services import TaskService
 
 class TaskUpdateView(
     LoginRequiredMixin,
+    OwnedObjectMixin[Task],
     HTMXResponseMixin[Task],
     UpdateView
 ):
@@ -0,0 +1,158 @@
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.cache import (
+    CacheMetrics,
+    GenerationCache,
+    _user_generation_key,
+    cache_metrics,
+    invalidate_all,
+    invalidate_user,
+)
+
+
+class GenerationCacheTest(TestCase):
+    """Test cases for per-user caching on the local memory backend."""
+
+    databases = {'default', 'auxiliary'}
+    backend = 'django.core.cache.backends.locmem.LocMemCache'
+
+    def get_location(self) -> str:
+        """Location of the cache under test."""
+        return 'generation-cache-test'
+
+    def prepare_cache(self) -> None:
+        """Create whatever the backend needs before it is used."""
+
+    def setUp(self) -> None:
+        """Switch to the backend under test and reset the metrics."""
+        overrides = self.settings(CACHES={
+            'default': {
+                'BACKEND': self.backend,
+                'LOCATION': self.get_location(),
+            }
+        })
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.prepare_cache()
+        cache.clear()
+        cache_metrics.reset()
+        self.addCleanup(cache_metrics.reset)
+        self.cache = GenerationCache('test', 60)
+
+    def test_entry_is_cached_until_the_user_writes(self) -> None:
+        """Test that a bump makes the next read compute the value again."""
+        compute = mock.Mock(side_effect=['first', 'second'])
+
+        assert self.cache.get_or_set(1, 'page', compute) == 'first'
+        assert self.cache.get_or_set(1, 'page', compute) == 'first'
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_user(1)
+        assert self.cache.get_or_set(1, 'page', compute) == 'second'
+
+        assert cache_metrics.snapshot() == {
+            'test': {'hits': 1, 'misses': 2}
+        }
+
+    def test_metrics_are_shared_through_the_cache(self) -> None:
+        """Test that another process reads the same counters."""
+        self.cache.get_or_set(1, 'page', lambda: 'one')
+        self.cache.get_or_set(1, 'page', lambda: 'one')
+        other_process = CacheMetrics()
+        other_process.register('test')
+
+        assert other_process.snapshot() == {
+            'test': {'hits': 1, 'misses': 1}
+        }
+
+        other_process.reset()
+        assert cache_metrics.snapshot() == {}
+
+    def test_cache_stats_command(self) -> None:
+        """Test that the command reports the counters of every cache."""
+        self.cache.get_or_set(1, 'page', lambda: 'one')
+        self.cache.get_or_set(1, 'page', lambda: 'one')
+        self.cache.get_or_set(2, 'page', lambda: 'two')
+        out = StringIO()
+
+        call_command('cache_stats', '--reset', stdout=out)
+
+        rows = {
+            line.split()[0]: line.split()[1:]
+            for line in out.getvalue().splitlines()[1:-1]
+        }
+        assert rows['test'] == ['1', '2', '33.3%']
+        assert rows['dashboard'] == ['0', '0', '-']
+        assert cache_metrics.snapshot() == {}
+
+    def test_other_users_entries_are_kept(self) -> None:
+        """Test that a bump only drops the writing user's entries."""
+        self.cache.get_or_set(1, 'page', lambda: 'one')
+        self.cache.get_or_set(2, 'page', lambda: 'two')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_user(1)
+
+        assert self.cache.get_or_set(1, 'page', lambda: 'new') == 'new'
+        assert self.cache.get_or_set(2, 'page', lambda: 'new') == 'two'
+
+    def test_invalidate_all_drops_every_users_entries(self) -> None:
+        """Test that the global counter invalidates everyone."""
+        self.cache.get_or_set(1, 'page', lambda: 'one')
+        self.cache.get_or_set(2, 'page', lambda: 'two')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_all()
+
+        assert self.cache.get_or_set(1, 'page', lambda: 'new') == 'new'
+        assert self.cache.get_or_set(2, 'page', lambda: 'new') == 'new'
+
+    def test_invalidation_waits_for_commit(self) -> None:
+        """Test that readers keep the old entry until the write commits."""
+        self.cache.get_or_set(1, 'page', lambda: 'old')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_user(1)
+            assert self.cache.get_or_set(1, 'page', lambda: 'new') == 'old'
+
+        assert self.cache.get_or_set(1, 'page', lambda: 'new') == 'new'
+
+    def test_evicted_generation_does_not_revive_entries(self) -> None:
+        """Test that a lost counter does not restart at an old value."""
+        self.cache.get_or_set(1, 'page', lambda: 'old')
+
+        cache.delete(_user_generation_key(1))
+
+        assert self.cache.get_or_set(1, 'page', lambda: 'new') == 'new'
+
+
+class FileGenerationCacheTest(GenerationCacheTest):
+    """Test cases for per-user caching on the file backend."""
+
+    backend = 'django.core.cache.backends.filebased.FileBasedCache'
+
+    def get_location(self) -> str:
+        """Use a temporary directory that is removed afterwards."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        return directory
+
+
+class DatabaseGenerationCacheTest(GenerationCacheTest):
+    """Test cases for per-user caching on the database backend."""
+
+    backend = 'django.core.cache.backends.db.DatabaseCache'
+
+    def get_location(self) -> str:
+        """Name of the cache table."""
+        return 'generation_cache_test'
+
+    def prepare_cache(self) -> None:
+        """Create the cache table on the auxiliary database."""
+        call_command('createcachetable', database='auxiliary', verbosity=0)
@@ -0,0 +1,363 @@
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.db import connection, connections, router
+from django.db.utils import load_backend
+from django.http import HttpRequest, HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.urls import reverse
+
+from core.middleware import ReplicaStickinessMiddleware
+from core.routers import (
+    AUXILIARY_DATABASE,
+    PRIMARY_DATABASE,
+    REPLICA_DATABASE,
+    read_state,
+    replica_reads,
+)
+from core.sharding import use_shard
+from project.models import Project
+from project.repositories import ProjectRepository
+from task.models import Task
+from task.repositories import TaskRepository
+from task.services import TaskService
+from tests.sharding import OwnerShardTestMixin
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+    User = AbstractUser
+else:
+    User = get_user_model()
+
+
+class AuxiliaryRouterTest(TestCase):
+    """Test cases for routing auxiliary apps to their own database."""
+
+    databases = {'default', 'auxiliary'}
+
+    def test_sessions_are_routed_to_auxiliary_database(self) -> None:
+        """Test that sessions are read and written on the auxiliary DB."""
+        assert router.db_for_read(Session) == AUXILIARY_DATABASE
+        assert router.db_for_write(Session) == AUXILIARY_DATABASE
+        assert router.db_for_write(Task) == 'default'
+
+    def test_tables_are_migrated_on_their_own_database(self) -> None:
+        """Test that each table only exists in the database it is routed to."""
+        default_tables = connections['default'].introspection.table_names()
+        auxiliary_tables = connections[
+            AUXILIARY_DATABASE
+        ].introspection.table_names()
+
+        assert 'django_session' in auxiliary_tables
+        assert 'django_session' not in default_tables
+        assert 'tasks' in default_tables
+        assert 'tasks' not in auxiliary_tables
+
+    def test_login_session_is_stored_in_auxiliary_database(self) -> None:
+        """Test that logging in writes the session to the auxiliary DB."""
+        User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+        response = self.client.post(reverse('account_login'), {
+            'login': 'test@example.com',
+            'password': 'testpass123',
+        })
+
+        assert response.status_code == 302
+        assert Session.objects.using(AUXILIARY_DATABASE).exists()
+
+
+class ReplicaRouterTest(SimpleTestCase):
+    """Test cases for routing reads to the replica."""
+
+    def test_reads_go_to_replica_and_writes_to_primary(self) -> None:
+        """Test the routing of a request that has not written."""
+        with read_state():
+            assert router.db_for_read(Task, replica=True) == REPLICA_DATABASE
+            assert router.db_for_read(
+                Project, replica=True
+            ) == REPLICA_DATABASE
+            assert router.db_for_read(Session) == AUXILIARY_DATABASE
+
+        assert router.db_for_write(Task) == PRIMARY_DATABASE
+
+    def test_unmarked_reads_go_to_primary(self) -> None:
+        """Test that only reads marked for the replica are sent there."""
+        with read_state():
+            assert router.db_for_read(Task) == PRIMARY_DATABASE
+            assert replica_reads(Task.objects.all()).db == REPLICA_DATABASE
+            assert Task.objects.all().db == PRIMARY_DATABASE
+
+    def test_reads_after_a_write_go_to_primary(self) -> None:
+        """Test that a request reads its own writes."""
+        with read_state() as state:
+            router.db_for_write(Task)
+
+            assert state.wrote
+            assert router.db_for_read(
+                Project, replica=True
+            ) == PRIMARY_DATABASE
+
+    def test_pinned_reads_go_to_primary(self) -> None:
+        """Test that a recently writing user reads from the primary."""
+        with read_state(pinned=True):
+            assert router.db_for_read(Task, replica=True) == PRIMARY_DATABASE
+
+    def test_reads_in_a_transaction_go_to_primary(self) -> None:
+        """Test that reads inside a write transaction see its writes."""
+        with mock.patch.object(
+                connections[PRIMARY_DATABASE], 'in_atomic_block', True
+        ):
+            assert router.db_for_read(Task, replica=True) == PRIMARY_DATABASE
+
+    def test_replica_is_never_migrated(self) -> None:
+        """Test that no app is migrated on the replica."""
+        assert not router.allow_migrate(REPLICA_DATABASE, 'task')
+        assert not router.allow_migrate(REPLICA_DATABASE, 'sessions')
+
+
+@skipUnless(connection.vendor == 'sqlite', 'The replica is an SQLite copy')
+class StaleReplicaTest(OwnerShardTestMixin, TransactionTestCase):
+    """Test the routing against a replica that lags behind the primary.
+
+    Test databases normally mirror the replica onto the primary, so a
+    read sent to the wrong one goes unnoticed. Here the replica is a
+    copy of the primary taken before the writes under test.
+    """
+
+    databases = {'default', 'auxiliary', 'replica'}
+    # Only the default shard has a replica
+    shard = PRIMARY_DATABASE
+
+    def setUp(self) -> None:
+        """Create a project with one task, then copy the primary."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user)
+        self.project = ProjectRepository().create_project(
+            'Project', self.user
+        )
+        self.task, = TaskRepository().create_tasks(
+            ['Task'], self.project.id, self.user
+        )
+        self._use_stale_replica()
+
+    def _use_stale_replica(self) -> None:
+        """Point the replica at a copy of the primary as it is now."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        path = Path(directory) / 'replica.sqlite3'
+
+        primary = connections[PRIMARY_DATABASE]
+        primary.ensure_connection()
+        copy = sqlite3.connect(path)
+        primary.connection.backup(copy)
+        copy.close()
+
+        mirror = connections[REPLICA_DATABASE]
+        stale = load_backend(mirror.settings_dict['ENGINE']).DatabaseWrapper(
+            {**mirror.settings_dict, 'NAME': str(path)}, REPLICA_DATABASE
+        )
+        connections[REPLICA_DATABASE] = stale
+
+        def restore() -> None:
+            stale.close()
+            connections[REPLICA_DATABASE] = mirror
+
+        self.addCleanup(restore)
+
+    def test_dashboard_reads_come_from_the_replica(self) -> None:
+        """Test that the marked reads see the replica's older rows."""
+        TaskRepository().toggle_task_completion(
+            self.task.id, self.user, True
+        )
+
+        stats = ProjectRepository().get_project_stats(self.user)
+        tasks = list(
+            TaskRepository().get_project_tasks(self.project.id, self.user)
+        )
+
+        assert stats['completed_tasks'] == 0
+        assert not tasks[0].completed
+        self.project.refresh_from_db()
+        assert self.project.completed_count == 1
+
+    def test_updates_load_from_the_primary(self) -> None:
+        """Test that an update sees the primary's state, not the replica's."""
+        TaskRepository().toggle_task_completion(
+            self.task.id, self.user, True
+        )
+
+        TaskService().update_task(self.task.id, self.user, completed=True)
+
+        self.project.refresh_from_db()
+        assert self.project.completed_count == 1
+
+    def test_owned_object_views_load_from_the_primary(self) -> None:
+        """Test that a view finds an object the replica does not have."""
+        task, = TaskRepository().create_tasks(
+            ['New task'], self.project.id, self.user
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('tasks:update', args=[task.id]))
+
+        assert response.status_code == 200
+        self.assertContains(response, 'New task')
+
+
+@override_settings(PROJECT_SHARDS=['default', 'shard_1'])
+class ShardRouterTest(SimpleTestCase):
+    """Test cases for routing projects and tasks to their owner's shard."""
+
+    def test_active_shard_routes_sharded_models_only(self) -> None:
+        """Test that only projects and tasks follow the active shard."""
+        with use_shard('shard_1'):
+            assert router.db_for_read(Task) == 'shard_1'
+            assert router.db_for_write(Project) == 'shard_1'
+            assert router.db_for_write(User) == PRIMARY_DATABASE
+            assert router.db_for_read(Session) == AUXILIARY_DATABASE
+
+    def test_default_shard_falls_through_to_replica(self) -> None:
+        """Test that the default shard still reads from the replica."""
+        with read_state(), use_shard(PRIMARY_DATABASE):
+            assert router.db_for_read(Task, replica=True) == REPLICA_DATABASE
+            assert router.db_for_write(Task) == PRIMARY_DATABASE
+
+    def test_related_objects_follow_the_instance(self) -> None:
+        """Test that relations of a sharded object use its database."""
+        project = Project()
+        project._state.db = 'shard_1'
+
+        with read_state():
+            assert router.db_for_read(Task, instance=project) == 'shard_1'
+            assert router.db_for_read(
+                User, instance=project
+            ) == PRIMARY_DATABASE
+
+    def test_new_objects_follow_their_owner(self) -> None:
+        """Test that a project assigned an owner goes to their shard."""
+        user = User(pk=7)
+
+        with self.settings(PROJECT_SHARD_OVERRIDES={7: 'shard_1'}):
+            project = Project(owner=user)
+            assert project._state.db == 'shard_1'
+            assert router.db_for_write(Project, instance=project) == 'shard_1'
+            assert router.db_for_read(Project, instance=user) == 'shard_1'
+            with use_shard(PRIMARY_DATABASE):
+                assert router.db_for_write(
+                    Task, instance=user
+                ) == PRIMARY_DATABASE
+
+    def test_sharded_object_relates_to_owner_on_default(self) -> None:
+        """Test that a project on a shard may point at its owner."""
+        project = Project()
+        project._state.db = 'shard_1'
+        user = User()
+        user._state.db = PRIMARY_DATABASE
+        task = Task()
+        task._state.db = PRIMARY_DATABASE
+
+        assert router.allow_relation(project, user)
+        assert not router.allow_relation(project, task)
+
+    def test_only_sharded_apps_are_migrated_on_shards(self) -> None:
+        """Test that shards get project, task and empty user tables."""
+        assert router.allow_migrate('shard_1', 'project')
+        assert router.allow_migrate('shard_1', 'task')
+        assert router.allow_migrate('shard_1', 'auth')
+        assert not router.allow_migrate('shard_1', 'account')
+        assert not router.allow_migrate('shard_1', 'sessions')
+        assert router.allow_migrate(PRIMARY_DATABASE, 'task')
+
+
+class ReplicaStickinessMiddlewareTest(SimpleTestCase):
+    """Test cases for pinning users to the primary after a write."""
+
+    def setUp(self) -> None:
+        """Set up the request factory."""
+        self.factory = RequestFactory()
+        self.read_databases: list[str | None] = []
+
+    def _get_response(self, write: bool) -> HttpResponse:
+        """Run a request through the middleware, optionally writing."""
+        def view(request: HttpRequest) -> HttpResponse:
+            if write:
+                router.db_for_write(Task)
+            self.read_databases.append(
+                router.db_for_read(Task, replica=True)
+            )
+            return HttpResponse()
+
+        return ReplicaStickinessMiddleware(view)(self.request)
+
+    def test_write_sets_sticky_cookie(self) -> None:
+        """Test that a writing request pins the user for a while."""
+        self.request = self.factory.post('/')
+
+        response = self._get_response(write=True)
+
+        cookie = response.cookies[settings.REPLICA_STICKY_COOKIE]
+        assert cookie['max-age'] == settings.REPLICA_STICKY_SECONDS
+        assert self.read_databases == [PRIMARY_DATABASE]
+
+    def test_read_only_request_uses_replica(self) -> None:
+        """Test that reading alone neither pins nor reads the primary."""
+        self.request = self.factory.get('/')
+
+        response = self._get_response(write=False)
+
+        assert settings.REPLICA_STICKY_COOKIE not in response.cookies
+        assert self.read_databases == [REPLICA_DATABASE]
+
+    def test_sticky_cookie_reads_from_primary(self) -> None:
+        """Test that a pinned user's next request reads the primary."""
+        self.request = self.factory.get('/')
+        self.request.COOKIES[settings.REPLICA_STICKY_COOKIE] = '1'
+
+        self._get_response(write=False)
+
+        assert self.read_databases == [PRIMARY_DATABASE]
+
+
+class ReplicaStickinessViewTest(OwnerShardTestMixin, TestCase):
+    """Test that writing views pin the user to the primary."""
+
+    # Only the default shard has a replica
+    shard = PRIMARY_DATABASE
+
+    def test_creating_a_project_pins_reads(self) -> None:
+        """Test that a project create response sets the sticky cookie."""
+        user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(user)
+        self.client.force_login(user)
+
+        response = self.client.post(
+            reverse('projects:create'), {'title': 'New project'}
+        )
+
+        assert response.status_code == 200
+        assert settings.REPLICA_STICKY_COOKIE in response.cookies
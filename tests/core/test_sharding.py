@@ -0,0 +1,227 @@
+from io import StringIO
+from typing import TYPE_CHECKING
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core.sharding import (
+    get_active_shard,
+    get_shard,
+    on_shard,
+    owner_shard,
+)
+from project.exceptions import ProjectConflictError
+from project.models import Project
+from project.repositories import ProjectRepository
+from task.models import Task
+from task.repositories import TaskRepository
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+    User = AbstractUser
+else:
+    User = get_user_model()
+
+SHARDS = ['default', 'shard_1', 'shard_2']
+
+
+@override_settings(PROJECT_SHARDS=SHARDS, PROJECT_SHARD_OVERRIDES={})
+class ShardPlacementTest(SimpleTestCase):
+    """Test cases for placing owners on shards."""
+
+    def test_single_shard_is_the_default_database(self) -> None:
+        """Test that without extra shards everyone stays on default."""
+        with self.settings(PROJECT_SHARDS=['default']):
+            assert {get_shard(owner_id) for owner_id in range(100)} == {
+                DEFAULT_DB_ALIAS
+            }
+
+    def test_owners_are_spread_over_all_shards(self) -> None:
+        """Test that placement is stable and uses every shard."""
+        placement = [get_shard(owner_id) for owner_id in range(300)]
+
+        assert placement == [get_shard(owner_id) for owner_id in range(300)]
+        assert set(placement) == set(SHARDS)
+        assert min(placement.count(shard) for shard in SHARDS) > 60
+
+    def test_adding_a_shard_only_moves_owners_to_it(self) -> None:
+        """Test that a new shard does not reshuffle the other owners."""
+        before = {owner_id: get_shard(owner_id) for owner_id in range(300)}
+
+        with self.settings(PROJECT_SHARDS=[*SHARDS, 'shard_3']):
+            moved = {
+                owner_id: get_shard(owner_id) for owner_id in before
+                if get_shard(owner_id) != before[owner_id]
+            }
+
+        assert moved
+        assert set(moved.values()) == {'shard_3'}
+        assert len(moved) < len(before) / 2
+
+    def test_override_pins_owner(self) -> None:
+        """Test that an overridden owner is kept on the given shard."""
+        owner_id = next(
+            owner_id for owner_id in range(100)
+            if get_shard(owner_id) != 'shard_2'
+        )
+
+        with self.settings(PROJECT_SHARD_OVERRIDES={owner_id: 'shard_2'}):
+            assert get_shard(owner_id) == 'shard_2'
+
+    def test_default_shard_queries_are_left_to_the_routers(self) -> None:
+        """Test that only queries on extra shards are pinned."""
+        on_default = next(
+            owner_id for owner_id in range(100)
+            if get_shard(owner_id) == DEFAULT_DB_ALIAS
+        )
+        on_extra = next(
+            owner_id for owner_id in range(100)
+            if get_shard(owner_id) != DEFAULT_DB_ALIAS
+        )
+        queryset = Project.objects.all()
+
+        assert on_shard(queryset, on_default) is queryset
+        assert on_shard(queryset, on_extra).db == get_shard(on_extra)
+
+    def test_owner_shard_activates_the_users_shard(self) -> None:
+        """Test that a decorated method runs on its user's shard."""
+        user = User(pk=7)
+
+        @owner_shard
+        def method(text: str, user: User) -> str | None:
+            return get_active_shard()
+
+        assert method('text', user=user) == get_shard(7)
+        assert method('text', user) == get_shard(7)
+        assert get_active_shard() is None
+
+
+@skipUnless(
+    len(settings.PROJECT_SHARDS) > 1,
+    'needs PROJECT_SHARD_COUNT of 2 or more'
+)
+class ShardedDataTest(TestCase):
+    """Test cases for storing a user's data on their own shard."""
+
+    databases = {'default', 'auxiliary', *settings.PROJECT_SHARDS}
+
+    def setUp(self) -> None:
+        """Create a user pinned to the last shard."""
+        cache.clear()
+        self.shard = settings.PROJECT_SHARDS[-1]
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        overrides = self.settings(
+            PROJECT_SHARD_OVERRIDES={self.user.pk: self.shard}
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def _create_project(self) -> tuple[Project, list[Task]]:
+        """Create a project with two tasks, one of them completed."""
+        project = ProjectRepository().create_project('Sharded', self.user)
+        tasks = TaskRepository().create_tasks(
+            ['First', 'Second'], project.id, self.user
+        )
+        TaskRepository().toggle_task_completion(tasks[0].id, self.user, True)
+        return project, tasks
+
+    def test_repositories_write_to_the_users_shard(self) -> None:
+        """Test that projects and tasks are only stored on the shard."""
+        project, _ = self._create_project()
+
+        assert not Project.objects.using(DEFAULT_DB_ALIAS).exists()
+        assert not Task.objects.using(DEFAULT_DB_ALIAS).exists()
+        stored = Project.objects.using(self.shard).get()
+        assert (stored.task_count, stored.completed_count) == (2, 1)
+        assert ProjectRepository().get_project_by_id(
+            project.id, self.user
+        ).owner == self.user
+
+    def test_deleting_the_user_deletes_their_data_on_the_shard(self) -> None:
+        """Test that no projects or tasks are left behind on the shard."""
+        self._create_project()
+        with self.captureOnCommitCallbacks(using=self.shard, execute=True):
+            self.user.delete()
+
+        assert not Project.objects.using(self.shard).exists()
+        assert not Task.objects.using(self.shard).exists()
+
+    def test_views_read_from_the_users_shard(self) -> None:
+        """Test that the user sees and edits their sharded project."""
+        project, tasks = self._create_project()
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('projects:dashboard'))
+        self.assertContains(response, 'Sharded')
+        self.assertContains(response, 'Second')
+
+        response = self.client.post(
+            reverse('tasks:update', args=[tasks[1].id]),
+            {'text': 'Renamed'}
+        )
+        assert response.status_code == 200
+        assert Task.objects.using(self.shard).filter(text='Renamed').exists()
+
+    def test_move_user_shard(self) -> None:
+        """Test moving a user's data to another shard with new IDs."""
+        project, tasks = self._create_project()
+        created_at = Project.objects.using(self.shard).get().created_at
+
+        moved = ProjectRepository().move_user_shard(
+            self.user.pk, self.shard, DEFAULT_DB_ALIAS
+        )
+
+        assert moved == (1, 2)
+        assert not Project.objects.using(self.shard).exists()
+        assert not Task.objects.using(self.shard).exists()
+        copy = Project.objects.using(DEFAULT_DB_ALIAS).get()
+        assert copy.created_at == created_at
+        assert (copy.task_count, copy.completed_count) == (2, 1)
+        assert list(copy.tasks.values_list('text', 'completed')) == [
+            ('First', True), ('Second', False)
+        ]
+
+    def test_move_user_shard_refuses_to_merge(self) -> None:
+        """Test that a user's data is not copied next to existing data."""
+        self._create_project()
+        Project.objects.using(DEFAULT_DB_ALIAS).create(
+            title='Old', owner=self.user
+        )
+
+        with self.assertRaises(ProjectConflictError):
+            ProjectRepository().move_user_shard(
+                self.user.pk, self.shard, DEFAULT_DB_ALIAS
+            )
+        assert Project.objects.using(self.shard).exists()
+
+    def test_reshard_user_command(self) -> None:
+        """Test moving a user to the shard they are routed to now."""
+        source = self.shard
+        target = next(
+            shard for shard in settings.PROJECT_SHARDS if shard != source
+        )
+        self._create_project()
+        out = StringIO()
+
+        with self.settings(PROJECT_SHARD_OVERRIDES={self.user.pk: target}):
+            call_command(
+                'reshard_user', self.user.pk, '--from', source, stdout=out
+            )
+            projects = ProjectRepository().get_user_projects(self.user)
+
+            assert [project.title for project in projects] == ['Sharded']
+            assert TaskRepository().get_task_stats(
+                projects[0].id, self.user
+            )['completed_tasks'] == 1
+        assert not Project.objects.using(source).exists()
+        self.assertIn(f'from {source} to {target}', out.getvalue())
@@ -0,0 +1,177 @@
+import sqlite3
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.core.management import call_command
+from django.db import (
+    OperationalError,
+    connection,
+    connections,
+    transaction,
+)
+from django.db.models import QuerySet
+from django.test import TransactionTestCase
+
+from core import transactions
+from core.transactions import (
+    WRITE_RETRY_ATTEMPTS,
+    RetryMetrics,
+    is_busy_error,
+    retry_metrics,
+    write_transaction,
+)
+from core.unit_of_work import unit_of_work
+from project.models import Project
+
+
+class WriteTransactionTest(TransactionTestCase):
+    """Test cases for the retrying write transaction decorator."""
+
+    databases = {'default', *settings.PROJECT_SHARDS}
+
+    def setUp(self) -> None:
+        """Reset the metrics and skip the backoff sleeps."""
+        retry_metrics.reset()
+        patcher = mock.patch.object(transactions.time, 'sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _failing_write(self, *errors: Exception) -> mock.Mock:
+        """Build a decorated write raising ``errors`` before succeeding."""
+        func = mock.Mock(side_effect=[*errors, 'done'])
+        func.__qualname__ = 'write'
+        return write_transaction(Project)(func)
+
+    def test_busy_error_is_retried(self) -> None:
+        """Test that a busy database is retried until the write succeeds."""
+        write = self._failing_write(
+            OperationalError('database is locked'),
+            OperationalError('database is locked'),
+        )
+
+        assert write() == 'done'
+        assert self.sleep.call_count == 2
+        assert retry_metrics.snapshot() == {
+            'write': {'retries': 2, 'exhausted': 0}
+        }
+
+    def test_busy_error_is_raised_after_last_attempt(self) -> None:
+        """Test that the error surfaces once the attempts are used up."""
+        write = self._failing_write(
+            *[OperationalError('database is locked')] * WRITE_RETRY_ATTEMPTS
+        )
+
+        with self.assertRaises(OperationalError):
+            write()
+        assert retry_metrics.snapshot() == {
+            'write': {
+                'retries': WRITE_RETRY_ATTEMPTS - 1,
+                'exhausted': 1,
+            }
+        }
+
+    def test_other_errors_are_not_retried(self) -> None:
+        """Test that errors other than a busy database are raised at once."""
+        write = self._failing_write(OperationalError('no such table: x'))
+
+        with self.assertRaises(OperationalError):
+            write()
+        self.sleep.assert_not_called()
+        assert retry_metrics.snapshot() == {}
+
+    def test_metrics_are_shared_through_the_cache(self) -> None:
+        """Test that another process reads the same counters."""
+        write = self._failing_write(OperationalError('database is locked'))
+        write()
+        other_process = RetryMetrics()
+        other_process.register('write')
+
+        assert other_process.snapshot() == {
+            'write': {'retries': 1, 'exhausted': 0}
+        }
+
+        other_process.reset()
+        assert retry_metrics.snapshot() == {}
+
+    def test_retry_stats_command(self) -> None:
+        """Test that the command reports the counters of every write."""
+        write = self._failing_write(
+            OperationalError('database is locked'),
+            OperationalError('database is locked'),
+        )
+        write()
+        out = StringIO()
+
+        call_command('retry_stats', '--reset', stdout=out)
+
+        rows = {
+            line.split()[0]: line.split()[1:]
+            for line in out.getvalue().splitlines()[1:-1]
+        }
+        assert rows['write'] == ['2', '0']
+        assert rows['TaskRepository.update_task'] == ['0', '0']
+        assert rows['UnitOfWork._write_batch'] == ['0', '0']
+        assert retry_metrics.snapshot() == {}
+
+    def test_nested_write_is_not_retried(self) -> None:
+        """Test that only the outermost transaction is retried."""
+        write = self._failing_write(OperationalError('database is locked'))
+
+        with self.assertRaises(OperationalError):
+            with transaction.atomic():
+                write()
+        self.sleep.assert_not_called()
+
+    def test_write_begins_immediate_transaction(self) -> None:
+        """Test that SQLite takes the write lock when the write begins."""
+        if connection.vendor != 'sqlite':
+            self.skipTest('BEGIN IMMEDIATE is SQLite specific')
+
+        @write_transaction(Project)
+        def write() -> str | None:
+            return connection.transaction_mode
+
+        previous = connection.transaction_mode
+        assert write() == 'IMMEDIATE'
+        assert connection.transaction_mode == previous
+
+    def test_unit_of_work_flush_is_retried(self) -> None:
+        """Test that a deferred update is a retried write transaction."""
+        user = get_user_model().objects.create_user(username='flush')
+        project = Project.objects.create(title='Before', owner=user)
+        shard = connections[project._state.db]
+        bulk_update = QuerySet.bulk_update
+        modes = []
+
+        def busy_once(queryset, *args, **kwargs):
+            modes.append(getattr(shard, 'transaction_mode', None))
+            if len(modes) == 1:
+                raise OperationalError('database is locked')
+            return bulk_update(queryset, *args, **kwargs)
+
+        with unit_of_work() as uow:
+            project = uow.add(project)
+            project.title = 'After'
+            uow.mark_dirty(project, ['title'])
+            with mock.patch.object(QuerySet, 'bulk_update', busy_once):
+                uow.flush()
+
+        project.refresh_from_db()
+        assert project.title == 'After'
+        assert len(modes) == 2
+        assert self.sleep.call_count == 1
+        if shard.vendor == 'sqlite':
+            assert modes == ['IMMEDIATE', 'IMMEDIATE']
+
+    def test_is_busy_error_reads_sqlite_error_code(self) -> None:
+        """Test that busy errors are recognised by their result code."""
+        cause = sqlite3.OperationalError('database is locked')
+        cause.sqlite_errorcode = 5 | (2 << 8)  # SQLITE_BUSY_RECOVERY
+        error = OperationalError('database is locked')
+        error.__cause__ = cause
+
+        assert is_busy_error(error)
+        cause.sqlite_errorcode = 1
+        assert not is_busy_error(error)
@@ -0,0 +1,239 @@
+from typing import TYPE_CHECKING
+from unittest import mock, skipUnless
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.unit_of_work import get_unit_of_work, unit_of_work
+from project.models import Project
+from project.repositories import ProjectRepository
+from project.services import ProjectService
+from task.models import Task
+from task.repositories import TaskRepository
+from task.services import TaskService
+from tests.sharding import OwnerShardTestMixin
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+    User = AbstractUser
+else:
+    User = get_user_model()
+
+
+class UnitOfWorkTest(OwnerShardTestMixin, TestCase):
+    """Test cases for the request-scoped identity map and unit of work."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user: User = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user, self.other_user)
+        self.project: Project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.task: Task = Task.objects.create(
+            text='Test task', project=self.project, priority=1
+        )
+
+    def test_no_unit_of_work_outside_scope(self) -> None:
+        """Test that nothing is active outside a unit of work block."""
+        self.assertIsNone(get_unit_of_work())
+
+    def test_load_returns_same_instance_once(self) -> None:
+        """Test that an object is loaded at most once per unit of work."""
+        queryset = Project.objects.for_user(self.user)
+
+        with unit_of_work() as uow:
+            with CaptureQueriesContext(self.shard_connection) as ctx:
+                first = uow.load(queryset, self.project.id, self.user.pk)
+                second = uow.load(queryset, str(self.project.id), self.user.pk)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(ctx), 1)
+
+    def test_load_checks_new_scope(self) -> None:
+        """Test that a loaded object is not handed out to another scope."""
+        with unit_of_work() as uow:
+            uow.load(
+                Project.objects.for_user(self.user),
+                self.project.id,
+                self.user.pk
+            )
+            with self.assertRaises(Project.DoesNotExist):
+                uow.load(
+                    Project.objects.for_user(self.other_user),
+                    self.project.id,
+                    self.other_user.pk
+                )
+
+    def test_flush_batches_updates(self) -> None:
+        """Test that pending updates are written by one statement per model."""
+        other_task = Task.objects.create(
+            text='Other task', project=self.project, priority=2
+        )
+
+        with unit_of_work() as uow:
+            for task, text in [(self.task, 'First'), (other_task, 'Second')]:
+                task.text = text
+                uow.mark_dirty(task, ['text'])
+            self.assertEqual(
+                Task.objects.using(self.shard).get(
+                    pk=self.task.pk
+                ).text, 'Test task'
+            )
+            with CaptureQueriesContext(self.shard_connection) as ctx:
+                uow.flush()
+
+        updates = [q for q in ctx.captured_queries
+                   if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(Task.objects.using(self.shard).order_by('id').values_list(
+                'text', flat=True
+            )),
+            ['First', 'Second']
+        )
+
+    @skipUnless(
+        len(settings.PROJECT_SHARDS) > 1,
+        'needs PROJECT_SHARD_COUNT of 2 or more'
+    )
+    def test_equal_ids_on_different_shards_are_kept_apart(self) -> None:
+        """Test that rows numbered alike on two shards are two objects."""
+        Project.objects.using(DEFAULT_DB_ALIAS).create(
+            pk=self.project.pk, title='Default Project', owner=self.other_user
+        )
+
+        with unit_of_work() as uow:
+            sharded = uow.load(
+                Project.objects.using(self.shard), self.project.pk
+            )
+            default = uow.load(
+                Project.objects.using(DEFAULT_DB_ALIAS), self.project.pk
+            )
+            self.assertIsNot(sharded, default)
+            for project in (sharded, default):
+                project.title = f'Renamed {project.title}'
+                uow.mark_dirty(project, ['title'])
+            uow.flush()
+
+        self.assertEqual(
+            Project.objects.using(self.shard).get(pk=self.project.pk).title,
+            'Renamed Test Project'
+        )
+        self.assertEqual(
+            Project.objects.using(DEFAULT_DB_ALIAS).get(
+                pk=self.project.pk
+            ).title,
+            'Renamed Default Project'
+        )
+
+    def test_service_update_loads_task_once(self) -> None:
+        """Test that the service and repository share one task instance."""
+        with unit_of_work():
+            with CaptureQueriesContext(self.shard_connection) as ctx:
+                TaskService().update_task(
+                    self.task.id, self.user, text='Updated'
+                )
+
+        task_selects = [
+            q for q in ctx.captured_queries
+            if q['sql'].startswith('SELECT') and 'FROM "tasks"' in q['sql']
+        ]
+        self.assertEqual(len(task_selects), 1)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.text, 'Updated')
+
+    def test_discard_on_error(self) -> None:
+        """Test that pending updates are dropped when the block raises."""
+        with self.assertRaises(RuntimeError):
+            with unit_of_work() as uow:
+                self.task.text = 'Lost'
+                uow.mark_dirty(self.task, ['text'])
+                raise RuntimeError
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.text, 'Test task')
+
+    def test_update_is_written_before_the_service_returns(self) -> None:
+        """Test that field edits are not left for after the response."""
+        with unit_of_work():
+            ProjectService().update_project(
+                self.project.id, 'Renamed', self.user
+            )
+            self.assertEqual(
+                Project.objects.using(self.shard).get(
+                    pk=self.project.pk
+                ).title, 'Renamed'
+            )
+
+    def test_duplicate_title_is_a_validation_error(self) -> None:
+        """Test that a unique title clash is reported, not raised.
+
+        The title is taken after the service's check, as by a concurrent
+        request, so the clash surfaces when the update is flushed.
+        """
+        Project.objects.create(title='Taken', owner=self.user)
+
+        with unit_of_work(), mock.patch.object(
+                ProjectRepository, 'project_exists', return_value=False
+        ):
+            with self.assertRaises(ValidationError):
+                ProjectService().update_project(
+                    self.project.id, 'Taken', self.user
+                )
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.title, 'Test Project')
+
+    def test_loads_after_a_write_see_the_new_row(self) -> None:
+        """Test that a set-based write does not leave a stale instance."""
+        repository = TaskRepository()
+
+        with unit_of_work():
+            loaded = repository.get_task_by_id(self.task.id, self.user)
+            repository.toggle_task_completion(self.task.id, self.user, True)
+            reloaded = repository.get_task_by_id(self.task.id, self.user)
+
+        self.assertFalse(loaded.completed)
+        self.assertTrue(reloaded.completed)
+
+    def test_completion_edit_keeps_counters(self) -> None:
+        """Test that completing through update_task shifts the counters."""
+        Project.objects.using(self.shard).filter(
+            pk=self.project.pk
+        ).update(task_count=1)
+
+        with unit_of_work():
+            TaskService().update_task(self.task.id, self.user, completed=True)
+
+        self.project.refresh_from_db()
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.completed)
+        self.assertEqual(self.project.completed_count, 1)
+
+    def test_view_edit_is_written_in_the_request(self) -> None:
+        """Test that a view's edit is stored when its response is built."""
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('projects:update', kwargs={'pk': self.project.pk}),
+            {'title': 'Renamed'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.title, 'Renamed')
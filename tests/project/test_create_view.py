@@ -3,11 +3,12 @@ from django.test import Client, TestCase
 from django.urls import reverse
 
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 User = get_user_model()
 
 
-class ProjectCreateViewTest(TestCase):
+class ProjectCreateViewTest(OwnerShardTestMixin, TestCase):
     """Test cases for the ProjectCreateView."""
 
     def setUp(self):
@@ -18,6 +19,7 @@ class ProjectCreateViewTest(TestCase):
             email='test@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.user)
         self.create_url = reverse('projects:create')
 
     def test_login_required(self):
@@ -38,7 +40,7 @@ class ProjectCreateViewTest(TestCase):
         self.client.login(username='testuser', password='testpassword')
 
         # Initial count
-        initial_count = Project.objects.count()
+        initial_count = Project.objects.using(self.shard).count()
 
         # Create a project
         response = self.client.post(
@@ -51,10 +53,10 @@ class ProjectCreateViewTest(TestCase):
         assert response.status_code == 200
 
         # Check that a project was created
-        assert Project.objects.count() == initial_count + 1
+        assert Project.objects.using(self.shard).count() == initial_count + 1
 
         # Check project attributes
-        project = Project.objects.latest('created_at')
+        project = Project.objects.using(self.shard).latest('created_at')
         assert project.title == 'New Test Project'
         assert project.owner == self.user
 
@@ -63,7 +65,7 @@ class ProjectCreateViewTest(TestCase):
         self.client.login(username='testuser', password='testpassword')
 
         # Initial count
-        initial_count = Project.objects.count()
+        initial_count = Project.objects.using(self.shard).count()
 
         # Try to create a project with empty title
         response = self.client.post(
@@ -76,7 +78,7 @@ class ProjectCreateViewTest(TestCase):
         assert response.status_code == 422  # Unprocessable Entity
 
         # Check that no project was created
-        assert Project.objects.count() == initial_count
+        assert Project.objects.using(self.shard).count() == initial_count
 
         # Check that the response contains the form with errors
         assert 'form' in response.content.decode()
@@ -1,23 +1,29 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from project.models import Project
+from task.models import Task
+from tests.sharding import OwnerShardTestMixin
 
 User = get_user_model()
 
 
-class DashboardViewTest(TestCase):
+class DashboardViewTest(OwnerShardTestMixin, TestCase):
     """Test cases for the DashboardView."""
 
     def setUp(self):
         """Set up test data."""
+        cache.clear()
         self.client = Client()
         self.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.user)
         self.dashboard_url = reverse('projects:dashboard')
 
         # Create some projects for the user
@@ -35,6 +41,7 @@ class DashboardViewTest(TestCase):
             email='other@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.other_user)
         self.other_project = Project.objects.create(
             title='Other User Project',
             owner=self.other_user
@@ -70,4 +77,176 @@ class DashboardViewTest(TestCase):
         assert response.status_code == 200
         assert len(response.context['projects']) == 5
 
+    def test_dashboard_query_count_does_not_grow_with_projects(self):
+        """Test that tasks are loaded in a fixed number of queries."""
+        def count_dashboard_queries(username):
+            self.client.login(username=username, password='testpassword')
+            with CaptureQueriesContext(self.shard_connection) as queries:
+                response = self.client.get(self.dashboard_url)
+            assert response.status_code == 200
+            return len(queries)
 
+        Task.objects.create(text='Other task', project=self.other_project)
+        single_project_queries = count_dashboard_queries('otheruser')
+
+        for project in self.projects:
+            for i in range(3):
+                Task.objects.create(text=f'Task {i}', project=project)
+        full_page_queries = count_dashboard_queries('testuser')
+
+        assert single_project_queries == full_page_queries
+
+    def test_dashboard_renders_tasks_in_priority_order(self):
+        """Test that prefetched tasks keep the priority ordering."""
+        self.client.login(username='testuser', password='testpassword')
+        project = self.projects[-1]
+        Task.objects.create(text='Second task', project=project, priority=2)
+        Task.objects.create(text='First task', project=project, priority=1)
+
+        response = self.client.get(self.dashboard_url)
+        content = response.content.decode()
+
+        assert content.index('First task') < content.index('Second task')
+
+    def test_dashboard_cursor_pagination(self):
+        """Test that the cursor walks through all projects newest first."""
+        self.client.login(username='testuser', password='testpassword')
+
+        response = self.client.get(self.dashboard_url)
+        first_page = list(response.context['projects'])
+        next_cursor = response.context['page_obj'].next_cursor
+        assert len(first_page) == 10
+        assert next_cursor is not None
+        self.assertContains(response, 'hx-trigger="revealed"')
+
+        response = self.client.get(
+            self.dashboard_url, {'cursor': next_cursor}
+        )
+        second_page = list(response.context['projects'])
+        assert len(second_page) == 5
+        assert response.context['page_obj'].next_cursor is None
+
+        expected = sorted(
+            self.projects,
+            key=lambda project: (project.created_at, project.id),
+            reverse=True
+        )
+        assert first_page + second_page == expected
+
+    def test_dashboard_cursor_pagination_uses_seek(self):
+        """Test that cursor pages seek instead of using OFFSET."""
+        self.client.login(username='testuser', password='testpassword')
+        response = self.client.get(self.dashboard_url)
+        next_cursor = response.context['page_obj'].next_cursor
+
+        with CaptureQueriesContext(self.shard_connection) as queries:
+            self.client.get(self.dashboard_url, {'cursor': next_cursor})
+
+        project_queries = [
+            query['sql'] for query in queries
+            if 'FROM "projects"' in query['sql']
+            and 'ORDER BY' in query['sql']
+        ]
+        assert len(project_queries) == 1
+        assert 'OFFSET' not in project_queries[0]
+        assert 'LIMIT 11' in project_queries[0]
+
+    def test_dashboard_invalid_cursor(self):
+        """Test that a malformed cursor returns 404."""
+        self.client.login(username='testuser', password='testpassword')
+        response = self.client.get(
+            self.dashboard_url, {'cursor': 'not-a-cursor'}
+        )
+        assert response.status_code == 404
+
+    def test_dashboard_htmx_cursor_renders_page_fragment(self):
+        """Test that HTMX infinite-scroll requests get only the page."""
+        self.client.login(username='testuser', password='testpassword')
+        response = self.client.get(self.dashboard_url)
+        next_cursor = response.context['page_obj'].next_cursor
+
+        response = self.client.get(
+            self.dashboard_url,
+            {'cursor': next_cursor},
+            HTTP_HX_REQUEST='true'
+        )
+
+        assert response.status_code == 200
+        self.assertTemplateUsed(response, 'project/project_page.html')
+        self.assertTemplateNotUsed(response, 'project/dashboard.html')
+
+    def test_dashboard_project_stats_are_lazy(self):
+        """Test that stats are only queried when the template reads them."""
+        self.client.login(username='testuser', password='testpassword')
+
+        with CaptureQueriesContext(self.shard_connection) as queries:
+            response = self.client.get(self.dashboard_url)
+
+        assert not any(
+            'SUM(' in query['sql'].upper() for query in queries
+        )
+        assert response.context['project_stats']['total_projects'] == 15
+
+
+    def test_dashboard_project_stats_are_cached(self):
+        """Test that the stats aggregate is not repeated on every load."""
+        self.client.login(username='testuser', password='testpassword')
+        response = self.client.get(self.dashboard_url)
+        assert response.context['project_stats']['total_tasks'] == 0
+
+        with CaptureQueriesContext(self.shard_connection) as queries:
+            response = self.client.get(self.dashboard_url)
+            stats = dict(response.context['project_stats'])
+        assert not any(
+            'SUM(' in query['sql'].upper() for query in queries
+        )
+        assert stats['total_projects'] == 15
+
+        with self.captureOnCommitCallbacks(using=self.shard, execute=True):
+            project_id = self.projects[-1].id
+            self.client.post(
+                reverse('tasks:create', args=[project_id]),
+                {f'searchInput-{project_id}': 'Fresh task'}
+            )
+        response = self.client.get(self.dashboard_url)
+
+        assert response.context['project_stats']['total_tasks'] == 1
+
+    def test_dashboard_page_is_cached_until_the_user_writes(self):
+        """Test that a repeated load skips the projects query."""
+        self.client.login(username='testuser', password='testpassword')
+        self.client.get(self.dashboard_url)
+
+        with CaptureQueriesContext(self.shard_connection) as queries:
+            response = self.client.get(self.dashboard_url)
+        assert not any(
+            'FROM "projects"' in query['sql']
+            and 'ORDER BY' in query['sql']
+            for query in queries
+        )
+        assert len(response.context['projects']) == 10
+
+        with self.captureOnCommitCallbacks(using=self.shard, execute=True):
+            project_id = self.projects[-1].id
+            self.client.post(
+                reverse('tasks:create', args=[project_id]),
+                {f'searchInput-{project_id}': 'Fresh task'}
+            )
+        response = self.client.get(self.dashboard_url)
+
+        self.assertContains(response, 'Fresh task')
+
+    def test_title_update_invalidates_dashboard(self):
+        """Test that a renamed project is visible on the next load."""
+        self.client.login(username='testuser', password='testpassword')
+        self.client.get(self.dashboard_url)
+
+        with self.captureOnCommitCallbacks(using=self.shard, execute=True):
+            self.client.post(
+                reverse('projects:update', args=[self.projects[-1].id]),
+                {'title': 'Renamed Project'},
+                HTTP_HX_REQUEST='true'
+            )
+        response = self.client.get(self.dashboard_url)
+
+        self.assertContains(response, 'Renamed Project')
@@ -1,13 +1,15 @@
 from django.contrib.auth import get_user_model
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 User = get_user_model()
 
 
-class ProjectDeleteViewTest(TestCase):
+class ProjectDeleteViewTest(OwnerShardTestMixin, TestCase):
     """Test cases for the ProjectDeleteView."""
 
     def setUp(self):
@@ -18,6 +20,7 @@ class ProjectDeleteViewTest(TestCase):
             email='test@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.user)
         self.project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -34,6 +37,7 @@ class ProjectDeleteViewTest(TestCase):
             email='other@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.other_user)
         self.other_project = Project.objects.create(
             title='Other Project',
             owner=self.other_user
@@ -52,7 +56,9 @@ class ProjectDeleteViewTest(TestCase):
         assert response.status_code == 302
 
         # Verify project still exists
-        assert Project.objects.filter(pk=self.project.pk).exists()
+        assert Project.objects.using(self.shard).filter(
+            pk=self.project.pk
+        ).exists()
 
 
 
@@ -61,8 +67,36 @@ class ProjectDeleteViewTest(TestCase):
         self.client.login(username='testuser', password='testpassword')
 
         # Initial count
-        initial_count = Project.objects.count()
+        initial_count = Project.objects.using(self.shard).count()
 
         # Check that the project was not deleted
-        assert Project.objects.count() == initial_count
-        assert Project.objects.filter(pk=self.project.pk).exists()
+        assert Project.objects.using(self.shard).count() == initial_count
+        assert Project.objects.using(self.shard).filter(
+            pk=self.project.pk
+        ).exists()
+
+    def test_delete_loads_project_once(self):
+        """Test that deleting reads the user's project a single time."""
+        self.client.login(username='testuser', password='testpassword')
+
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            response = self.client.post(self.delete_url)
+
+        loads = [q for q in ctx.captured_queries
+                 if q['sql'].startswith('SELECT "projects"."id"')]
+        assert response.status_code == 204
+        assert len(loads) == 1
+        assert not Project.objects.using(self.shard).filter(
+            pk=self.project.pk
+        ).exists()
+
+    def test_cannot_delete_other_users_project(self):
+        """Test that another user's project is not found."""
+        self.client.login(username='testuser', password='testpassword')
+
+        response = self.client.post(self.other_delete_url)
+
+        assert response.status_code == 404
+        assert Project.objects.using(self.shard).filter(
+            pk=self.other_project.pk
+        ).exists()
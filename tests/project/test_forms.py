@@ -3,11 +3,12 @@ from django.test import TestCase
 
 from project.forms import CreateForm, EditForm
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 User = get_user_model()
 
 
-class CreateFormTest(TestCase):
+class CreateFormTest(OwnerShardTestMixin, TestCase):
     """Test cases for the CreateForm."""
 
     def setUp(self):
@@ -17,6 +18,7 @@ class CreateFormTest(TestCase):
             email='test@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.user)
         self.project = Project.objects.create(
             title='Existing Project',
             owner=self.user
@@ -57,7 +59,7 @@ class CreateFormTest(TestCase):
         assert form.cleaned_data['title'] == 'Test Title'
 
 
-class EditFormTest(TestCase):
+class EditFormTest(OwnerShardTestMixin, TestCase):
     """Test cases for the EditForm."""
 
     def setUp(self):
@@ -67,6 +69,7 @@ class EditFormTest(TestCase):
             email='test@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.user)
         self.project = Project.objects.create(
             title='Existing Project',
             owner=self.user
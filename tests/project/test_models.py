@@ -3,11 +3,12 @@ from django.db.utils import IntegrityError
 from django.test import TestCase
 
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 User = get_user_model()
 
 
-class ProjectModelTest(TestCase):
+class ProjectModelTest(OwnerShardTestMixin, TestCase):
     """Test cases for the Project model."""
 
     def setUp(self):
@@ -17,6 +18,7 @@ class ProjectModelTest(TestCase):
             email='test@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.user)
         self.project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -42,6 +44,23 @@ class ProjectModelTest(TestCase):
                 owner=self.user  # Same owner
             )
 
+    def test_title_can_be_reused_by_another_user(self):
+        """Test that titles are only unique per owner."""
+        another_user = User.objects.create_user(
+            username='anotheruser',
+            email='another@example.com',
+            password='testpassword'
+        )
+        # On the same shard, where a global unique index would apply
+        self.keep_on_shard(another_user)
+
+        project = Project.objects.create(
+            title='Test Project',
+            owner=another_user
+        )
+
+        assert project.title == self.project.title
+
     def test_project_manager_for_user(self):
         """Test the for_user method of ProjectManager."""
         # Create another project for the same user
@@ -56,6 +75,7 @@ class ProjectModelTest(TestCase):
             email='another@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(another_user)
         Project.objects.create(
             title='Other User Project',
             owner=another_user
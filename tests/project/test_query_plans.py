@@ -0,0 +1,161 @@
+from io import StringIO
+from typing import TYPE_CHECKING
+from unittest import skipUnless
+
+from django.contrib.auth import authenticate, get_user_model
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test import TestCase
+
+from core.pagination import KeysetPage, KeysetPaginator
+from project.models import Project
+from project.repositories import ProjectRepository
+from task.repositories import TaskRepository
+from tests.query_plans import TEMP_SORT, QueryPlanTestMixin
+from tests.sharding import OwnerShardTestMixin
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+    User = AbstractUser
+else:
+    User = get_user_model()
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plans are checked on SQLite')
+class ProjectRepositoryQueryPlanTest(
+    OwnerShardTestMixin,
+    QueryPlanTestMixin,
+    TestCase
+):
+    """Test that every ProjectRepository query is served by an index."""
+
+    # Plans are captured on the default database, see QueryPlanTestMixin
+    shard = DEFAULT_DB_ALIAS
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user)
+        self.repository: ProjectRepository = ProjectRepository()
+        self.projects: list[Project] = [
+            Project.objects.create(title=f'Project {i}', owner=self.user)
+            for i in range(15)
+        ]
+        self.project: Project = self.projects[0]
+        TaskRepository().create_tasks(
+            ['One', 'Two', 'Three'], self.project.id, self.user
+        )
+
+    def test_get_user_projects(self) -> None:
+        """Test listing a user's projects newest first."""
+        self.assertIndexedQueries(
+            self.repository.get_user_projects, self.user, limit=5
+        )
+
+    def test_get_dashboard_projects_pages(self) -> None:
+        """Test the first and a following dashboard page with tasks.
+
+        The tasks prefetch is limited per project with a window function,
+        and SQLite re-sorts its already bounded output in a temporary
+        B-tree, so only table scans are checked for that query.
+        """
+        def get_page(cursor: str | None = None) -> KeysetPage[Project]:
+            return KeysetPaginator(
+                self.repository.get_dashboard_projects(self.user, 2),
+                10,
+                ('-created_at', '-id')
+            ).get_page(cursor)
+
+        cursor = None
+        for _ in range(2):
+            page, plans = self.capture_plans(get_page, cursor)
+            (projects_sql, projects_plan), (tasks_sql, tasks_plan) = plans
+            for sql, plan in plans:
+                self.assertFalse(
+                    self.get_table_scans(plan), f'{sql}\n{plan}'
+                )
+            self.assertFalse(
+                [detail for detail in projects_plan if TEMP_SORT in detail],
+                f'{projects_sql}\n{projects_plan}'
+            )
+            self.assertIn(
+                'SEARCH tasks USING INDEX tasks_project_prio_id_idx '
+                '(project_id=?)',
+                tasks_plan
+            )
+            cursor = page.next_cursor
+
+    def test_get_project_by_id(self) -> None:
+        """Test loading one project of the user."""
+        self.assertIndexedQueries(
+            self.repository.get_project_by_id, self.project.id, self.user
+        )
+
+    def test_project_exists(self) -> None:
+        """Test the duplicate title check."""
+        self.assertIndexedQueries(
+            self.repository.project_exists, 'Project 3', self.user
+        )
+
+    def test_get_project_stats(self) -> None:
+        """Test the dashboard statistics aggregate."""
+        self.assertIndexedQueries(self.repository.get_project_stats, self.user)
+
+    def test_search_projects(self) -> None:
+        """Test searching the user's projects by title."""
+        self.assertIndexedQueries(
+            self.repository.search_projects, self.user, 'project'
+        )
+
+    def test_delete_project(self) -> None:
+        """Test deleting a project together with its tasks."""
+        self.assertIndexedQueries(
+            self.repository.delete_project, self.project.id, self.user
+        )
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plans are checked on SQLite')
+class UserEmailLookupQueryPlanTest(QueryPlanTestMixin, TestCase):
+    """Test that allauth's login lookup by email is served by an index."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+    def test_login_by_email(self) -> None:
+        """Test the case-insensitive email lookup done on login."""
+        user, plans = self.capture_plans(
+            authenticate,
+            None,
+            email='Test@Example.com',
+            password='testpass123'
+        )
+
+        assert user == self.user
+        for sql, plan in plans:
+            self.assertFalse(self.get_table_scans(plan), f'{sql}\n{plan}')
+        self.assertTrue(
+            any('users_email_idx' in ' '.join(plan) for _, plan in plans),
+            plans
+        )
+
+    def test_benchmark_email_login_command(self) -> None:
+        """Test that the benchmark finds its users through the index."""
+        out = StringIO()
+
+        call_command(
+            'benchmark_email_login', '--users', '50', '--lookups', '5',
+            stdout=out
+        )
+
+        self.assertIn('users_email_idx', out.getvalue())
+        self.assertIn('Lookups: 5,', out.getvalue())
+        assert list(User.objects.all()) == [self.user]
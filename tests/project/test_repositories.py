@@ -0,0 +1,106 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from project.models import Project
+from project.repositories import ProjectRepository
+from task.repositories import TaskRepository
+from tests.sharding import OwnerShardTestMixin
+
+User = get_user_model()
+
+
+class ProjectRepositoryStatsTest(OwnerShardTestMixin, TestCase):
+    """Test cases for ProjectRepository statistics."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpassword'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpassword'
+        )
+        self.keep_on_shard(self.user, self.other_user)
+        self.repository = ProjectRepository()
+        self.task_repository = TaskRepository()
+
+        self.finished = Project.objects.create(
+            title='Finished', owner=self.user
+        )
+        self.in_progress = Project.objects.create(
+            title='In progress', owner=self.user
+        )
+        self.empty = Project.objects.create(title='Empty', owner=self.user)
+        self.foreign = Project.objects.create(
+            title='Foreign', owner=self.other_user
+        )
+
+        done = self.task_repository.create_task(
+            'Done', self.finished.id, self.user
+        )
+        self.task_repository.toggle_task_completion(done.id, self.user, True)
+        for text in ('One', 'Two'):
+            task = self.task_repository.create_task(
+                text, self.in_progress.id, self.user
+            )
+        self.task_repository.toggle_task_completion(task.id, self.user, True)
+        self.task_repository.create_task(
+            'Foreign', self.foreign.id, self.other_user
+        )
+
+    def test_get_project_stats(self):
+        """Test that project and task statistics are aggregated."""
+        stats = self.repository.get_project_stats(self.user)
+
+        assert stats['total_projects'] == 3
+        assert stats['active_projects'] == 3
+        assert stats['archived_projects'] == 0
+        assert stats['empty_projects'] == 1
+        assert stats['finished_projects'] == 1
+        assert stats['total_tasks'] == 3
+        assert stats['completed_tasks'] == 2
+        assert stats['active_tasks'] == 1
+
+    def test_get_project_stats_single_query(self):
+        """Test that all statistics come from one aggregate query."""
+        with self.assertNumQueries(1, using=self.shard):
+            self.repository.get_project_stats(self.user)
+
+    def test_get_project_stats_no_projects(self):
+        """Test statistics for a user without projects."""
+        user = User.objects.create_user(
+            username='newuser',
+            email='new@example.com',
+            password='testpassword'
+        )
+
+        stats = self.repository.get_project_stats(user)
+
+        assert stats['total_projects'] == 0
+        assert stats['total_tasks'] == 0
+        assert stats['active_tasks'] == 0
+
+    def test_get_task_stats_for_projects(self):
+        """Test statistics for many projects in a single query."""
+        project_ids = [
+            self.finished.id,
+            self.in_progress.id,
+            self.empty.id,
+            self.foreign.id,
+        ]
+
+        with self.assertNumQueries(1, using=self.shard):
+            stats = self.task_repository.get_task_stats_for_projects(
+                project_ids, self.user
+            )
+
+        assert set(stats) == {
+            self.finished.id, self.in_progress.id, self.empty.id
+        }
+        assert stats[self.finished.id]['completion_rate'] == 100
+        assert stats[self.in_progress.id]['active_tasks'] == 1
+        assert stats[self.empty.id]['total_tasks'] == 0
@@ -0,0 +1,67 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.unit_of_work import unit_of_work
+from project.models import Project
+from project.services import ProjectService
+from tests.sharding import OwnerShardTestMixin
+
+User = get_user_model()
+
+
+class ProjectServiceOwnershipTest(OwnerShardTestMixin, TestCase):
+    """Test that project permission checks are proven by scoped queries."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpassword'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpassword'
+        )
+        self.keep_on_shard(self.user, self.other_user)
+        self.project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.service = ProjectService()
+
+    def test_update_project_does_not_load_owner(self):
+        """Test that updating checks ownership without fetching the user."""
+        with unit_of_work():
+            with CaptureQueriesContext(self.shard_connection) as ctx:
+                self.service.update_project(
+                    self.project.id, 'Renamed', self.user
+                )
+
+        # One scoped project lookup and one title uniqueness check
+        reads = [
+            q for q in ctx.captured_queries if q['sql'].startswith('SELECT')
+        ]
+        assert len(reads) == 2
+        assert not any('"auth_user"' in q['sql'] for q in ctx.captured_queries)
+
+    def test_delete_project_does_not_load_owner(self):
+        """Test that deleting checks ownership without fetching the user."""
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            self.service.delete_project(self.project.id, self.user)
+
+        assert not any('"auth_user"' in q['sql'] for q in ctx.captured_queries)
+        assert not Project.objects.using(self.shard).filter(
+            pk=self.project.pk
+        ).exists()
+
+    def test_other_users_project_is_not_found(self):
+        """Test that another user's project is rejected by one query."""
+        with self.assertNumQueries(1, using=self.shard):
+            with self.assertRaises(ValidationError):
+                self.service.update_project(
+                    self.project.id, 'Hacked', self.other_user
+                )
@@ -1,13 +1,15 @@
 from django.contrib.auth import get_user_model
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 User = get_user_model()
 
 
-class ProjectUpdateViewTest(TestCase):
+class ProjectUpdateViewTest(OwnerShardTestMixin, TestCase):
     """Test cases for the ProjectUpdateView."""
 
     def setUp(self):
@@ -18,6 +20,7 @@ class ProjectUpdateViewTest(TestCase):
             email='test@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.user)
         self.project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -31,6 +34,7 @@ class ProjectUpdateViewTest(TestCase):
             email='other@example.com',
             password='testpassword'
         )
+        self.keep_on_shard(self.other_user)
         self.other_project = Project.objects.create(
             title='Other Project',
             owner=self.other_user
@@ -93,3 +97,19 @@ class ProjectUpdateViewTest(TestCase):
         # Check that the other project was not updated
         self.other_project.refresh_from_db()
         assert self.other_project.title == 'Other Project'
+
+    def test_update_loads_project_once(self):
+        """Test that the view and service share a single project lookup."""
+        self.client.login(username='testuser', password='testpassword')
+
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            response = self.client.post(
+                self.update_url,
+                data={'title': 'Updated Project Title'},
+                HTTP_HX_REQUEST='true'
+            )
+
+        loads = [q for q in ctx.captured_queries
+                 if q['sql'].startswith('SELECT "projects"."id"')]
+        assert response.status_code == 200
+        assert len(loads) == 1
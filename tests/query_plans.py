@@ -0,0 +1,82 @@
+import re
+from typing import Any, Callable
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+
+# "SCAN tasks" without "USING ... INDEX" reads the whole table
+FULL_SCAN = re.compile(r'^SCAN (\S+)$')
+CO_ROUTINE = re.compile(r'^CO-ROUTINE (\S+)$')
+TEMP_SORT = 'USE TEMP B-TREE'
+
+
+class QueryPlanTestMixin:
+    """Assertions on SQLite's EXPLAIN QUERY PLAN for captured queries.
+
+    Queries are captured and explained on the default database only, so
+    tests of sharded repositories keep their users on the default shard.
+    """
+
+    def explain(self, sql: str) -> list[str]:
+        """Return the plan details of a captured statement."""
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def capture_plans(
+            self,
+            func: Callable[..., Any],
+            *args: Any,
+            **kwargs: Any
+    ) -> tuple[Any, list[tuple[str, list[str]]]]:
+        """Run ``func`` and return its result and the plan of each query.
+
+        Returned querysets are evaluated so their SQL is captured too.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            result = func(*args, **kwargs)
+            if isinstance(result, QuerySet):
+                result = list(result)
+
+        plans = [
+            (q['sql'], self.explain(q['sql']))
+            for q in ctx.captured_queries
+            if q['sql'].startswith(('SELECT', 'UPDATE', 'DELETE'))
+        ]
+        self.assertTrue(plans, 'No query was run.')  # type: ignore[attr-defined]
+        return result, plans
+
+    def get_table_scans(self, plan: list[str]) -> list[str]:
+        """Return the steps of ``plan`` that read a whole table.
+
+        Scans of subqueries SQLite runs as co-routines read rows the
+        subquery already produced, so they are not counted.
+        """
+        co_routines = {
+            match.group(1) for detail in plan
+            if (match := CO_ROUTINE.match(detail))
+        }
+        return [
+            detail for detail in plan
+            if (match := FULL_SCAN.match(detail))
+            and match.group(1) not in co_routines
+        ]
+
+    def assertIndexedQueries(
+            self,
+            func: Callable[..., Any],
+            *args: Any,
+            **kwargs: Any
+    ) -> Any:
+        """Run ``func`` and fail if any query scans a table or sorts."""
+        result, plans = self.capture_plans(func, *args, **kwargs)
+        for sql, plan in plans:
+            offending = self.get_table_scans(plan) + [
+                detail for detail in plan if TEMP_SORT in detail
+            ]
+            self.assertFalse(  # type: ignore[attr-defined]
+                offending,
+                f'Query is not served by an index:\n{sql}\n{plan}'
+            )
+        return result
@@ -0,0 +1,13 @@
+"""Settings for the test suite.
+
+Projects and tasks are always spread over three shards here, whatever
+the environment says, so the sharded paths run against several
+databases. ``manage.py test`` uses these settings by default.
+"""
+
+import os
+
+os.environ['PROJECT_SHARD_COUNT'] = '3'
+os.environ['PROJECT_SHARD_OVERRIDES'] = ''
+
+from core.settings import *  # noqa: E402,F403
@@ -0,0 +1,35 @@
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+class OwnerShardTestMixin:
+    """Keep the projects and tasks of a test's users on one shard.
+
+    The suite runs on several shards, see tests/settings.py. Owners are
+    placed by a hash of their ID, which differs between database
+    backends, so tests pin the users whose data they compare to a
+    fixed shard. By default that is the last one, so every such test
+    goes through the shard routing.
+    """
+
+    databases = {'default', 'auxiliary', *settings.PROJECT_SHARDS}
+    shard = settings.PROJECT_SHARDS[-1]
+
+    def keep_on_shard(self, *users: Any) -> None:
+        """Store the projects and tasks of ``users`` on ``shard``."""
+        overrides = self.settings(  # type: ignore[attr-defined]
+            PROJECT_SHARD_OVERRIDES={
+                **settings.PROJECT_SHARD_OVERRIDES,
+                **{user.pk: self.shard for user in users},
+            }
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)  # type: ignore[attr-defined]
+
+    @property
+    def shard_connection(self) -> BaseDatabaseWrapper:
+        """Connection to ``shard``, for counting and explaining queries."""
+        return connections[self.shard]
@@ -2,11 +2,13 @@ from typing import TYPE_CHECKING
 from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
 from django.contrib.admin.sites import site
+from django.db import DEFAULT_DB_ALIAS
 from django.urls import reverse
 
 from task.admin import TaskAdmin
 from task.models import Task
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -15,9 +17,12 @@ else:
     User = get_user_model()
 
 
-class TaskAdminTest(TestCase):
+class TaskAdminTest(OwnerShardTestMixin, TestCase):
     """Test cases for Task admin interface."""
 
+    # The admin reads and writes tasks on the default shard only
+    shard = DEFAULT_DB_ALIAS
+
     def setUp(self) -> None:
         """Set up test data."""
         self.client: Client = Client()
@@ -28,6 +33,7 @@ class TaskAdminTest(TestCase):
             is_staff=True,
             is_superuser=True
         )
+        self.keep_on_shard(self.user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -65,10 +71,9 @@ class TaskAdminTest(TestCase):
             self.assertIn(field, self.admin.search_fields)
 
     def test_task_admin_ordering(self) -> None:
-        """Test TaskAdmin ordering configuration."""
-        expected_ordering: list[str] = ['-priority']
-        
-        self.assertEqual(self.admin.ordering, expected_ordering)
+        """Test that TaskAdmin keeps the model's rank ordering."""
+        self.assertIsNone(self.admin.ordering)
+        self.assertEqual(Task._meta.ordering, ['priority', 'id'])
 
     def test_task_admin_readonly_fields(self) -> None:
         """Test TaskAdmin readonly_fields configuration."""
@@ -113,7 +118,7 @@ class TaskAdminTest(TestCase):
         self.assertEqual(response.status_code, 200)
 
     def test_admin_list_view_unauthorized(self) -> None:
-        """Test that admin list view is not accessible to non-staff users."""
+        """Test that admin list view sends non-staff users to the login."""
         non_staff_user: User = User.objects.create_user(
             username='nonstaffuser1',
             email='nonstaff@example.com',
@@ -124,10 +129,13 @@ class TaskAdminTest(TestCase):
         url: str = reverse('admin:task_task_changelist')
         response = self.client.get(url)
         
-        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            response.url.startswith(reverse('admin:login'))
+        )
 
     def test_admin_add_view_unauthorized(self) -> None:
-        """Test that admin add view is not accessible to non-staff users."""
+        """Test that admin add view sends non-staff users to the login."""
         non_staff_user: User = User.objects.create_user(
             username='nonstaffuser2',
             email='nonstaff@example.com',
@@ -138,10 +146,13 @@ class TaskAdminTest(TestCase):
         url: str = reverse('admin:task_task_add')
         response = self.client.get(url)
         
-        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            response.url.startswith(reverse('admin:login'))
+        )
 
     def test_admin_change_view_unauthorized(self) -> None:
-        """Test that admin change view is not accessible to non-staff users."""
+        """Test that admin change view sends non-staff users to the login."""
         non_staff_user: User = User.objects.create_user(
             username='nonstaffuser3',
             email='nonstaff@example.com',
@@ -152,10 +163,13 @@ class TaskAdminTest(TestCase):
         url: str = reverse('admin:task_task_change', args=[self.task.id])
         response = self.client.get(url)
         
-        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            response.url.startswith(reverse('admin:login'))
+        )
 
     def test_admin_delete_view_unauthorized(self) -> None:
-        """Test that admin delete view is not accessible to non-staff users."""
+        """Test that admin delete view sends non-staff users to the login."""
         non_staff_user: User = User.objects.create_user(
             username='nonstaffuser4',
             email='nonstaff@example.com',
@@ -166,7 +180,10 @@ class TaskAdminTest(TestCase):
         url: str = reverse('admin:task_task_delete', args=[self.task.id])
         response = self.client.get(url)
         
-        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            response.url.startswith(reverse('admin:login'))
+        )
 
     def test_admin_list_view_unauthenticated(self) -> None:
         """Test that admin list view redirects unauthenticated users."""
@@ -305,7 +322,7 @@ class TaskAdminTest(TestCase):
     def test_admin_model_meta_options(self) -> None:
         """Test that admin respects model meta options."""
         # Test ordering
-        self.assertEqual(Task._meta.ordering, ['-priority'])
+        self.assertEqual(Task._meta.ordering, ['priority', 'id'])
         
         # Test db_table
         self.assertEqual(Task._meta.db_table, 'tasks')
@@ -52,17 +52,17 @@ class TaskAppsTest(TestCase):
         
         # Test that task URLs can be reversed
         urls_to_test: list[tuple[str, dict]] = [
-            ('task:create', {'project_id': 1}),
-            ('task:update', {'task_id': 1}),
-            ('task:delete', {'task_id': 1}),
-            ('task:toggle', {'task_id': 1}),
-            ('task:reorder', {}),
+            ('tasks:create', {'project_id': 1}),
+            ('tasks:update', {'pk': 1}),
+            ('tasks:delete', {'pk': 1}),
+            ('tasks:toggle', {'pk': 1}),
+            ('tasks:reorder', {}),
         ]
         
         for url_name, kwargs in urls_to_test:
             try:
                 url: str = reverse(url_name, kwargs=kwargs)
-                self.assertTrue(url.startswith('/task/'))
+                self.assertTrue(url.startswith('/tasks/'))
             except Exception as e:
                 self.fail(f"Failed to reverse URL {url_name}: {e}")
 
@@ -139,7 +139,10 @@ class TaskAppsTest(TestCase):
         
         # Check that migrations exist
         loader = MigrationLoader(connection)
-        migrations = loader.migrations.get('task', {})
+        migrations = [
+            name for app_label, name in loader.disk_migrations
+            if app_label == 'task'
+        ]
         
         self.assertGreater(len(migrations), 0)
 
@@ -150,7 +153,8 @@ class TaskAppsTest(TestCase):
         # Check that templates can be loaded
         template_names: list[str] = [
             'task/task_form.html',
-            'task/delete.html',
+            'task/task_item.html',
+            'task/task_text_edit.html',
         ]
         
         for template_name in template_names:
@@ -184,7 +188,7 @@ class TaskAppsTest(TestCase):
         from django.conf import settings
         
         # Check that task app is in INSTALLED_APPS
-        self.assertIn('task', settings.INSTALLED_APPS)
+        self.assertIn('task.apps.TaskConfig', settings.INSTALLED_APPS)
 
     def test_task_app_imports(self) -> None:
         """Test that all task app modules can be imported."""
@@ -241,7 +245,7 @@ class TaskAppsTest(TestCase):
         self.assertEqual(Task._meta.db_table, 'tasks')
         self.assertEqual(Task._meta.verbose_name, 'Task')
         self.assertEqual(Task._meta.verbose_name_plural, 'Tasks')
-        self.assertEqual(Task._meta.ordering, ['-priority'])
+        self.assertEqual(Task._meta.ordering, ['priority', 'id'])
 
     def test_task_app_ready_method(self) -> None:
         """Test that task app ready method works correctly."""
@@ -76,8 +76,8 @@ class TaskConstantsTest(TestCase):
     def test_error_message_content(self) -> None:
         """Test error message content."""
         self.assertIn("empty", ERROR_TASK_TEXT_EMPTY.lower())
-        self.assertIn("short", ERROR_TASK_TEXT_TOO_SHORT.lower())
-        self.assertIn("long", ERROR_TASK_TEXT_TOO_LONG.lower())
+        self.assertIn("at least", ERROR_TASK_TEXT_TOO_SHORT.lower())
+        self.assertIn("exceed", ERROR_TASK_TEXT_TOO_LONG.lower())
         self.assertIn("invalid", ERROR_TASK_TEXT_INVALID_CHARS.lower())
         self.assertIn("not found", ERROR_TASK_NOT_FOUND.lower())
         self.assertIn("permission", ERROR_TASK_NO_PERMISSION.lower())
@@ -13,6 +13,7 @@ from task.exceptions import (
 )
 from task.models import Task
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -21,7 +22,7 @@ else:
     User = get_user_model()
 
 
-class TaskExceptionsTest(TestCase):
+class TaskExceptionsTest(OwnerShardTestMixin, TestCase):
     """Test cases for Task exceptions."""
 
     def setUp(self) -> None:
@@ -36,6 +37,7 @@ class TaskExceptionsTest(TestCase):
             email='other@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(self.user, self.other_user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -4,6 +4,7 @@ from django.contrib.auth import get_user_model
 
 from task.forms import TaskForm
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -12,7 +13,7 @@ else:
     User = get_user_model()
 
 
-class TaskFormTest(TestCase):
+class TaskFormTest(OwnerShardTestMixin, TestCase):
     """Test cases for TaskForm."""
 
     def setUp(self) -> None:
@@ -22,6 +23,7 @@ class TaskFormTest(TestCase):
             email='test@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(self.user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -3,8 +3,10 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 
+from task.constants import TASK_RANK_GAP
 from task.models import Task
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -13,7 +15,7 @@ else:
     User = get_user_model()
 
 
-class TaskCRUDIntegrationTest(TestCase):
+class TaskCRUDIntegrationTest(OwnerShardTestMixin, TestCase):
     """Integration tests for complete CRUD operations on tasks."""
 
     def setUp(self) -> None:
@@ -24,69 +26,71 @@ class TaskCRUDIntegrationTest(TestCase):
             email='test@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(self.user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
         )
 
+    def _create(self, project_id: int, text: str):
+        """POST task text the way the project's task input does."""
+        return self.client.post(
+            reverse('tasks:create', kwargs={'project_id': project_id}),
+            data={f'searchInput-{project_id}': text}
+        )
+
+    def _toggle(self, task_id: int, completed: bool):
+        """POST a completion toggle of a task."""
+        return self.client.post(
+            reverse('tasks:toggle', kwargs={'pk': task_id}),
+            data={'completed': completed},
+            content_type='application/json'
+        )
+
     def test_complete_task_lifecycle(self) -> None:
         """Test complete task lifecycle: Create -> Read -> Update -> Delete."""
         self.client.force_login(self.user)
         
         # 1. CREATE - Create a new task
-        create_data: dict = {
-            'text': 'Integration test task',
-            'priority': 5
-        }
-        create_response = self.client.post(
-            reverse('task:create', kwargs={'project_id': self.project.id}),
-            data=create_data
-        )
+        create_response = self._create(self.project.id, 'Integration test task')
         
-        self.assertEqual(create_response.status_code, 302)  # Redirect after success
+        self.assertEqual(create_response.status_code, 200)
         
         # Verify task was created
-        task: Task = Task.objects.get(text='Integration test task')
+        task: Task = Task.objects.using(self.shard).get(
+            text='Integration test task'
+        )
         self.assertEqual(task.text, 'Integration test task')
-        self.assertEqual(task.priority, 5)
+        self.assertEqual(task.priority, TASK_RANK_GAP)  # Appended
         self.assertFalse(task.completed)
         self.assertEqual(task.project, self.project)
         
         # 2. READ - Verify task exists and can be accessed
-        self.assertTrue(Task.objects.filter(id=task.id).exists())
+        self.assertTrue(
+            Task.objects.using(self.shard).filter(id=task.id).exists()
+        )
         
         # 3. UPDATE - Update the task
-        update_data: dict = {
-            'text': 'Updated integration test task',
-            'priority': 10
-        }
         update_response = self.client.post(
-            reverse('task:update', kwargs={'task_id': task.id}),
-            data=update_data
+            reverse('tasks:update', kwargs={'pk': task.id}),
+            data={'text': 'Updated integration test task'}
         )
         
-        self.assertEqual(update_response.status_code, 302)  # Redirect after success
+        self.assertEqual(update_response.status_code, 200)
         
         # Verify task was updated
         task.refresh_from_db()
         self.assertEqual(task.text, 'Updated integration test task')
-        self.assertEqual(task.priority, 10)
         
         # 4. TOGGLE - Toggle task completion
-        toggle_response = self.client.post(
-            reverse('task:toggle', kwargs={'task_id': task.id}),
-            data={'completed': 'true'}
-        )
+        toggle_response = self._toggle(task.id, True)
         
         self.assertEqual(toggle_response.status_code, 200)
         task.refresh_from_db()
         self.assertTrue(task.completed)
         
         # Toggle back to not completed
-        toggle_response = self.client.post(
-            reverse('task:toggle', kwargs={'task_id': task.id}),
-            data={'completed': 'false'}
-        )
+        toggle_response = self._toggle(task.id, False)
         
         self.assertEqual(toggle_response.status_code, 200)
         task.refresh_from_db()
@@ -94,41 +98,39 @@ class TaskCRUDIntegrationTest(TestCase):
         
         # 5. DELETE - Delete the task
         delete_response = self.client.post(
-            reverse('task:delete', kwargs={'task_id': task.id})
+            reverse('tasks:delete', kwargs={'pk': task.id})
         )
         
-        self.assertEqual(delete_response.status_code, 302)  # Redirect after success
+        self.assertEqual(delete_response.status_code, 200)
         
         # Verify task was deleted
-        self.assertFalse(Task.objects.filter(id=task.id).exists())
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(id=task.id).exists()
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.task_count, 0)
+        self.assertEqual(self.project.completed_count, 0)
 
     def test_multiple_tasks_operations(self) -> None:
         """Test operations with multiple tasks."""
         self.client.force_login(self.user)
         
         # Create multiple tasks
-        tasks_data: list[dict] = [
-            {'text': 'Task 1', 'priority': 1},
-            {'text': 'Task 2', 'priority': 2},
-            {'text': 'Task 3', 'priority': 3}
-        ]
-        
         created_tasks: list[Task] = []
-        for data in tasks_data:
-            response = self.client.post(
-                reverse('task:create', kwargs={'project_id': self.project.id}),
-                data=data
-            )
-            self.assertEqual(response.status_code, 302)
-            task = Task.objects.get(text=data['text'])
+        for text in ['Task 1', 'Task 2', 'Task 3']:
+            response = self._create(self.project.id, text)
+            self.assertEqual(response.status_code, 200)
+            task = Task.objects.using(self.shard).get(text=text)
             created_tasks.append(task)
         
         # Verify all tasks were created
-        self.assertEqual(Task.objects.filter(project=self.project).count(), 3)
+        self.assertEqual(Task.objects.using(self.shard).filter(
+            project=self.project
+        ).count(), 3)
         
         # Test reordering tasks
         order_data: dict = {
-            'order_data': [
+            'order': [
                 {'id': created_tasks[0].id, 'position': 5},
                 {'id': created_tasks[1].id, 'position': 1},
                 {'id': created_tasks[2].id, 'position': 3}
@@ -136,7 +138,7 @@ class TaskCRUDIntegrationTest(TestCase):
         }
         
         reorder_response = self.client.post(
-            reverse('task:reorder'),
+            reverse('tasks:reorder'),
             data=order_data,
             content_type='application/json'
         )
@@ -147,23 +149,22 @@ class TaskCRUDIntegrationTest(TestCase):
         for task in created_tasks:
             task.refresh_from_db()
         
-        self.assertEqual(created_tasks[0].priority, 5)
-        self.assertEqual(created_tasks[1].priority, 1)
-        self.assertEqual(created_tasks[2].priority, 3)
+        self.assertEqual(created_tasks[0].priority, 5 * TASK_RANK_GAP)
+        self.assertEqual(created_tasks[1].priority, TASK_RANK_GAP)
+        self.assertEqual(created_tasks[2].priority, 3 * TASK_RANK_GAP)
         
         # Test bulk operations
         for task in created_tasks:
             # Toggle completion
-            self.client.post(
-                reverse('task:toggle', kwargs={'task_id': task.id}),
-                data={'completed': 'true'}
-            )
+            self._toggle(task.id, True)
             task.refresh_from_db()
             self.assertTrue(task.completed)
         
         # Verify all tasks are completed
         self.assertEqual(
-            Task.objects.filter(project=self.project, completed=True).count(), 3
+            Task.objects.using(self.shard).filter(
+                project=self.project, completed=True
+            ).count(), 3
         )
 
     def test_task_permissions_integration(self) -> None:
@@ -173,6 +174,7 @@ class TaskCRUDIntegrationTest(TestCase):
             email='other@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(other_user)
         other_project: Project = Project.objects.create(
             title='Other Project',
             owner=other_user
@@ -180,124 +182,118 @@ class TaskCRUDIntegrationTest(TestCase):
         
         # User creates task in their project
         self.client.force_login(self.user)
-        task_data: dict = {'text': 'User task', 'priority': 1}
-        response = self.client.post(
-            reverse('task:create', kwargs={'project_id': self.project.id}),
-            data=task_data
-        )
-        self.assertEqual(response.status_code, 302)
+        response = self._create(self.project.id, 'User task')
+        self.assertEqual(response.status_code, 200)
         
-        user_task: Task = Task.objects.get(text='User task')
+        user_task: Task = Task.objects.using(self.shard).get(text='User task')
         
         # Other user cannot access user's task
         self.client.force_login(other_user)
         
         # Cannot update
         response = self.client.get(
-            reverse('task:update', kwargs={'task_id': user_task.id})
+            reverse('tasks:update', kwargs={'pk': user_task.id})
         )
         self.assertEqual(response.status_code, 404)
         
         # Cannot delete
-        response = self.client.get(
-            reverse('task:delete', kwargs={'task_id': user_task.id})
+        response = self.client.post(
+            reverse('tasks:delete', kwargs={'pk': user_task.id})
         )
         self.assertEqual(response.status_code, 404)
         
         # Cannot toggle
-        response = self.client.post(
-            reverse('task:toggle', kwargs={'task_id': user_task.id}),
-            data={'completed': 'true'}
-        )
+        response = self._toggle(user_task.id, True)
         self.assertEqual(response.status_code, 404)
+
+        # Cannot add tasks to the user's project
+        response = self._create(self.project.id, 'Intruder task')
+        self.assertEqual(response.status_code, 400)
         
         # Other user can create task in their own project
-        other_task_data: dict = {'text': 'Other user task', 'priority': 1}
-        response = self.client.post(
-            reverse('task:create', kwargs={'project_id': other_project.id}),
-            data=other_task_data
-        )
-        self.assertEqual(response.status_code, 302)
+        response = self._create(other_project.id, 'Other user task')
+        self.assertEqual(response.status_code, 200)
         
-        other_task: Task = Task.objects.get(text='Other user task')
+        other_task: Task = Task.objects.using(self.shard).get(
+            text='Other user task'
+        )
         
         # Original user cannot access other user's task
         self.client.force_login(self.user)
         
         response = self.client.get(
-            reverse('task:update', kwargs={'task_id': other_task.id})
+            reverse('tasks:update', kwargs={'pk': other_task.id})
         )
         self.assertEqual(response.status_code, 404)
+        user_task.refresh_from_db()
+        self.assertFalse(user_task.completed)
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(
+                text='Intruder task'
+            ).exists()
+        )
 
     def test_task_validation_integration(self) -> None:
         """Test task validation across the entire stack."""
         self.client.force_login(self.user)
         
         # Test invalid text
-        invalid_data: list[dict] = [
-            {'text': '', 'priority': 1},  # Empty text
-            {'text': 'a' * 65, 'priority': 1},  # Too long
-            {'text': '<script>alert("xss")</script>', 'priority': 1},  # Invalid chars
+        invalid_texts: list[str] = [
+            '',  # Empty text
+            'a' * 65,  # Too long
+            '<script>alert("xss")</script>',  # Invalid chars
         ]
         
-        for data in invalid_data:
-            response = self.client.post(
-                reverse('task:create', kwargs={'project_id': self.project.id}),
-                data=data
-            )
-            self.assertEqual(response.status_code, 200)  # Form errors
-            self.assertFalse(Task.objects.filter(text=data['text']).exists())
-        
-        # Test invalid priority
-        invalid_priority_data: list[dict] = [
-            {'text': 'Valid task', 'priority': 0},  # Too low
-            {'text': 'Valid task', 'priority': 1001},  # Too high
-            {'text': 'Valid task', 'priority': -1},  # Negative
-        ]
-        
-        for data in invalid_priority_data:
-            response = self.client.post(
-                reverse('task:create', kwargs={'project_id': self.project.id}),
-                data=data
-            )
-            self.assertEqual(response.status_code, 200)  # Form errors
-            self.assertFalse(Task.objects.filter(text=data['text']).exists())
+        for text in invalid_texts:
+            response = self._create(self.project.id, text)
+            self.assertEqual(response.status_code, 400)
+            self.assertFalse(Task.objects.using(self.shard).filter(
+                text=text
+            ).exists())
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.task_count, 0)
 
     def test_task_statistics_integration(self) -> None:
         """Test task statistics functionality."""
         self.client.force_login(self.user)
         
         # Create tasks with different completion statuses
-        tasks_data: list[dict] = [
-            {'text': 'Active task 1', 'priority': 1},
-            {'text': 'Active task 2', 'priority': 2},
-            {'text': 'Completed task 1', 'priority': 3},
-            {'text': 'Completed task 2', 'priority': 4},
+        texts: list[str] = [
+            'Active task 1',
+            'Active task 2',
+            'Completed task 1',
+            'Completed task 2',
         ]
         
         created_tasks: list[Task] = []
-        for data in tasks_data:
-            response = self.client.post(
-                reverse('task:create', kwargs={'project_id': self.project.id}),
-                data=data
-            )
-            self.assertEqual(response.status_code, 302)
-            task = Task.objects.get(text=data['text'])
+        for text in texts:
+            response = self._create(self.project.id, text)
+            self.assertEqual(response.status_code, 200)
+            task = Task.objects.using(self.shard).get(text=text)
             created_tasks.append(task)
         
         # Complete some tasks
         for task in created_tasks[2:]:  # Last two tasks
-            self.client.post(
-                reverse('task:toggle', kwargs={'task_id': task.id}),
-                data={'completed': 'true'}
-            )
+            self._toggle(task.id, True)
         
         # Verify statistics
-        total_tasks = Task.objects.filter(project=self.project).count()
-        completed_tasks = Task.objects.filter(project=self.project, completed=True).count()
-        active_tasks = Task.objects.filter(project=self.project, completed=False).count()
+        total_tasks = Task.objects.using(self.shard).filter(
+            project=self.project
+        ).count()
+        completed_tasks = Task.objects.using(self.shard).filter(
+            project=self.project, completed=True
+        ).count()
+        active_tasks = Task.objects.using(self.shard).filter(
+            project=self.project, completed=False
+        ).count()
         
         self.assertEqual(total_tasks, 4)
         self.assertEqual(completed_tasks, 2)
         self.assertEqual(active_tasks, 2)
         self.assertEqual(completed_tasks / total_tasks * 100, 50.0)  # 50% completion rate
+
+        # The project's counters agree with the rows
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.task_count, 4)
+        self.assertEqual(self.project.completed_count, 2)
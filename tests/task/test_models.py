@@ -5,6 +5,7 @@ from django.contrib.auth import get_user_model
 
 from task.models import Task
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -13,7 +14,7 @@ else:
     User = get_user_model()
 
 
-class TaskModelTest(TestCase):
+class TaskModelTest(OwnerShardTestMixin, TestCase):
     """Test cases for Task model."""
 
     def setUp(self) -> None:
@@ -23,6 +24,7 @@ class TaskModelTest(TestCase):
             email='test@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(self.user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -61,25 +63,25 @@ class TaskModelTest(TestCase):
         self.assertFalse(task.completed)
 
     def test_task_ordering(self) -> None:
-        """Test task ordering by priority."""
+        """Test task ordering by rank, lowest first."""
         task1: Task = Task.objects.create(
-            text='Low priority task',
+            text='Last task',
             project=self.project,
-            priority=1
+            priority=3
         )
         task2: Task = Task.objects.create(
-            text='High priority task',
+            text='First task',
             project=self.project,
-            priority=3
+            priority=1
         )
         task3: Task = Task.objects.create(
-            text='Medium priority task',
+            text='Second task',
             project=self.project,
             priority=2
         )
         
-        tasks: list[Task] = list(Task.objects.all())
-        self.assertEqual(tasks[0], task2)  # Highest priority first
+        tasks: list[Task] = list(Task.objects.using(self.shard).all())
+        self.assertEqual(tasks[0], task2)  # Lowest rank first
         self.assertEqual(tasks[1], task3)
         self.assertEqual(tasks[2], task1)
 
@@ -101,7 +103,7 @@ class TaskModelTest(TestCase):
         )
         
         self.project.delete()
-        self.assertFalse(Task.objects.filter(id=task.id).exists())
+        self.assertFalse(Task.objects.using(self.shard).filter(id=task.id).exists())
 
     def test_task_priority_validation(self) -> None:
         """Test task priority validation."""
@@ -127,4 +129,4 @@ class TaskModelTest(TestCase):
         self.assertEqual(Task._meta.db_table, 'tasks')
         self.assertEqual(Task._meta.verbose_name, 'Task')
         self.assertEqual(Task._meta.verbose_name_plural, 'Tasks')
-        self.assertEqual(Task._meta.ordering, ['-priority'])
+        self.assertEqual(Task._meta.ordering, ['priority', 'id'])
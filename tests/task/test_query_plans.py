@@ -0,0 +1,153 @@
+from typing import TYPE_CHECKING
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test import TestCase
+
+from project.models import Project
+from task.models import Task
+from task.repositories import TaskRepository
+from tests.query_plans import QueryPlanTestMixin
+from tests.sharding import OwnerShardTestMixin
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+    User = AbstractUser
+else:
+    User = get_user_model()
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plans are checked on SQLite')
+class TaskRepositoryQueryPlanTest(
+    OwnerShardTestMixin,
+    QueryPlanTestMixin,
+    TestCase
+):
+    """Test that every TaskRepository query is served by an index."""
+
+    # Plans are captured on the default database, see QueryPlanTestMixin
+    shard = DEFAULT_DB_ALIAS
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user)
+        self.project: Project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.other_project: Project = Project.objects.create(
+            title='Other Project',
+            owner=self.user
+        )
+        self.repository: TaskRepository = TaskRepository()
+        self.tasks: list[Task] = self.repository.create_tasks(
+            [f'Task {i}' for i in range(30)], self.project.id, self.user
+        )
+        self.task: Task = self.tasks[10]
+
+    def test_get_project_tasks(self) -> None:
+        """Test listing a project's tasks."""
+        self.assertIndexedQueries(
+            self.repository.get_project_tasks, self.project.id, self.user
+        )
+
+    def test_get_project_tasks_page(self) -> None:
+        """Test the first and a following keyset page."""
+        page = self.assertIndexedQueries(
+            self.repository.get_project_tasks_page,
+            self.project.id, self.user, per_page=10
+        )
+        self.assertIndexedQueries(
+            self.repository.get_project_tasks_page,
+            self.project.id, self.user, cursor=page.next_cursor, per_page=10
+        )
+
+    def test_lookups(self) -> None:
+        """Test single-task lookups and the priority maximum."""
+        self.assertIndexedQueries(
+            self.repository.get_task_by_id, self.task.id, self.user
+        )
+        self.assertIndexedQueries(
+            self.repository.task_exists, self.task.id, self.user
+        )
+        self.assertIndexedQueries(
+            self.repository.get_project_max_priority,
+            self.project.id, self.user
+        )
+
+    def test_create_tasks(self) -> None:
+        """Test single and batch creation."""
+        self.assertIndexedQueries(
+            self.repository.create_task, 'New', self.project.id, self.user
+        )
+        self.assertIndexedQueries(
+            self.repository.create_tasks,
+            ['One', 'Two'], self.project.id, self.user
+        )
+
+    def test_ordering_writes(self) -> None:
+        """Test moves, full reorders and rebalancing."""
+        self.assertIndexedQueries(
+            self.repository.move_task,
+            self.task.id, self.user, after_id=self.tasks[2].id
+        )
+        self.assertIndexedQueries(
+            self.repository.move_task,
+            self.task.id, self.user, before_id=self.tasks[20].id
+        )
+        self.assertIndexedQueries(
+            self.repository.reorder_tasks,
+            [{'id': self.task.id, 'position': 5}], self.user
+        )
+        self.assertIndexedQueries(
+            self.repository.rebalance_project_tasks, self.project.id
+        )
+
+    def test_completion_writes(self) -> None:
+        """Test toggling, updating and bulk completion."""
+        self.assertIndexedQueries(
+            self.repository.toggle_task_completion,
+            self.task.id, self.user, True
+        )
+        self.assertIndexedQueries(
+            self.repository.update_task,
+            self.task.id, self.user, text='Updated'
+        )
+        self.assertIndexedQueries(
+            self.repository.set_tasks_completed,
+            self.project.id, self.user, True
+        )
+
+    def test_deletes_and_moves(self) -> None:
+        """Test single and bulk deletes and moving between projects."""
+        self.assertIndexedQueries(
+            self.repository.delete_task, self.task.id, self.user
+        )
+        self.assertIndexedQueries(
+            self.repository.delete_tasks,
+            self.project.id, self.user, task_ids=[self.tasks[0].id]
+        )
+        self.assertIndexedQueries(
+            self.repository.delete_completed_tasks, self.project.id, self.user
+        )
+        self.assertIndexedQueries(
+            self.repository.move_tasks,
+            self.project.id, self.user, [self.tasks[1].id],
+            self.other_project.id
+        )
+
+    def test_task_stats(self) -> None:
+        """Test statistics read from the project counters."""
+        self.assertIndexedQueries(
+            self.repository.get_task_stats_for_projects,
+            [self.project.id, self.other_project.id], self.user
+        )
+        self.assertIndexedQueries(
+            self.repository.refresh_task_counters, [self.project.id]
+        )
@@ -1,11 +1,19 @@
+from io import StringIO
 from typing import TYPE_CHECKING
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.auth import get_user_model
 
+from core.sharding import use_shard
+from core.unit_of_work import unit_of_work
+from task.constants import TASK_RANK_GAP
 from task.repositories import TaskRepository
 from task.models import Task
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -14,7 +22,7 @@ else:
     User = get_user_model()
 
 
-class TaskRepositoryTest(TestCase):
+class TaskRepositoryTest(OwnerShardTestMixin, TestCase):
     """Test cases for TaskRepository."""
 
     def setUp(self) -> None:
@@ -29,6 +37,7 @@ class TaskRepositoryTest(TestCase):
             email='other@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(self.user, self.other_user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -65,8 +74,52 @@ class TaskRepositoryTest(TestCase):
             user=self.user
         )
         
-        self.assertEqual(task1.priority, 1)
-        self.assertEqual(task2.priority, 2)
+        self.assertEqual(task1.priority, TASK_RANK_GAP)
+        self.assertEqual(task2.priority, 2 * TASK_RANK_GAP)
+
+    def test_create_task_does_not_scan_project(self) -> None:
+        """Test that appending costs the same queries in any project size."""
+        self.repository.create_task('First', self.project.id, self.user)
+        with CaptureQueriesContext(self.shard_connection) as small:
+            self.repository.create_task('Second', self.project.id, self.user)
+
+        for index in range(50):
+            self.repository.create_task(
+                f'Task {index}', self.project.id, self.user
+            )
+        with CaptureQueriesContext(self.shard_connection) as large:
+            task = self.repository.create_task(
+                'Last', self.project.id, self.user
+            )
+
+        self.assertEqual(len(small), len(large))
+        self.assertFalse(
+            any('MAX(' in q['sql'] for q in large.captured_queries)
+        )
+        self.assertEqual(task.priority, 53 * TASK_RANK_GAP)
+
+    def test_create_task_appends_after_explicit_priority_and_moves(
+            self
+    ) -> None:
+        """Test that appended tasks land after explicit and moved ranks."""
+        first = self.repository.create_task(
+            'First', self.project.id, self.user, priority=5000
+        )
+        second = self.repository.create_task(
+            'Second', self.project.id, self.user
+        )
+        self.repository.move_task(first.id, self.user, after_id=second.id)
+
+        third = self.repository.create_task(
+            'Third', self.project.id, self.user
+        )
+
+        self.assertEqual(
+            list(self.repository.get_project_tasks(
+                self.project.id, self.user
+            ).values_list('id', flat=True)),
+            [second.id, first.id, third.id]
+        )
 
     def test_create_task_project_not_found(self) -> None:
         """Test creating task with non-existent project."""
@@ -150,6 +203,46 @@ class TaskRepositoryTest(TestCase):
         
         self.assertEqual(len(tasks), 2)
 
+    def test_get_project_tasks_page(self) -> None:
+        """Test paging through tasks with a (priority, id) cursor."""
+        tasks: list[Task] = [
+            Task.objects.create(
+                text=f'Task {i}', project=self.project, priority=i % 3 + 1
+            )
+            for i in range(7)
+        ]
+        expected = sorted(tasks, key=lambda task: (task.priority, task.id))
+
+        first_page = self.repository.get_project_tasks_page(
+            self.project.id, self.user, per_page=3
+        )
+        second_page = self.repository.get_project_tasks_page(
+            self.project.id, self.user,
+            cursor=first_page.next_cursor, per_page=3
+        )
+        last_page = self.repository.get_project_tasks_page(
+            self.project.id, self.user,
+            cursor=second_page.next_cursor, per_page=3
+        )
+
+        self.assertEqual(
+            list(first_page) + list(second_page) + list(last_page),
+            expected
+        )
+        self.assertEqual(len(last_page), 1)
+        self.assertIsNone(last_page.next_cursor)
+
+    def test_get_project_tasks_page_wrong_user(self) -> None:
+        """Test that pages never include tasks of another user."""
+        Task.objects.create(text='Task', project=self.project)
+
+        page = self.repository.get_project_tasks_page(
+            self.project.id, self.other_user
+        )
+
+        self.assertEqual(len(page), 0)
+        self.assertFalse(page.has_next)
+
     def test_get_project_tasks_empty(self) -> None:
         """Test getting tasks for empty project."""
         tasks = self.repository.get_project_tasks(
@@ -175,6 +268,30 @@ class TaskRepositoryTest(TestCase):
         self.assertEqual(updated_task.text, 'Updated text')
         self.assertEqual(updated_task.priority, 5)
 
+    def test_update_task_completion_ignores_a_stale_instance(self) -> None:
+        """Test that a toggle after the task was loaded is not counted twice."""
+        task = self.repository.create_task(
+            'Task', self.project.id, self.user
+        )
+
+        with unit_of_work():
+            self.repository.get_task_by_id(task.id, self.user)
+            # Another request completes the task in the meantime
+            Task.objects.using(self.shard).filter(pk=task.id).update(
+                completed=True
+            )
+            Project.objects.using(self.shard).filter(
+                pk=self.project.id
+            ).update(completed_count=1)
+
+            updated = self.repository.update_task(
+                task.id, self.user, completed=True
+            )
+
+        self.project.refresh_from_db()
+        self.assertTrue(updated.completed)
+        self.assertEqual(self.project.completed_count, 1)
+
     def test_delete_task(self) -> None:
         """Test deleting task."""
         task: Task = Task.objects.create(
@@ -185,7 +302,9 @@ class TaskRepositoryTest(TestCase):
         result: bool = self.repository.delete_task(task.id, self.user)
         
         self.assertTrue(result)
-        self.assertFalse(Task.objects.filter(id=task.id).exists())
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(id=task.id).exists()
+        )
 
     def test_task_exists(self) -> None:
         """Test checking if task exists."""
@@ -226,16 +345,60 @@ class TaskRepositoryTest(TestCase):
         )
         
         # Toggle to completed
-        updated_task: Task = self.repository.toggle_task_completion(
-            task.id, self.user, True
+        self.assertTrue(
+            self.repository.toggle_task_completion(task.id, self.user, True)
         )
-        self.assertTrue(updated_task.completed)
+        task.refresh_from_db()
+        self.assertTrue(task.completed)
         
         # Toggle back to not completed
-        updated_task = self.repository.toggle_task_completion(
-            task.id, self.user, False
+        self.assertFalse(
+            self.repository.toggle_task_completion(task.id, self.user, False)
+        )
+        task.refresh_from_db()
+        self.assertFalse(task.completed)
+
+    def test_toggle_task_completion_single_update(self) -> None:
+        """Test that a toggle loads nothing and writes task and counters."""
+        task: Task = self.repository.create_task(
+            'Test task', self.project.id, self.user
+        )
+
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            self.repository.toggle_task_completion(task.id, self.user, True)
+
+        statements = [
+            q['sql'] for q in ctx.captured_queries
+            if not q['sql'].startswith(('SAVEPOINT', 'RELEASE'))
+        ]
+        # PostgreSQL writes task and counters in one UPDATE ... RETURNING
+        expected = 1 if connection.vendor == 'postgresql' else 2
+        self.assertEqual(len(statements), expected)
+        self.assertTrue(all(
+            sql.startswith(('UPDATE', 'WITH')) for sql in statements
+        ))
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.completed_count, 1)
+
+    def test_toggle_task_completion_foreign_task(self) -> None:
+        """Test that another user's task is neither changed nor counted."""
+        task: Task = self.repository.create_task(
+            'Test task', self.other_project.id, self.other_user
+        )
+
+        with self.assertRaises(ObjectDoesNotExist):
+            self.repository.toggle_task_completion(task.id, self.user, True)
+
+        task.refresh_from_db()
+        self.other_project.refresh_from_db()
+        self.assertFalse(task.completed)
+        self.assertEqual(self.other_project.completed_count, 0)
+        # Setting the current state again is not an error
+        self.assertFalse(
+            self.repository.toggle_task_completion(
+                task.id, self.other_user, False
+            )
         )
-        self.assertFalse(updated_task.completed)
 
     def test_reorder_tasks(self) -> None:
         """Test reordering tasks."""
@@ -263,14 +426,89 @@ class TaskRepositoryTest(TestCase):
         task1.refresh_from_db()
         task2.refresh_from_db()
         
-        self.assertEqual(task1.priority, 5)
-        self.assertEqual(task2.priority, 1)
+        self.assertEqual(task1.priority, 5 * TASK_RANK_GAP)
+        self.assertEqual(task2.priority, TASK_RANK_GAP)
+
+    def test_reorder_tasks_skips_foreign_and_invalid_items(self) -> None:
+        """Test that reorder ignores other users' tasks and bad items."""
+        task: Task = Task.objects.create(
+            text='Mine', project=self.project, priority=1
+        )
+        foreign: Task = Task.objects.create(
+            text='Foreign', project=self.other_project, priority=1
+        )
+
+        result: bool = self.repository.reorder_tasks([
+            {'id': str(task.id), 'position': '3'},
+            {'id': foreign.id, 'position': 9},
+            {'id': task.id, 'position': 'not a number'},
+            {'position': 4},
+        ], self.user)
+
+        task.refresh_from_db()
+        foreign.refresh_from_db()
+        self.assertTrue(result)
+        self.assertEqual(task.priority, 3 * TASK_RANK_GAP)
+        self.assertEqual(foreign.priority, 1)
+
+    def test_partial_reorder_keeps_the_rank_gaps(self) -> None:
+        """Test that positions sort among tasks left where they were."""
+        first, second, third = self.repository.create_tasks(
+            ['A', 'B', 'C'], self.project.id, self.user
+        )
+
+        self.repository.reorder_tasks([
+            {'id': third.id, 'position': 1},
+            {'id': first.id, 'position': 3},
+        ], self.user)
+        appended = self.repository.create_task(
+            'D', self.project.id, self.user
+        )
+
+        self.assertEqual(
+            list(self.repository.get_project_tasks(
+                self.project.id, self.user
+            ).values_list('text', 'priority')),
+            [
+                ('C', TASK_RANK_GAP),
+                ('B', 2 * TASK_RANK_GAP),
+                ('A', 3 * TASK_RANK_GAP),
+                ('D', 4 * TASK_RANK_GAP),
+            ]
+        )
+        self.assertEqual(appended.priority, 4 * TASK_RANK_GAP)
+
+    def test_reorder_tasks_query_count_is_constant(self) -> None:
+        """Test that reorder costs the same queries for any list size."""
+        def reorder_queries(size: int) -> int:
+            Task.objects.using(self.shard).filter(
+                project=self.project
+            ).delete()
+            tasks = Task.objects.using(self.shard).bulk_create(
+                Task(
+                    text=f'Task {i}', project=self.project, owner=self.user,
+                    priority=i + 1
+                )
+                for i in range(size)
+            )
+            order_data = [
+                {'id': task.id, 'position': size - index}
+                for index, task in enumerate(tasks)
+            ]
+            with CaptureQueriesContext(self.shard_connection) as queries:
+                self.repository.reorder_tasks(order_data, self.user)
+            return len(queries)
+
+        self.assertEqual(reorder_queries(5), reorder_queries(200))
 
     def test_get_task_stats(self) -> None:
         """Test getting task statistics."""
-        Task.objects.create(text='Task 1', project=self.project, completed=False)
-        Task.objects.create(text='Task 2', project=self.project, completed=True)
-        Task.objects.create(text='Task 3', project=self.project, completed=True)
+        for text, completed in [
+            ('Task 1', False), ('Task 2', True), ('Task 3', True)
+        ]:
+            task = self.repository.create_task(text, self.project.id, self.user)
+            if completed:
+                self.repository.toggle_task_completion(task.id, self.user, True)
         
         stats: dict = self.repository.get_task_stats(self.project.id, self.user)
         
@@ -287,3 +525,351 @@ class TaskRepositoryTest(TestCase):
         self.assertEqual(stats['completed_tasks'], 0)
         self.assertEqual(stats['active_tasks'], 0)
         self.assertEqual(stats['completion_rate'], 0)
+
+    def test_task_counters_follow_writes(self) -> None:
+        """Test that create, toggle, update and delete keep counters in sync."""
+        task1: Task = self.repository.create_task(
+            'Task 1', self.project.id, self.user
+        )
+        task2: Task = self.repository.create_task(
+            'Task 2', self.project.id, self.user
+        )
+        self.repository.toggle_task_completion(task1.id, self.user, True)
+        # Toggling to the current state must not count twice
+        self.repository.toggle_task_completion(task1.id, self.user, True)
+        self.repository.update_task(task2.id, self.user, completed=True)
+        self.repository.delete_task(task1.id, self.user)
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.task_count, 1)
+        self.assertEqual(self.project.completed_count, 1)
+
+    def test_get_task_stats_single_query(self) -> None:
+        """Test that statistics are read from counters in one query."""
+        self.repository.create_task('Task 1', self.project.id, self.user)
+
+        with self.assertNumQueries(1, using=self.shard):
+            stats: dict = self.repository.get_task_stats(
+                self.project.id, self.user
+            )
+
+        self.assertEqual(stats['total_tasks'], 1)
+
+    def test_refresh_task_counters(self) -> None:
+        """Test repairing counters that drifted from the tasks table."""
+        Task.objects.create(text='Task 1', project=self.project)
+        Task.objects.create(text='Task 2', project=self.project, completed=True)
+
+        with use_shard(self.shard):
+            updated: int = self.repository.refresh_task_counters(
+                [self.project.id]
+            )
+
+        self.project.refresh_from_db()
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.project.task_count, 2)
+        self.assertEqual(self.project.completed_count, 1)
+
+    def test_recount_task_counters_command(self) -> None:
+        """Test the management command that repairs all counters."""
+        Task.objects.create(text='Task 1', project=self.project, completed=True)
+        Task.objects.create(text='Task 2', project=self.other_project)
+        out = StringIO()
+
+        call_command('recount_task_counters', stdout=out)
+
+        self.project.refresh_from_db()
+        self.other_project.refresh_from_db()
+        self.assertEqual(self.project.completed_count, 1)
+        self.assertEqual(self.other_project.task_count, 1)
+        self.assertIn('2 project(s)', out.getvalue())
+
+    def test_benchmark_task_reorder_command(self) -> None:
+        """Test that the reorder benchmark reports a constant query count."""
+        out = StringIO()
+
+        call_command(
+            'benchmark_task_reorder', '--sizes', '3', '40', '--rounds', '1',
+            stdout=out
+        )
+
+        rows = [line.split() for line in out.getvalue().splitlines()[1:]]
+        self.assertEqual([row[0] for row in rows], ['3', '40'])
+        self.assertEqual(rows[0][3], rows[1][3])
+        self.assertFalse(
+            User.objects.filter(username='task-reorder-benchmark').exists()
+        )
+
+
+    def _create_ranked_tasks(self, *priorities: int) -> list[Task]:
+        """Create tasks in the test project with the given priorities."""
+        return [
+            Task.objects.create(
+                text=f'Task {index}', project=self.project, priority=priority
+            )
+            for index, priority in enumerate(priorities)
+        ]
+
+    def _ordered_ids(self) -> list[int]:
+        """Get the test project's task IDs in display order."""
+        return list(
+            self.repository.get_project_tasks(
+                self.project.id, self.user
+            ).values_list('id', flat=True)
+        )
+
+    def test_move_task_writes_only_the_moved_row(self) -> None:
+        """Test that a move between spread ranks updates a single row."""
+        first, second, third = self._create_ranked_tasks(1024, 2048, 3072)
+
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            task, _ = self.repository.move_task(
+                third.id, self.user, after_id=first.id
+            )
+
+        updates = [q for q in ctx.captured_queries
+                   if q['sql'].startswith('UPDATE "tasks"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(task.priority, 1536)
+        self.assertEqual(self._ordered_ids(), [first.id, third.id, second.id])
+
+    def test_move_task_before_first_and_after_last(self) -> None:
+        """Test moving a task to either end of the list."""
+        first, second, third = self._create_ranked_tasks(1024, 2048, 3072)
+
+        self.repository.move_task(third.id, self.user, before_id=first.id)
+        self.assertEqual(self._ordered_ids(), [third.id, first.id, second.id])
+
+        self.repository.move_task(third.id, self.user, after_id=second.id)
+        self.assertEqual(self._ordered_ids(), [first.id, second.id, third.id])
+
+    def test_move_task_rebalances_dense_ranks(self) -> None:
+        """Test that a move without room left spreads the ranks first."""
+        first, second, third = self._create_ranked_tasks(1, 2, 3)
+
+        self.repository.move_task(third.id, self.user, after_id=first.id)
+
+        self.assertEqual(self._ordered_ids(), [first.id, third.id, second.id])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.priority, second.priority), (1024, 2048))
+
+    def test_move_task_rejects_foreign_anchor(self) -> None:
+        """Test that tasks cannot be moved next to another project's task."""
+        task, = self._create_ranked_tasks(1024)
+        foreign = Task.objects.create(text='Foreign', project=self.other_project)
+
+        with self.assertRaises(ObjectDoesNotExist):
+            self.repository.move_task(task.id, self.user, after_id=foreign.id)
+        with self.assertRaises(ObjectDoesNotExist):
+            self.repository.move_task(foreign.id, self.user, after_id=task.id)
+
+    def test_get_dense_project_ids(self) -> None:
+        """Test finding projects with neighbours too close to move between."""
+        self._create_ranked_tasks(1, 2, 1024)
+        Task.objects.create(text='A', project=self.other_project, priority=1024)
+        Task.objects.create(text='B', project=self.other_project, priority=2048)
+
+        with use_shard(self.shard):
+            self.assertEqual(
+                self.repository.get_dense_project_ids(), [self.project.id]
+            )
+            self.assertEqual(
+                self.repository.get_dense_project_ids(min_gap=2048),
+                [self.project.id, self.other_project.id]
+            )
+
+    def test_rebalance_task_ranks_command(self) -> None:
+        """Test the command that spreads out dense projects only."""
+        first, second = self._create_ranked_tasks(5, 5)
+        untouched = Task.objects.create(
+            text='Spread', project=self.other_project, priority=7
+        )
+        out = StringIO()
+
+        call_command('rebalance_task_ranks', stdout=out)
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        untouched.refresh_from_db()
+        self.assertEqual((first.priority, second.priority), (1024, 2048))
+        self.assertEqual(untouched.priority, 7)
+        self.assertIn('1 project(s)', out.getvalue())
+
+    def test_set_tasks_completed(self) -> None:
+        """Test completing all tasks counts only the changed ones."""
+        first = self.repository.create_task('First', self.project.id, self.user)
+        second = self.repository.create_task(
+            'Second', self.project.id, self.user
+        )
+        self.repository.toggle_task_completion(first.id, self.user, True)
+
+        changed = self.repository.set_tasks_completed(
+            self.project.id, self.user, True
+        )
+
+        self.assertEqual(changed, 1)
+        second.refresh_from_db()
+        self.assertTrue(second.completed)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.completed_count, 2)
+
+        self.repository.set_tasks_completed(self.project.id, self.user, False)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.completed_count, 0)
+
+    def test_delete_tasks_completed_and_selected(self) -> None:
+        """Test deleting completed tasks and a selection of tasks."""
+        done = self.repository.create_task('Done', self.project.id, self.user)
+        keep = self.repository.create_task('Keep', self.project.id, self.user)
+        drop = self.repository.create_task('Drop', self.project.id, self.user)
+        foreign = self.repository.create_task(
+            'Foreign', self.other_project.id, self.other_user
+        )
+        self.repository.toggle_task_completion(done.id, self.user, True)
+
+        self.assertEqual(
+            self.repository.delete_completed_tasks(self.project.id, self.user),
+            1
+        )
+        self.assertEqual(
+            self.repository.delete_tasks(
+                self.project.id, self.user, task_ids=[drop.id, foreign.id]
+            ),
+            [drop.id]
+        )
+
+        self.assertEqual(
+            list(Task.objects.using(self.shard).values_list(
+                'id', flat=True
+            ).order_by('id')),
+            [keep.id, foreign.id]
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(
+            (self.project.task_count, self.project.completed_count), (1, 0)
+        )
+
+    def test_bulk_operations_require_owned_project(self) -> None:
+        """Test that bulk operations on a foreign project fail."""
+        with self.assertRaises(ObjectDoesNotExist):
+            self.repository.set_tasks_completed(
+                self.other_project.id, self.user, True
+            )
+        with self.assertRaises(ObjectDoesNotExist):
+            self.repository.delete_completed_tasks(
+                self.other_project.id, self.user
+            )
+
+    def test_project_wide_bulk_operations_do_not_list_task_ids(self) -> None:
+        """Test that large projects are changed by filtered statements."""
+        Task.objects.using(self.shard).bulk_create(
+            Task(
+                text=f'Task {i}', project=self.project, owner=self.user,
+                priority=i + 1
+            )
+            for i in range(1500)
+        )
+        with use_shard(self.shard):
+            self.repository.refresh_task_counters([self.project.id])
+
+        with CaptureQueriesContext(self.shard_connection) as queries:
+            changed = self.repository.set_tasks_completed(
+                self.project.id, self.user, True
+            )
+            deleted = self.repository.delete_completed_tasks(
+                self.project.id, self.user
+            )
+
+        self.assertEqual((changed, deleted), (1500, 1500))
+        self.assertLess(len(queries), 12)
+        self.assertTrue(all(len(query['sql']) < 1000 for query in queries))
+        self.project.refresh_from_db()
+        self.assertEqual(
+            (self.project.task_count, self.project.completed_count), (0, 0)
+        )
+
+    def test_move_tasks_to_another_project(self) -> None:
+        """Test moving tasks keeps their order and both projects' counters."""
+        target = Project.objects.create(title='Target', owner=self.user)
+        existing = self.repository.create_task('Existing', target.id, self.user)
+        first = self.repository.create_task('First', self.project.id, self.user)
+        second = self.repository.create_task(
+            'Second', self.project.id, self.user
+        )
+        stays = self.repository.create_task('Stays', self.project.id, self.user)
+        self.repository.toggle_task_completion(second.id, self.user, True)
+
+        moved = self.repository.move_tasks(
+            self.project.id, self.user, [second.id, first.id], target.id
+        )
+
+        self.assertEqual([task.id for task in moved], [first.id, second.id])
+        self.assertEqual(
+            list(self.repository.get_project_tasks(
+                target.id, self.user
+            ).values_list('id', flat=True)),
+            [existing.id, first.id, second.id]
+        )
+        self.project.refresh_from_db()
+        target.refresh_from_db()
+        self.assertEqual(
+            (self.project.task_count, self.project.completed_count), (1, 0)
+        )
+        self.assertEqual((target.task_count, target.completed_count), (3, 1))
+        self.assertTrue(Task.objects.using(self.shard).filter(
+            pk=stays.pk, project=self.project
+        ).exists())
+
+    def test_move_tasks_to_foreign_project(self) -> None:
+        """Test that tasks cannot be moved into another user's project."""
+        task = self.repository.create_task('Task', self.project.id, self.user)
+
+        with self.assertRaises(ObjectDoesNotExist):
+            self.repository.move_tasks(
+                self.project.id, self.user, [task.id], self.other_project.id
+            )
+
+        task.refresh_from_db()
+        self.assertEqual(task.project_id, self.project.id)
+
+    def test_tasks_carry_project_owner(self) -> None:
+        """Test that every creation path stores the project's owner."""
+        single = self.repository.create_task('Single', self.project.id, self.user)
+        batch = self.repository.create_tasks(
+            ['One', 'Two'], self.project.id, self.user
+        )
+        direct = Task.objects.create(text='Direct', project=self.project)
+
+        for task in [single, *batch, direct]:
+            self.assertEqual(
+                Task.objects.using(self.shard).get(
+                    pk=task.pk
+                ).owner_id, self.user.pk
+            )
+
+    def test_project_owner_change_updates_tasks(self) -> None:
+        """Test that reassigning a project reassigns its tasks."""
+        task = self.repository.create_task('Task', self.project.id, self.user)
+
+        self.project.owner = self.other_user
+        self.project.save()
+
+        task.refresh_from_db()
+        self.assertEqual(task.owner_id, self.other_user.pk)
+
+    def test_task_queries_do_not_join_projects(self) -> None:
+        """Test that owner-scoped task queries read a single table."""
+        task = self.repository.create_task('Task', self.project.id, self.user)
+
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            list(self.repository.get_project_tasks(self.project.id, self.user))
+            self.repository.get_task_by_id(task.id, self.user)
+            self.repository.task_exists(task.id, self.user)
+            self.repository.get_project_max_priority(
+                self.project.id, self.user
+            )
+
+        self.assertEqual(len(ctx), 4)
+        for query in ctx.captured_queries:
+            self.assertNotIn('JOIN', query['sql'])
@@ -1,8 +1,10 @@
 from typing import TYPE_CHECKING
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 
+from core.unit_of_work import unit_of_work
 from task.services import TaskService
 from task.models import Task
 from project.models import Project
@@ -12,12 +14,13 @@ from task.constants import (
     ERROR_TASK_TEXT_TOO_LONG,
     ERROR_TASK_TEXT_INVALID_CHARS,
     ERROR_TASK_NOT_FOUND,
-    ERROR_TASK_NO_PERMISSION,
     ERROR_PROJECT_NOT_FOUND,
     ERROR_TASK_PRIORITY_INVALID,
     ERROR_TASK_REORDER_FAILED,
     ERROR_TASK_TOGGLE_FAILED,
+    TASK_RANK_GAP,
 )
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -26,7 +29,7 @@ else:
     User = get_user_model()
 
 
-class TaskServiceTest(TestCase):
+class TaskServiceTest(OwnerShardTestMixin, TestCase):
     """Test cases for TaskService."""
 
     def setUp(self) -> None:
@@ -41,6 +44,7 @@ class TaskServiceTest(TestCase):
             email='other@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(self.user, self.other_user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -61,7 +65,7 @@ class TaskServiceTest(TestCase):
         )
         
         self.assertEqual(task.text, 'Test task')
-        self.assertEqual(task.priority, 5)
+        self.assertEqual(task.priority, 5 * TASK_RANK_GAP - TASK_RANK_GAP // 2)
         self.assertEqual(task.project, self.project)
         self.assertFalse(task.completed)
 
@@ -74,7 +78,7 @@ class TaskServiceTest(TestCase):
         )
         
         self.assertEqual(task.text, 'Test task')
-        self.assertEqual(task.priority, 1)  # Default priority
+        self.assertEqual(task.priority, TASK_RANK_GAP)  # Default priority
 
     def test_create_task_project_not_found(self) -> None:
         """Test creating task with non-existent project."""
@@ -85,7 +89,7 @@ class TaskServiceTest(TestCase):
                 user=self.user
             )
         
-        self.assertEqual(str(context.exception), ERROR_PROJECT_NOT_FOUND)
+        self.assertEqual(context.exception.messages, [ERROR_PROJECT_NOT_FOUND])
 
     def test_create_task_wrong_user(self) -> None:
         """Test creating task for project owned by different user."""
@@ -96,7 +100,7 @@ class TaskServiceTest(TestCase):
                 user=self.other_user
             )
         
-        self.assertEqual(str(context.exception), ERROR_PROJECT_NOT_FOUND)
+        self.assertEqual(context.exception.messages, [ERROR_PROJECT_NOT_FOUND])
 
     def test_create_task_empty_text(self) -> None:
         """Test creating task with empty text."""
@@ -107,7 +111,7 @@ class TaskServiceTest(TestCase):
                 user=self.user
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_TEXT_EMPTY)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_TEXT_EMPTY])
 
     def test_create_task_whitespace_text(self) -> None:
         """Test creating task with whitespace-only text."""
@@ -118,7 +122,7 @@ class TaskServiceTest(TestCase):
                 user=self.user
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_TEXT_EMPTY)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_TEXT_EMPTY])
 
     def test_create_task_text_too_short(self) -> None:
         """Test creating task with text that's too short."""
@@ -129,7 +133,7 @@ class TaskServiceTest(TestCase):
                 user=self.user
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_TEXT_EMPTY)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_TEXT_EMPTY])
 
     def test_create_task_text_too_long(self) -> None:
         """Test creating task with text that's too long."""
@@ -141,7 +145,7 @@ class TaskServiceTest(TestCase):
                 user=self.user
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_TEXT_TOO_LONG)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_TEXT_TOO_LONG])
 
     def test_create_task_invalid_chars(self) -> None:
         """Test creating task with invalid characters."""
@@ -160,7 +164,21 @@ class TaskServiceTest(TestCase):
                     project_id=self.project.id,
                     user=self.user
                 )
-            self.assertEqual(str(context.exception), ERROR_TASK_TEXT_INVALID_CHARS)
+            self.assertEqual(context.exception.messages, [ERROR_TASK_TEXT_INVALID_CHARS])
+
+    def test_explicit_priority_sorts_among_appended_tasks(self) -> None:
+        """Test that priority N places a task before the Nth task."""
+        for text in ('First', 'Second', 'Third'):
+            self.service.create_task(text, self.project.id, self.user)
+
+        self.service.create_task(
+            'Inserted', self.project.id, self.user, priority=2
+        )
+
+        self.assertEqual(
+            list(self.project.tasks.values_list('text', flat=True)),
+            ['First', 'Inserted', 'Second', 'Third']
+        )
 
     def test_create_task_invalid_priority(self) -> None:
         """Test creating task with invalid priority."""
@@ -172,7 +190,7 @@ class TaskServiceTest(TestCase):
                 user=self.user,
                 priority=0
             )
-        self.assertEqual(str(context.exception), ERROR_TASK_PRIORITY_INVALID)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_PRIORITY_INVALID])
         
         # Test priority too high
         with self.assertRaises(ValidationError) as context:
@@ -182,7 +200,7 @@ class TaskServiceTest(TestCase):
                 user=self.user,
                 priority=1001
             )
-        self.assertEqual(str(context.exception), ERROR_TASK_PRIORITY_INVALID)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_PRIORITY_INVALID])
 
     def test_update_task_success(self) -> None:
         """Test successful task update."""
@@ -199,7 +217,9 @@ class TaskServiceTest(TestCase):
         )
         
         self.assertEqual(updated_task.text, 'Updated text')
-        self.assertEqual(updated_task.priority, 5)
+        self.assertEqual(
+            updated_task.priority, 5 * TASK_RANK_GAP - TASK_RANK_GAP // 2
+        )
 
     def test_update_task_not_found(self) -> None:
         """Test updating non-existent task."""
@@ -209,10 +229,13 @@ class TaskServiceTest(TestCase):
                 text='Updated text'
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_NOT_FOUND)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_NOT_FOUND])
 
     def test_update_task_no_permission(self) -> None:
-        """Test updating task without permission."""
+        """Test updating task without permission.
+
+        Tasks of other users are reported as not found.
+        """
         task: Task = Task.objects.create(
             text='Test task',
             project=self.project
@@ -224,7 +247,7 @@ class TaskServiceTest(TestCase):
                 text='Updated text'
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_NO_PERMISSION)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_NOT_FOUND])
 
     def test_update_task_invalid_text(self) -> None:
         """Test updating task with invalid text."""
@@ -239,7 +262,7 @@ class TaskServiceTest(TestCase):
                 text='<script>alert("xss")</script>'
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_TEXT_INVALID_CHARS)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_TEXT_INVALID_CHARS])
 
     def test_delete_task_success(self) -> None:
         """Test successful task deletion."""
@@ -251,17 +274,22 @@ class TaskServiceTest(TestCase):
         result: bool = self.service.delete_task(task.id, self.user)
         
         self.assertTrue(result)
-        self.assertFalse(Task.objects.filter(id=task.id).exists())
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(id=task.id).exists()
+        )
 
     def test_delete_task_not_found(self) -> None:
         """Test deleting non-existent task."""
         with self.assertRaises(ValidationError) as context:
             self.service.delete_task(999, self.user)
         
-        self.assertEqual(str(context.exception), ERROR_TASK_NOT_FOUND)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_NOT_FOUND])
 
     def test_delete_task_no_permission(self) -> None:
-        """Test deleting task without permission."""
+        """Test deleting task without permission.
+
+        Tasks of other users are reported as not found.
+        """
         task: Task = Task.objects.create(
             text='Test task',
             project=self.project
@@ -270,7 +298,7 @@ class TaskServiceTest(TestCase):
         with self.assertRaises(ValidationError) as context:
             self.service.delete_task(task.id, self.other_user)
         
-        self.assertEqual(str(context.exception), ERROR_TASK_NO_PERMISSION)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_NOT_FOUND])
 
     def test_toggle_task_completion_success(self) -> None:
         """Test successful task completion toggle."""
@@ -281,26 +309,27 @@ class TaskServiceTest(TestCase):
         )
         
         # Toggle to completed
-        updated_task: Task = self.service.toggle_task_completion(
-            task.id, self.user, True
+        self.assertTrue(
+            self.service.toggle_task_completion(task.id, self.user, True)
         )
-        self.assertTrue(updated_task.completed)
         
         # Toggle back to not completed
-        updated_task = self.service.toggle_task_completion(
-            task.id, self.user, False
+        self.assertFalse(
+            self.service.toggle_task_completion(task.id, self.user, False)
         )
-        self.assertFalse(updated_task.completed)
 
     def test_toggle_task_completion_not_found(self) -> None:
         """Test toggling non-existent task."""
         with self.assertRaises(ValidationError) as context:
             self.service.toggle_task_completion(999, self.user, True)
         
-        self.assertEqual(str(context.exception), ERROR_TASK_NOT_FOUND)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_NOT_FOUND])
 
     def test_toggle_task_completion_no_permission(self) -> None:
-        """Test toggling task without permission."""
+        """Test toggling task without permission.
+
+        Tasks of other users are reported as not found.
+        """
         task: Task = Task.objects.create(
             text='Test task',
             project=self.project
@@ -311,7 +340,7 @@ class TaskServiceTest(TestCase):
                 task.id, self.other_user, True
             )
         
-        self.assertEqual(str(context.exception), ERROR_TASK_NO_PERMISSION)
+        self.assertEqual(context.exception.messages, [ERROR_TASK_NOT_FOUND])
 
     def test_reorder_tasks_success(self) -> None:
         """Test successful task reordering."""
@@ -339,15 +368,15 @@ class TaskServiceTest(TestCase):
         task1.refresh_from_db()
         task2.refresh_from_db()
         
-        self.assertEqual(task1.priority, 5)
-        self.assertEqual(task2.priority, 1)
+        self.assertEqual(task1.priority, 5 * TASK_RANK_GAP)
+        self.assertEqual(task2.priority, TASK_RANK_GAP)
 
     def test_reorder_tasks_empty_data(self) -> None:
         """Test reordering with empty data."""
         with self.assertRaises(ValidationError) as context:
             self.service.reorder_tasks([], self.user)
         
-        self.assertEqual(str(context.exception), "Order data cannot be empty")
+        self.assertEqual(context.exception.messages, ["Order data cannot be empty"])
 
     def test_get_project_tasks(self) -> None:
         """Test getting project tasks."""
@@ -384,9 +413,12 @@ class TaskServiceTest(TestCase):
 
     def test_get_task_stats(self) -> None:
         """Test getting task statistics."""
-        Task.objects.create(text='Task 1', project=self.project, completed=False)
-        Task.objects.create(text='Task 2', project=self.project, completed=True)
-        Task.objects.create(text='Task 3', project=self.project, completed=True)
+        for text, completed in [
+            ('Task 1', False), ('Task 2', True), ('Task 3', True)
+        ]:
+            task = self.service.create_task(text, self.project.id, self.user)
+            if completed:
+                self.service.toggle_task_completion(task.id, self.user, True)
         
         stats: dict = self.service.get_task_stats(self.project.id, self.user)
         
@@ -403,3 +435,100 @@ class TaskServiceTest(TestCase):
         self.assertEqual(stats['completed_tasks'], 0)
         self.assertEqual(stats['active_tasks'], 0)
         self.assertEqual(stats['completion_rate'], 0)
+
+    def test_create_tasks_from_lines(self) -> None:
+        """Test creating one task per non-blank line in order."""
+        tasks: list = self.service.create_tasks(
+            text='  Buy milk \n\nCall mom\r\nWrite report\n',
+            project_id=self.project.id,
+            user=self.user
+        )
+
+        self.assertEqual(
+            [task.text for task in tasks],
+            ['Buy milk', 'Call mom', 'Write report']
+        )
+        self.assertEqual(
+            [task.priority for task in tasks],
+            [TASK_RANK_GAP, 2 * TASK_RANK_GAP, 3 * TASK_RANK_GAP]
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.task_count, 3)
+
+    def test_create_tasks_reports_every_invalid_line(self) -> None:
+        """Test that invalid lines are all reported and nothing is created."""
+        with self.assertRaises(ValidationError) as context:
+            self.service.create_tasks(
+                text=f'Fine\n{"x" * 100}\nAlso fine\n{"y" * 100}',
+                project_id=self.project.id,
+                user=self.user
+            )
+
+        self.assertEqual(len(context.exception.messages), 2)
+        self.assertTrue(context.exception.messages[0].startswith('Line 2:'))
+        self.assertTrue(context.exception.messages[1].startswith('Line 4:'))
+        self.assertFalse(Task.objects.using(self.shard).filter(
+            project=self.project
+        ).exists())
+
+    def test_create_tasks_rejects_empty_and_oversized_batches(self) -> None:
+        """Test batch size limits."""
+        with self.assertRaises(ValidationError):
+            self.service.create_tasks('\n \n', self.project.id, self.user)
+
+        with self.assertRaises(ValidationError):
+            self.service.create_tasks(
+                '\n'.join(f'Task {i}' for i in range(101)),
+                self.project.id,
+                self.user
+            )
+
+    def test_create_tasks_project_not_owned(self) -> None:
+        """Test batch creation in another user's project."""
+        with self.assertRaises(ValidationError) as context:
+            self.service.create_tasks(
+                'Task', self.other_project.id, self.user
+            )
+
+        self.assertIn(ERROR_PROJECT_NOT_FOUND, str(context.exception))
+
+    def _assert_no_owner_fetch(self, ctx: CaptureQueriesContext) -> None:
+        """Assert that no project or user row was loaded on its own."""
+        for query in ctx.captured_queries:
+            self.assertFalse(query['sql'].startswith('SELECT "projects"'))
+            self.assertNotIn('"auth_user"', query['sql'])
+
+    def test_update_task_checks_ownership_in_sql(self) -> None:
+        """Test that the permission check of an update costs no query."""
+        task: Task = Task.objects.create(text='Task', project=self.project)
+
+        with unit_of_work():
+            with CaptureQueriesContext(self.shard_connection) as ctx:
+                self.service.update_task(task.id, self.user, text='Updated')
+
+        reads = [
+            query for query in ctx.captured_queries
+            if query['sql'].startswith('SELECT')
+        ]
+        self.assertEqual(len(reads), 1)
+        self._assert_no_owner_fetch(ctx)
+
+    def test_delete_and_toggle_check_ownership_in_sql(self) -> None:
+        """Test that delete and toggle never lazy-load the owner."""
+        task: Task = Task.objects.create(text='Task', project=self.project)
+
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            self.service.toggle_task_completion(task.id, self.user, True)
+            self.service.delete_task(task.id, self.user)
+
+        self._assert_no_owner_fetch(ctx)
+
+    def test_foreign_task_is_not_found_without_extra_queries(self) -> None:
+        """Test that another user's task is rejected by the query itself."""
+        task: Task = Task.objects.create(
+            text='Task', project=self.other_project
+        )
+
+        with self.assertNumQueries(1, using=self.shard):
+            with self.assertRaises(ValidationError):
+                self.service.update_task(task.id, self.user, text='Updated')
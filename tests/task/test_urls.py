@@ -24,6 +24,7 @@ class TaskUrlsTest(TestCase):
     def setUp(self) -> None:
         """Set up test data."""
         self.user: User = User.objects.create_user(
+            username='testuser',
             email='test@example.com',
             password='testpass123'
         )
@@ -31,74 +32,74 @@ class TaskUrlsTest(TestCase):
     def test_task_create_url(self) -> None:
         """Test task create URL pattern."""
         project_id: int = 1
-        url: str = reverse('task:create', kwargs={'project_id': project_id})
+        url: str = reverse('tasks:create', kwargs={'project_id': project_id})
         
-        self.assertEqual(url, f'/task/{project_id}/create/')
+        self.assertEqual(url, f'/tasks/{project_id}/create/')
         
         # Test URL resolution
         resolver_match = resolve(url)
-        self.assertEqual(resolver_match.func.__name__, 'TaskCreateView')
-        self.assertEqual(resolver_match.kwargs['project_id'], str(project_id))
+        self.assertEqual(resolver_match.func.view_class, TaskCreateView)
+        self.assertEqual(resolver_match.kwargs['project_id'], project_id)
 
     def test_task_update_url(self) -> None:
         """Test task update URL pattern."""
         task_id: int = 1
-        url: str = reverse('task:update', kwargs={'task_id': task_id})
+        url: str = reverse('tasks:update', kwargs={'pk': task_id})
         
-        self.assertEqual(url, f'/task/{task_id}/update/')
+        self.assertEqual(url, f'/tasks/{task_id}/update/')
         
         # Test URL resolution
         resolver_match = resolve(url)
-        self.assertEqual(resolver_match.func.__name__, 'TaskUpdateView')
-        self.assertEqual(resolver_match.kwargs['task_id'], str(task_id))
+        self.assertEqual(resolver_match.func.view_class, TaskUpdateView)
+        self.assertEqual(resolver_match.kwargs['pk'], task_id)
 
     def test_task_delete_url(self) -> None:
         """Test task delete URL pattern."""
         task_id: int = 1
-        url: str = reverse('task:delete', kwargs={'task_id': task_id})
+        url: str = reverse('tasks:delete', kwargs={'pk': task_id})
         
-        self.assertEqual(url, f'/task/{task_id}/delete/')
+        self.assertEqual(url, f'/tasks/{task_id}/delete/')
         
         # Test URL resolution
         resolver_match = resolve(url)
-        self.assertEqual(resolver_match.func.__name__, 'TaskDeleteView')
-        self.assertEqual(resolver_match.kwargs['task_id'], str(task_id))
+        self.assertEqual(resolver_match.func.view_class, TaskDeleteView)
+        self.assertEqual(resolver_match.kwargs['pk'], task_id)
 
     def test_task_toggle_url(self) -> None:
         """Test task toggle URL pattern."""
         task_id: int = 1
-        url: str = reverse('task:toggle', kwargs={'task_id': task_id})
+        url: str = reverse('tasks:toggle', kwargs={'pk': task_id})
         
-        self.assertEqual(url, f'/task/{task_id}/toggle/')
+        self.assertEqual(url, f'/tasks/{task_id}/toggle/')
         
         # Test URL resolution
         resolver_match = resolve(url)
-        self.assertEqual(resolver_match.func.__name__, 'TaskToggleView')
-        self.assertEqual(resolver_match.kwargs['task_id'], str(task_id))
+        self.assertEqual(resolver_match.func.view_class, TaskToggleView)
+        self.assertEqual(resolver_match.kwargs['pk'], task_id)
 
     def test_task_reorder_url(self) -> None:
         """Test task reorder URL pattern."""
-        url: str = reverse('task:reorder')
+        url: str = reverse('tasks:reorder')
         
-        self.assertEqual(url, '/task/reorder/')
+        self.assertEqual(url, '/tasks/reorder/')
         
         # Test URL resolution
         resolver_match = resolve(url)
-        self.assertEqual(resolver_match.func.__name__, 'TaskReorderView')
+        self.assertEqual(resolver_match.func.view_class, TaskReorderView)
 
     def test_url_namespace(self) -> None:
         """Test that all task URLs use the correct namespace."""
         urls_to_test: list[tuple[str, dict]] = [
-            ('task:create', {'project_id': 1}),
-            ('task:update', {'task_id': 1}),
-            ('task:delete', {'task_id': 1}),
-            ('task:toggle', {'task_id': 1}),
-            ('task:reorder', {}),
+            ('tasks:create', {'project_id': 1}),
+            ('tasks:update', {'pk': 1}),
+            ('tasks:delete', {'pk': 1}),
+            ('tasks:toggle', {'pk': 1}),
+            ('tasks:reorder', {}),
         ]
         
         for url_name, kwargs in urls_to_test:
             url: str = reverse(url_name, kwargs=kwargs)
-            self.assertTrue(url.startswith('/task/'))
+            self.assertTrue(url.startswith('/tasks/'))
 
     def test_url_parameters(self) -> None:
         """Test URL parameters are correctly handled."""
@@ -107,19 +108,19 @@ class TaskUrlsTest(TestCase):
         
         for test_id in test_ids:
             # Test create URL
-            create_url: str = reverse('task:create', kwargs={'project_id': test_id})
+            create_url: str = reverse('tasks:create', kwargs={'project_id': test_id})
             self.assertIn(str(test_id), create_url)
             
             # Test update URL
-            update_url: str = reverse('task:update', kwargs={'task_id': test_id})
+            update_url: str = reverse('tasks:update', kwargs={'pk': test_id})
             self.assertIn(str(test_id), update_url)
             
             # Test delete URL
-            delete_url: str = reverse('task:delete', kwargs={'task_id': test_id})
+            delete_url: str = reverse('tasks:delete', kwargs={'pk': test_id})
             self.assertIn(str(test_id), delete_url)
             
             # Test toggle URL
-            toggle_url: str = reverse('task:toggle', kwargs={'task_id': test_id})
+            toggle_url: str = reverse('tasks:toggle', kwargs={'pk': test_id})
             self.assertIn(str(test_id), toggle_url)
 
     def test_url_structure(self) -> None:
@@ -128,11 +129,11 @@ class TaskUrlsTest(TestCase):
         project_id: int = 1
         task_id: int = 1
         
-        create_url: str = reverse('task:create', kwargs={'project_id': project_id})
-        update_url: str = reverse('task:update', kwargs={'task_id': task_id})
-        delete_url: str = reverse('task:delete', kwargs={'task_id': task_id})
-        toggle_url: str = reverse('task:toggle', kwargs={'task_id': task_id})
-        reorder_url: str = reverse('task:reorder')
+        create_url: str = reverse('tasks:create', kwargs={'project_id': project_id})
+        update_url: str = reverse('tasks:update', kwargs={'pk': task_id})
+        delete_url: str = reverse('tasks:delete', kwargs={'pk': task_id})
+        toggle_url: str = reverse('tasks:toggle', kwargs={'pk': task_id})
+        reorder_url: str = reverse('tasks:reorder')
         
         # Check URL structure
         self.assertTrue(create_url.endswith('/'))
@@ -142,11 +143,11 @@ class TaskUrlsTest(TestCase):
         self.assertTrue(reorder_url.endswith('/'))
         
         # Check URL patterns
-        self.assertIn('/task/', create_url)
-        self.assertIn('/task/', update_url)
-        self.assertIn('/task/', delete_url)
-        self.assertIn('/task/', toggle_url)
-        self.assertIn('/task/', reorder_url)
+        self.assertIn('/tasks/', create_url)
+        self.assertIn('/tasks/', update_url)
+        self.assertIn('/tasks/', delete_url)
+        self.assertIn('/tasks/', toggle_url)
+        self.assertIn('/tasks/', reorder_url)
 
     def test_url_reverse_consistency(self) -> None:
         """Test that URL reverse and resolve are consistent."""
@@ -154,24 +155,24 @@ class TaskUrlsTest(TestCase):
         task_id: int = 1
         
         # Test create URL
-        create_url: str = reverse('task:create', kwargs={'project_id': project_id})
+        create_url: str = reverse('tasks:create', kwargs={'project_id': project_id})
         create_resolver = resolve(create_url)
-        self.assertEqual(create_resolver.kwargs['project_id'], str(project_id))
+        self.assertEqual(create_resolver.kwargs['project_id'], project_id)
         
         # Test update URL
-        update_url: str = reverse('task:update', kwargs={'task_id': task_id})
+        update_url: str = reverse('tasks:update', kwargs={'pk': task_id})
         update_resolver = resolve(update_url)
-        self.assertEqual(update_resolver.kwargs['task_id'], str(task_id))
+        self.assertEqual(update_resolver.kwargs['pk'], task_id)
         
         # Test delete URL
-        delete_url: str = reverse('task:delete', kwargs={'task_id': task_id})
+        delete_url: str = reverse('tasks:delete', kwargs={'pk': task_id})
         delete_resolver = resolve(delete_url)
-        self.assertEqual(delete_resolver.kwargs['task_id'], str(task_id))
+        self.assertEqual(delete_resolver.kwargs['pk'], task_id)
         
         # Test toggle URL
-        toggle_url: str = reverse('task:toggle', kwargs={'task_id': task_id})
+        toggle_url: str = reverse('tasks:toggle', kwargs={'pk': task_id})
         toggle_resolver = resolve(toggle_url)
-        self.assertEqual(toggle_resolver.kwargs['task_id'], str(task_id))
+        self.assertEqual(toggle_resolver.kwargs['pk'], task_id)
 
     def test_url_view_mapping(self) -> None:
         """Test that URLs map to correct view classes."""
@@ -179,29 +180,29 @@ class TaskUrlsTest(TestCase):
         task_id: int = 1
         
         # Test create URL
-        create_url: str = reverse('task:create', kwargs={'project_id': project_id})
+        create_url: str = reverse('tasks:create', kwargs={'project_id': project_id})
         create_resolver = resolve(create_url)
-        self.assertEqual(create_resolver.func.__name__, 'TaskCreateView')
+        self.assertEqual(create_resolver.func.view_class, TaskCreateView)
         
         # Test update URL
-        update_url: str = reverse('task:update', kwargs={'task_id': task_id})
+        update_url: str = reverse('tasks:update', kwargs={'pk': task_id})
         update_resolver = resolve(update_url)
-        self.assertEqual(update_resolver.func.__name__, 'TaskUpdateView')
+        self.assertEqual(update_resolver.func.view_class, TaskUpdateView)
         
         # Test delete URL
-        delete_url: str = reverse('task:delete', kwargs={'task_id': task_id})
+        delete_url: str = reverse('tasks:delete', kwargs={'pk': task_id})
         delete_resolver = resolve(delete_url)
-        self.assertEqual(delete_resolver.func.__name__, 'TaskDeleteView')
+        self.assertEqual(delete_resolver.func.view_class, TaskDeleteView)
         
         # Test toggle URL
-        toggle_url: str = reverse('task:toggle', kwargs={'task_id': task_id})
+        toggle_url: str = reverse('tasks:toggle', kwargs={'pk': task_id})
         toggle_resolver = resolve(toggle_url)
-        self.assertEqual(toggle_resolver.func.__name__, 'TaskToggleView')
+        self.assertEqual(toggle_resolver.func.view_class, TaskToggleView)
         
         # Test reorder URL
-        reorder_url: str = reverse('task:reorder')
+        reorder_url: str = reverse('tasks:reorder')
         reorder_resolver = resolve(reorder_url)
-        self.assertEqual(reorder_resolver.func.__name__, 'TaskReorderView')
+        self.assertEqual(reorder_resolver.func.view_class, TaskReorderView)
 
     def test_url_parameter_types(self) -> None:
         """Test URL parameter type handling."""
@@ -209,8 +210,8 @@ class TaskUrlsTest(TestCase):
         project_id_str: str = "1"
         task_id_str: str = "1"
         
-        create_url: str = reverse('task:create', kwargs={'project_id': project_id_str})
-        update_url: str = reverse('task:update', kwargs={'task_id': task_id_str})
+        create_url: str = reverse('tasks:create', kwargs={'project_id': project_id_str})
+        update_url: str = reverse('tasks:update', kwargs={'pk': task_id_str})
         
         self.assertIn(project_id_str, create_url)
         self.assertIn(task_id_str, update_url)
@@ -221,11 +222,11 @@ class TaskUrlsTest(TestCase):
         task_id: int = 1
         
         urls: list[str] = [
-            reverse('task:create', kwargs={'project_id': project_id}),
-            reverse('task:update', kwargs={'task_id': task_id}),
-            reverse('task:delete', kwargs={'task_id': task_id}),
-            reverse('task:toggle', kwargs={'task_id': task_id}),
-            reverse('task:reorder'),
+            reverse('tasks:create', kwargs={'project_id': project_id}),
+            reverse('tasks:update', kwargs={'pk': task_id}),
+            reverse('tasks:delete', kwargs={'pk': task_id}),
+            reverse('tasks:toggle', kwargs={'pk': task_id}),
+            reverse('tasks:reorder'),
         ]
         
         # Check that all URLs are unique
@@ -241,11 +242,11 @@ class TaskUrlsTest(TestCase):
         
         # All these URLs should be accessible
         urls: list[str] = [
-            reverse('task:create', kwargs={'project_id': project_id}),
-            reverse('task:update', kwargs={'task_id': task_id}),
-            reverse('task:delete', kwargs={'task_id': task_id}),
-            reverse('task:toggle', kwargs={'task_id': task_id}),
-            reverse('task:reorder'),
+            reverse('tasks:create', kwargs={'project_id': project_id}),
+            reverse('tasks:update', kwargs={'pk': task_id}),
+            reverse('tasks:delete', kwargs={'pk': task_id}),
+            reverse('tasks:toggle', kwargs={'pk': task_id}),
+            reverse('tasks:reorder'),
         ]
         
         for url in urls:
@@ -1,11 +1,19 @@
 from typing import TYPE_CHECKING
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 
+from task.constants import (
+    DEFAULT_TASKS_PER_PAGE,
+    ERROR_TASK_MOVE_INVALID,
+    TASK_RANK_GAP,
+)
 from task.models import Task
 from project.models import Project
+from tests.sharding import OwnerShardTestMixin
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -14,7 +22,7 @@ else:
     User = get_user_model()
 
 
-class TaskViewsTest(TestCase):
+class TaskViewsTest(OwnerShardTestMixin, TestCase):
     """Test cases for Task views."""
 
     def setUp(self) -> None:
@@ -30,6 +38,7 @@ class TaskViewsTest(TestCase):
             email='other@example.com',
             password='testpass123'
         )
+        self.keep_on_shard(self.user, self.other_user)
         self.project: Project = Project.objects.create(
             title='Test Project',
             owner=self.user
@@ -44,72 +53,75 @@ class TaskViewsTest(TestCase):
             priority=1
         )
 
+    def _create(self, project_id: int, text: str):
+        """POST task text the way the project's task input does."""
+        return self.client.post(
+            reverse('tasks:create', kwargs={'project_id': project_id}),
+            data={f'searchInput-{project_id}': text}
+        )
+
     def test_create_task_view_get(self) -> None:
-        """Test GET request to create task view."""
+        """Test that the create view has no form page."""
         self.client.force_login(self.user)
         response = self.client.get(
-            reverse('task:create', kwargs={'project_id': self.project.id})
+            reverse('tasks:create', kwargs={'project_id': self.project.id})
         )
         
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'task/task_form.html')
+        self.assertEqual(response.status_code, 405)
 
     def test_create_task_view_post_valid(self) -> None:
         """Test POST request to create task view with valid data."""
         self.client.force_login(self.user)
-        data: dict = {
-            'text': 'New task',
-            'priority': 5
-        }
-        response = self.client.post(
-            reverse('task:create', kwargs={'project_id': self.project.id}),
-            data=data
-        )
+        response = self._create(self.project.id, 'New task')
         
-        self.assertEqual(response.status_code, 302)  # Redirect
-        self.assertTrue(Task.objects.filter(text='New task').exists())
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'task/task_item.html')
+        self.assertContains(response, 'New task')
+        self.assertTrue(
+            Task.objects.using(self.shard).filter(text='New task').exists()
+        )
 
     def test_create_task_view_post_invalid(self) -> None:
         """Test POST request to create task view with invalid data."""
         self.client.force_login(self.user)
-        data: dict = {
-            'text': '',  # Empty text
-            'priority': 1
-        }
-        response = self.client.post(
-            reverse('task:create', kwargs={'project_id': self.project.id}),
-            data=data
-        )
+        response = self._create(self.project.id, '   ')
         
-        self.assertEqual(response.status_code, 200)  # Form errors
-        self.assertFalse(Task.objects.filter(text='').exists())
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            Task.objects.using(self.shard).filter(
+                project=self.project
+            ).count(),
+            1
+        )
 
     def test_create_task_view_unauthorized(self) -> None:
         """Test create task view without authentication."""
-        response = self.client.get(
-            reverse('task:create', kwargs={'project_id': self.project.id})
-        )
+        response = self._create(self.project.id, 'New task')
         
         self.assertEqual(response.status_code, 302)  # Redirect to login
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(text='New task').exists()
+        )
 
     def test_create_task_view_wrong_user(self) -> None:
         """Test create task view for project owned by different user."""
         self.client.force_login(self.other_user)
-        response = self.client.get(
-            reverse('task:create', kwargs={'project_id': self.project.id})
-        )
+        response = self._create(self.project.id, 'New task')
         
-        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(text='New task').exists()
+        )
 
     def test_update_task_view_get(self) -> None:
         """Test GET request to update task view."""
         self.client.force_login(self.user)
         response = self.client.get(
-            reverse('task:update', kwargs={'task_id': self.task.id})
+            reverse('tasks:update', kwargs={'pk': self.task.id})
         )
         
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'task/task_form.html')
+        self.assertTemplateUsed(response, 'task/task_text_edit.html')
 
     def test_update_task_view_post_valid(self) -> None:
         """Test POST request to update task view with valid data."""
@@ -119,14 +131,15 @@ class TaskViewsTest(TestCase):
             'priority': 10
         }
         response = self.client.post(
-            reverse('task:update', kwargs={'task_id': self.task.id}),
+            reverse('tasks:update', kwargs={'pk': self.task.id}),
             data=data
         )
         
-        self.assertEqual(response.status_code, 302)  # Redirect
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'task/task_text_display.html')
         self.task.refresh_from_db()
         self.assertEqual(self.task.text, 'Updated task')
-        self.assertEqual(self.task.priority, 10)
+        self.assertEqual(self.task.priority, 1)  # Only the text is edited
 
     def test_update_task_view_post_invalid(self) -> None:
         """Test POST request to update task view with invalid data."""
@@ -136,18 +149,19 @@ class TaskViewsTest(TestCase):
             'priority': 1
         }
         response = self.client.post(
-            reverse('task:update', kwargs={'task_id': self.task.id}),
+            reverse('tasks:update', kwargs={'pk': self.task.id}),
             data=data
         )
         
-        self.assertEqual(response.status_code, 200)  # Form errors
+        self.assertEqual(response.status_code, 422)  # Form errors
+        self.assertTemplateUsed(response, 'task/task_text_edit.html')
         self.task.refresh_from_db()
         self.assertEqual(self.task.text, 'Test task')  # Unchanged
 
     def test_update_task_view_unauthorized(self) -> None:
         """Test update task view without authentication."""
         response = self.client.get(
-            reverse('task:update', kwargs={'task_id': self.task.id})
+            reverse('tasks:update', kwargs={'pk': self.task.id})
         )
         
         self.assertEqual(response.status_code, 302)  # Redirect to login
@@ -156,80 +170,142 @@ class TaskViewsTest(TestCase):
         """Test update task view for task owned by different user."""
         self.client.force_login(self.other_user)
         response = self.client.get(
-            reverse('task:update', kwargs={'task_id': self.task.id})
+            reverse('tasks:update', kwargs={'pk': self.task.id})
         )
         
         self.assertEqual(response.status_code, 404)
 
     def test_delete_task_view_get(self) -> None:
-        """Test GET request to delete task view."""
+        """Test that the delete view has no confirmation page."""
         self.client.force_login(self.user)
         response = self.client.get(
-            reverse('task:delete', kwargs={'task_id': self.task.id})
+            reverse('tasks:delete', kwargs={'pk': self.task.id})
         )
         
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'task/delete.html')
+        self.assertEqual(response.status_code, 405)
+        self.assertTrue(
+            Task.objects.using(self.shard).filter(id=self.task.id).exists()
+        )
 
     def test_delete_task_view_post(self) -> None:
         """Test POST request to delete task view."""
         self.client.force_login(self.user)
         response = self.client.post(
-            reverse('task:delete', kwargs={'task_id': self.task.id})
+            reverse('tasks:delete', kwargs={'pk': self.task.id})
         )
         
-        self.assertEqual(response.status_code, 302)  # Redirect
-        self.assertFalse(Task.objects.filter(id=self.task.id).exists())
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(id=self.task.id).exists()
+        )
+
+    def test_delete_task_view_delete(self) -> None:
+        """Test DELETE request, as sent by the task's delete button."""
+        self.client.force_login(self.user)
+        response = self.client.delete(
+            reverse('tasks:delete', kwargs={'pk': self.task.id})
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(id=self.task.id).exists()
+        )
 
     def test_delete_task_view_unauthorized(self) -> None:
         """Test delete task view without authentication."""
-        response = self.client.get(
-            reverse('task:delete', kwargs={'task_id': self.task.id})
+        response = self.client.post(
+            reverse('tasks:delete', kwargs={'pk': self.task.id})
         )
         
         self.assertEqual(response.status_code, 302)  # Redirect to login
+        self.assertTrue(
+            Task.objects.using(self.shard).filter(id=self.task.id).exists()
+        )
 
     def test_delete_task_view_wrong_user(self) -> None:
         """Test delete task view for task owned by different user."""
         self.client.force_login(self.other_user)
-        response = self.client.get(
-            reverse('task:delete', kwargs={'task_id': self.task.id})
+        response = self.client.post(
+            reverse('tasks:delete', kwargs={'pk': self.task.id})
         )
         
         self.assertEqual(response.status_code, 404)
+        self.assertTrue(
+            Task.objects.using(self.shard).filter(id=self.task.id).exists()
+        )
+
+    def _toggle(self, task_id: int, completed: bool = True):
+        """POST a completion toggle of a task."""
+        return self.client.post(
+            reverse('tasks:toggle', kwargs={'pk': task_id}),
+            data={'completed': completed},
+            content_type='application/json'
+        )
 
     def test_toggle_task_view_post(self) -> None:
         """Test POST request to toggle task view."""
         self.client.force_login(self.user)
         self.assertFalse(self.task.completed)
-        
-        response = self.client.post(
-            reverse('task:toggle', kwargs={'task_id': self.task.id}),
-            data={'completed': 'true'}
-        )
-        
+
+        response = self._toggle(self.task.id)
+
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {'status': 'success', 'completed': True}
+        )
         self.task.refresh_from_db()
         self.assertTrue(self.task.completed)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.completed_count, 1)
+
+    def test_toggle_task_view_is_one_owner_scoped_write(self) -> None:
+        """Test that a toggle writes without loading the task."""
+        self.client.force_login(self.user)
+        self.client.get(reverse('projects:dashboard'))
+
+        with CaptureQueriesContext(self.shard_connection) as queries:
+            response = self._toggle(self.task.id)
+
+        self.assertEqual(response.status_code, 200)
+        statements = [
+            query['sql'] for query in queries
+            if '"tasks"' in query['sql'] or '"projects"' in query['sql']
+        ]
+        expected = 1 if self.shard_connection.vendor == 'postgresql' else 2
+        self.assertEqual(len(statements), expected, statements)
+        self.assertTrue(statements[0].startswith(('UPDATE', 'WITH')))
+        self.assertFalse(
+            [sql for sql in statements if sql.startswith('SELECT')]
+        )
+
+    def test_toggle_task_view_rejects_invalid_payload(self) -> None:
+        """Test that the status must be a JSON boolean."""
+        self.client.force_login(self.user)
 
-    def test_toggle_task_view_unauthorized(self) -> None:
-        """Test toggle task view without authentication."""
         response = self.client.post(
-            reverse('task:toggle', kwargs={'task_id': self.task.id}),
-            data={'completed': 'true'}
+            reverse('tasks:toggle', kwargs={'pk': self.task.id}),
+            data={'completed': 'yes'},
+            content_type='application/json'
         )
-        
+
+        self.assertEqual(response.status_code, 400)
+        self.task.refresh_from_db()
+        self.assertFalse(self.task.completed)
+
+    def test_toggle_task_view_unauthorized(self) -> None:
+        """Test toggle task view without authentication."""
+        response = self._toggle(self.task.id)
+
         self.assertEqual(response.status_code, 302)  # Redirect to login
 
     def test_toggle_task_view_wrong_user(self) -> None:
         """Test toggle task view for task owned by different user."""
         self.client.force_login(self.other_user)
-        response = self.client.post(
-            reverse('task:toggle', kwargs={'task_id': self.task.id}),
-            data={'completed': 'true'}
-        )
-        
+        response = self._toggle(self.task.id)
+
         self.assertEqual(response.status_code, 404)
+        self.task.refresh_from_db()
+        self.assertFalse(self.task.completed)
 
     def test_reorder_tasks_view_post(self) -> None:
         """Test POST request to reorder tasks view."""
@@ -241,13 +317,13 @@ class TaskViewsTest(TestCase):
         )
         
         data: dict = {
-            'order_data': [
+            'order': [
                 {'id': self.task.id, 'position': 5},
                 {'id': task2.id, 'position': 1}
             ]
         }
         response = self.client.post(
-            reverse('task:reorder'),
+            reverse('tasks:reorder'),
             data=data,
             content_type='application/json'
         )
@@ -255,12 +331,12 @@ class TaskViewsTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.task.refresh_from_db()
         task2.refresh_from_db()
-        self.assertEqual(self.task.priority, 5)
-        self.assertEqual(task2.priority, 1)
+        self.assertEqual(self.task.priority, 5 * TASK_RANK_GAP)
+        self.assertEqual(task2.priority, TASK_RANK_GAP)
 
     def test_reorder_tasks_view_unauthorized(self) -> None:
         """Test reorder tasks view without authentication."""
-        response = self.client.post(reverse('task:reorder'))
+        response = self.client.post(reverse('tasks:reorder'))
         
         self.assertEqual(response.status_code, 302)  # Redirect to login
 
@@ -270,28 +346,540 @@ class TaskViewsTest(TestCase):
         
         # Test update
         response = self.client.get(
-            reverse('task:update', kwargs={'task_id': 999})
+            reverse('tasks:update', kwargs={'pk': 999})
         )
         self.assertEqual(response.status_code, 404)
         
         # Test delete
-        response = self.client.get(
-            reverse('task:delete', kwargs={'task_id': 999})
+        response = self.client.post(
+            reverse('tasks:delete', kwargs={'pk': 999})
         )
         self.assertEqual(response.status_code, 404)
         
         # Test toggle
-        response = self.client.post(
-            reverse('task:toggle', kwargs={'task_id': 999}),
-            data={'completed': 'true'}
-        )
+        response = self._toggle(999)
         self.assertEqual(response.status_code, 404)
 
     def test_project_not_found(self) -> None:
         """Test create task view with non-existent project."""
         self.client.force_login(self.user)
-        response = self.client.get(
-            reverse('task:create', kwargs={'project_id': 999})
-        )
+        response = self._create(999, 'New task')
         
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskListViewTest(OwnerShardTestMixin, TestCase):
+    """Test cases for the paginated task list endpoint."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        cache.clear()
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user: User = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user, self.other_user)
+        self.project: Project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.tasks: list[Task] = [
+            Task.objects.create(
+                text=f'Task number {i}', project=self.project, priority=i
+            )
+            for i in range(1, 46)
+        ]
+        self.url: str = reverse(
+            'tasks:list', kwargs={'project_id': self.project.id}
+        )
+
+    def test_list_view_unauthorized(self) -> None:
+        """Test that the list view requires authentication."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_list_view_pages_are_bounded(self) -> None:
+        """Test that pages hold at most one page of tasks plus a loader."""
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['page']), 20)
+        self.assertContains(response, 'id="task-row-', count=20)
+        self.assertContains(response, 'load-more-tasks-btn')
+        self.assertContains(response, 'hx-swap-oob="true"')
+
+    def test_list_view_follows_cursor(self) -> None:
+        """Test that following cursors returns every task exactly once."""
+        self.client.force_login(self.user)
+        seen: list[Task] = []
+        cursor = None
+
+        while True:
+            params = {'cursor': cursor} if cursor else {}
+            response = self.client.get(self.url, params)
+            page = response.context['page']
+            seen.extend(page)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, self.tasks)
+        self.assertNotContains(response, 'load-more-tasks-btn')
+
+    def test_list_view_is_cached_until_the_user_writes(self) -> None:
+        """Test that a repeated page load runs no task query."""
+        self.client.force_login(self.user)
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(self.shard_connection) as queries:
+            response = self.client.get(self.url)
+        self.assertFalse(
+            [query for query in queries if 'FROM "tasks"' in query['sql']]
+        )
+        self.assertEqual(len(response.context['page']), 20)
+
+        with self.captureOnCommitCallbacks(using=self.shard, execute=True):
+            self.client.post(
+                reverse('tasks:update', args=[self.tasks[0].id]),
+                {'text': 'Renamed task'}
+            )
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            response.context['page'].object_list[0].text, 'Renamed task'
+        )
+
+    def test_list_view_invalid_cursor(self) -> None:
+        """Test that a malformed cursor is rejected."""
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url, {'cursor': '!!'})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_view_wrong_user(self) -> None:
+        """Test that other users get no tasks from the project."""
+        self.client.force_login(self.other_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'Task number')
+
+    def test_dashboard_renders_first_page_only(self) -> None:
+        """Test that the dashboard bounds tasks rendered per project."""
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('projects:dashboard'))
+
+        self.assertContains(response, 'id="task-row-', count=20)
+        self.assertContains(response, reverse('tasks:list', kwargs={
+            'project_id': self.project.id
+        }))
+
+
+
+class TaskMoveViewTest(OwnerShardTestMixin, TestCase):
+    """Test cases for the single-task move endpoint."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user: User = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user, self.other_user)
+        self.project: Project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.first, self.second, self.third = [
+            Task.objects.create(
+                text=f'Task number {i}', project=self.project, priority=i * 1024
+            )
+            for i in range(1, 4)
+        ]
+
+    def _move(self, task: Task, **payload: object):
+        """POST a move of ``task`` with the given payload."""
+        return self.client.post(
+            reverse('tasks:move', kwargs={'pk': task.id}),
+            data=payload,
+            content_type='application/json'
+        )
+
+    def _ordered_ids(self) -> list[int]:
+        """Get the project's task IDs in display order."""
+        return list(
+            Task.objects.using(self.shard).filter(
+                project=self.project
+            ).order_by(
+                'priority', 'id'
+            ).values_list('id', flat=True)
+        )
+
+    def test_move_view_unauthorized(self) -> None:
+        """Test that moving requires authentication."""
+        response = self._move(self.third, after=self.first.id)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_move_view_moves_task_and_bumps_version(self) -> None:
+        """Test a move with the current version."""
+        self.client.force_login(self.user)
+
+        response = self._move(self.third, after=self.first.id, version=0)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['version'], 1)
+        self.assertEqual(
+            self._ordered_ids(), [self.first.id, self.third.id, self.second.id]
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.task_order_version, 1)
+
+    def test_move_view_rejects_stale_version(self) -> None:
+        """Test that a move made against an outdated list is rejected."""
+        self.client.force_login(self.user)
+        self._move(self.third, after=self.first.id, version=0)
+
+        response = self._move(self.first, before=self.second.id, version=0)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            self._ordered_ids(), [self.first.id, self.third.id, self.second.id]
+        )
+
+    def test_move_view_rejects_invalid_payload(self) -> None:
+        """Test moves without an anchor or with a foreign anchor."""
+        self.client.force_login(self.user)
+        foreign_project = Project.objects.create(
+            title='Other Project', owner=self.other_user
+        )
+        foreign = Task.objects.create(text='Foreign', project=foreign_project)
+
+        self.assertEqual(self._move(self.third).status_code, 400)
+        self.assertEqual(
+            self._move(self.third, after='first').status_code, 400
+        )
+        response = self._move(self.third, after=foreign.id)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': ERROR_TASK_MOVE_INVALID})
+        self.assertEqual(self._move(self.third, after=[1]).status_code, 400)
+        self.client.force_login(self.other_user)
+        self.assertEqual(
+            self._move(self.third, after=self.first.id).status_code, 400
+        )
+
+
+class TaskBatchCreateViewTest(OwnerShardTestMixin, TestCase):
+    """Test cases for the multi-line task creation endpoint."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user)
+        self.project: Project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.url: str = reverse(
+            'tasks:batch_create', kwargs={'project_id': self.project.id}
+        )
+        self.field: str = f'searchInput-{self.project.id}'
+
+    def test_batch_create_unauthorized(self) -> None:
+        """Test that batch creation requires authentication."""
+        response = self.client.post(self.url, {self.field: 'Task'})
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_batch_create_renders_all_rows(self) -> None:
+        """Test that all created tasks come back in one response."""
+        self.client.force_login(self.user)
+        text = '\n'.join(f'Task number {i}' for i in range(50))
+
+        response = self.client.post(self.url, {self.field: text})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode().count('id="task-row-'), 50)
+        self.assertEqual(Task.objects.using(self.shard).filter(
+            project=self.project
+        ).count(), 50)
+
+    def test_batch_create_query_count_is_constant(self) -> None:
+        """Test that the number of queries does not grow with the batch."""
+        self.client.force_login(self.user)
+        self.client.post(self.url, {self.field: 'Warm up'})
+
+        with CaptureQueriesContext(self.shard_connection) as small:
+            self.client.post(self.url, {self.field: 'One\nTwo'})
+        with CaptureQueriesContext(self.shard_connection) as large:
+            self.client.post(self.url, {
+                self.field: '\n'.join(f'Task {i}' for i in range(100))
+            })
+
+        self.assertEqual(len(small), len(large))
+
+    def test_batch_create_invalid_line(self) -> None:
+        """Test that an invalid line rejects the whole batch."""
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.url, {self.field: f'Fine\n{"x" * 100}'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Line 2:', response.content.decode())
+        self.assertFalse(Task.objects.using(self.shard).filter(
+            project=self.project
+        ).exists())
+
+
+class TaskBulkViewsTest(OwnerShardTestMixin, TestCase):
+    """Test cases for the project-level bulk task endpoints."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        cache.clear()
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user: User = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user, self.other_user)
+        self.project: Project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.tasks: list[Task] = [
+            Task.objects.create(
+                text=f'Task number {i}', project=self.project, priority=i
+            )
+            for i in range(1, 6)
+        ]
+        self.client.force_login(self.user)
+
+    def _url(self, name: str, project: Project | None = None) -> str:
+        """Reverse a bulk endpoint for a project."""
+        return reverse(
+            f'tasks:{name}',
+            kwargs={'project_id': (project or self.project).id}
+        )
+
+    def test_bulk_views_unauthorized(self) -> None:
+        """Test that bulk endpoints require authentication."""
+        self.client.logout()
+
+        response = self.client.post(self._url('bulk_complete'))
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_bulk_complete_refreshes_first_page(self) -> None:
+        """Test that completing all tasks re-renders only the first page."""
+        Task.objects.using(self.shard).bulk_create(
+            Task(
+                text=f'More task {i}', project=self.project,
+                owner=self.user, priority=10 + i
+            )
+            for i in range(DEFAULT_TASKS_PER_PAGE)
+        )
+
+        response = self.client.post(self._url('bulk_complete'))
+
+        content = response.content.decode()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            f'id="tasks-container-{self.project.id}" '
+            'hx-swap-oob="innerHTML"',
+            content
+        )
+        self.assertEqual(
+            content.count('id="task-row-'), DEFAULT_TASKS_PER_PAGE
+        )
+        self.assertIn('Load more tasks', content)
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(
+                project=self.project, completed=False
+            ).exists()
+        )
+
+    def test_bulk_clear_completed(self) -> None:
+        """Test that clearing completed tasks reloads the remaining rows."""
+        Task.objects.using(self.shard).filter(
+            pk=self.tasks[0].pk
+        ).update(completed=True)
+
+        response = self.client.post(self._url('bulk_clear_completed'))
+
+        content = response.content.decode()
+        self.assertNotIn(f'id="task-row-{self.tasks[0].id}"', content)
+        self.assertEqual(content.count('id="task-row-'), 4)
+        self.assertEqual(Task.objects.using(self.shard).filter(
+            project=self.project
+        ).count(), 4)
+
+    def test_bulk_delete_selected(self) -> None:
+        """Test deleting a selection of tasks."""
+        selected = [self.tasks[1].id, self.tasks[3].id]
+
+        response = self.client.post(
+            self._url('bulk_delete'), {'task_ids': selected}
+        )
+
+        self.assertEqual(
+            response.content.decode().count('hx-swap-oob="delete"'), 2
+        )
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(pk__in=selected).exists()
+        )
+
+    def test_bulk_delete_requires_selection(self) -> None:
+        """Test that an empty or invalid selection is rejected."""
+        self.assertEqual(
+            self.client.post(self._url('bulk_delete')).status_code, 400
+        )
+        self.assertEqual(
+            self.client.post(
+                self._url('bulk_delete'), {'task_ids': ['x']}
+            ).status_code,
+            400
+        )
+
+    def test_bulk_move_selected(self) -> None:
+        """Test moving tasks removes them here and appends them there."""
+        target = Project.objects.create(title='Target', owner=self.user)
+
+        response = self.client.post(self._url('bulk_move'), {
+            'task_ids': [self.tasks[0].id],
+            'target_project': target.id,
+        })
+
+        self.assertContains(
+            response, f'hx-swap-oob="beforeend:#tasks-container-{target.id}"'
+        )
+        self.assertEqual(
+            Task.objects.using(self.shard).get(
+                pk=self.tasks[0].pk
+            ).project_id, target.id
+        )
+
+    def test_bulk_views_are_owner_scoped(self) -> None:
+        """Test that another user's project cannot be changed in bulk."""
+        self.client.force_login(self.other_user)
+
+        response = self.client.post(self._url('bulk_complete'))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(
+                project=self.project, completed=True
+            ).exists()
+        )
+
+
+class TaskOwnedObjectViewsTest(OwnerShardTestMixin, TestCase):
+    """Test cases for the single owner-scoped lookup of task views."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        self.user: User = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user: User = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.keep_on_shard(self.user, self.other_user)
+        self.project: Project = Project.objects.create(
+            title='Test Project',
+            owner=self.user
+        )
+        self.task: Task = Task.objects.create(
+            text='Test task', project=self.project, priority=1
+        )
+        self.client.force_login(self.user)
+
+    def _task_loads(self, ctx: CaptureQueriesContext) -> int:
+        """Count the queries that loaded task rows."""
+        return sum(
+            q['sql'].startswith('SELECT "tasks"."id"')
+            for q in ctx.captured_queries
+        )
+
+    def test_update_loads_task_once(self) -> None:
+        """Test that updating a task reads it a single time."""
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            response = self.client.post(
+                reverse('tasks:update', kwargs={'pk': self.task.pk}),
+                {'text': 'Updated task'}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._task_loads(ctx), 1)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.text, 'Updated task')
+
+    def test_invalid_update_loads_task_once(self) -> None:
+        """Test that re-rendering an invalid form reuses the loaded task."""
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            response = self.client.post(
+                reverse('tasks:update', kwargs={'pk': self.task.pk}),
+                {'text': ''}
+            )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self._task_loads(ctx), 1)
+
+    def test_delete_loads_task_once(self) -> None:
+        """Test that deleting a task reads it a single time."""
+        with CaptureQueriesContext(self.shard_connection) as ctx:
+            response = self.client.post(
+                reverse('tasks:delete', kwargs={'pk': self.task.pk})
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._task_loads(ctx), 1)
+        self.assertFalse(
+            Task.objects.using(self.shard).filter(pk=self.task.pk).exists()
+        )
+
+    def test_views_are_owner_scoped(self) -> None:
+        """Test that another user's task is not found."""
+        self.client.force_login(self.other_user)
+
+        response = self.client.post(
+            reverse('tasks:delete', kwargs={'pk': self.task.pk})
+        )
+
         self.assertEqual(response.status_code, 404)
+        self.assertTrue(
+            Task.objects.using(self.shard).filter(pk=self.task.pk).exists()
+        )